@@ -9,3 +9,4 @@ EMAIL_TAKEN = "EMAIL_TAKEN"
 INVALID_TOKEN = "INVALID_TOKEN"
 EXPIRED_TOKEN = "EXPIRED_TOKEN"
 UNAUTHORIZED = "UNAUTHORIZED"
+INVALID_CURSOR = "INVALID_CURSOR"
@@ -1,15 +1,22 @@
 from fastapi import APIRouter, Depends, Query
-from typing import Optional
+from typing import Optional, Union
 from app.models.list import (
     WordListCategory,
     WordListCategoryCreate,
     WordList,
     WordListBrief,
     WordListCreate,
+    ListImportResult,
 )
 from app.services.words import WordNotFoundError
-from app.models.base import Response, PaginatedPayload
-from app.api.errors import DUPLICATE_INSERTION, SERVER_ERROR, NOT_FOUND
+from app.models.base import Response, PaginatedPayload, CursorPaginatedPayload
+from app.api.errors import (
+    DUPLICATE_INSERTION,
+    SERVER_ERROR,
+    NOT_FOUND,
+    INVALID_CURSOR,
+)
+from app.utils.pagination import InvalidCursorError
 from app.services.lists import (
     ListService,
     get_list_service,
@@ -101,20 +108,34 @@ async def get_category_by_id(
 
 @router.get(
     "/by-category/{category_id}",
-    response_model=Response[PaginatedPayload[WordListBrief]],
+    response_model=Response[
+        Union[PaginatedPayload[WordListBrief], CursorPaginatedPayload[WordListBrief]]
+    ],
 )
 async def get_lists_in_category(
     category_id: int,
     list_service: ListService = Depends(get_list_service),
     page: int = Query(1, ge=1, description="Page number to retrieve"),
     per_page: int = Query(10, ge=1, le=100, description="Number of items per page"),
-) -> Response[PaginatedPayload[WordListBrief]]:
+    cursor: Optional[str] = Query(
+        None,
+        description="Keyset cursor from the previous page; pass it empty to "
+        "start cursor pagination instead of page numbers",
+    ),
+) -> Response[
+    Union[PaginatedPayload[WordListBrief], CursorPaginatedPayload[WordListBrief]]
+]:
     """Retrieve a paginated list of word lists belonging to a specific category."""
     try:
         await list_service.get_category_by_id(category_id)
-        paginated_lists = await list_service.get_lists_by_category(
-            category_id=category_id, page=page, per_page=per_page
-        )
+        if cursor is not None:
+            paginated_lists = await list_service.get_lists_by_category_after(
+                category_id=category_id, cursor=cursor, per_page=per_page
+            )
+        else:
+            paginated_lists = await list_service.get_lists_by_category(
+                category_id=category_id, page=page, per_page=per_page
+            )
         return Response(
             success=True,
             message="Lists retrieved successfully",
@@ -124,6 +145,8 @@ async def get_lists_in_category(
         return Response(
             success=False, message="Category not found", error_code=NOT_FOUND
         )
+    except InvalidCursorError as e:
+        return Response(success=False, message=str(e), error_code=INVALID_CURSOR)
     except Exception as e:
         print(f"API error getting lists for category {category_id} (page {page}): {e}")
         return Response(
@@ -155,6 +178,28 @@ async def insert_list(
         )
 
 
+@router.post("/import", response_model=Response[ListImportResult])
+async def import_list(
+    list_data: WordListCreate,
+    list_service: ListService = Depends(get_list_service),
+) -> Response[ListImportResult]:
+    """Create a word list with all of its words and quizzes in one transaction."""
+    try:
+        result = await list_service.import_list(list_data)
+        return Response(
+            success=True, message="List imported successfully", payload=result
+        )
+    except ListAlreadyExistsError as e:
+        return Response(success=False, message=str(e), error_code=DUPLICATE_INSERTION)
+    except Exception as e:
+        print(f"API error importing list: {e}")
+        return Response(
+            success=False,
+            message="An unexpected error occurred",
+            error_code=SERVER_ERROR,
+        )
+
+
 @router.get("/{list_id}", response_model=Response[WordList])
 async def get_list_by_id(
     list_id: int,
@@ -1,78 +1,76 @@
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from openai import OpenAI
-from app.config.env import env
-import os
-from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from app.models.llm import (
+    SentenceCheckRequest,
+    SentenceCheckResponse,
+    SentenceCheckBatchRequest,
+    SentenceCheckBatchResponse,
+    LLMBusyError,
+    LLMTimeoutError,
+)
+from app.services.llm import LLMService, get_llm_service
 import json
 
 router = APIRouter()
-client = OpenAI(api_key=env.openai_api_key)
 
 
-class SentenceCheckRequest(BaseModel):
-    word: str
-    sentence: str
-
-
-class SentenceCheckResponse(BaseModel):
-    isCorrect: bool
-    correctUsage: Optional[str]
-    message: str
-
-
-def clean_json_response(json_string: str):
+@router.post("/check-sentence", response_model=SentenceCheckResponse)
+async def check_sentence(
+    request: SentenceCheckRequest,
+    llm_service: LLMService = Depends(get_llm_service),
+):
     try:
-        return json.loads(json_string)
-    except:
-        # Clean up common JSON formatting issues
-        cleaned = json_string.replace("\\n", "\n")
-        cleaned = cleaned.replace('\\"', '"')
-        cleaned = cleaned.replace("\\", "")
-        return json.loads(cleaned)
+        return await llm_service.check_sentence(request)
+    except LLMBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except LLMTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/check-sentence", response_model=SentenceCheckResponse)
-async def check_sentence(request: SentenceCheckRequest):
+@router.post("/check-sentences", response_model=SentenceCheckBatchResponse)
+async def check_sentences(
+    batch: SentenceCheckBatchRequest,
+    llm_service: LLMService = Depends(get_llm_service),
+):
     try:
-        response = client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": """You are a helpful assistant designed to output JSON.
-                    Make sure your response does not include any extra characters.
-                    The response should easily parse to JSON.
+        return await llm_service.check_sentences(batch)
+    except LLMBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except LLMTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-                    You are part of a word learning app. You will be given a word below,
-                    and a sentence using that word. You determine the correct usage of the word in the
-                    sentence provided.
 
-                    The JSON response format should be this type declaration:
+def sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
 
-                    {
-                      "isCorrect": boolean;
-                      "correctUsage": string;
-                      "message": string;
-                    }
 
-                    The message field should include a general message about the user's usage even if it was correct.
-                    """,
-                },
-                {
-                    "role": "user",
-                    "content": f"""
-                    Current Word: {request.word}
-                    Current Sentence: {request.sentence}
-                    """,
-                },
-            ],
-            model="gpt-4o",
-            response_format={"type": "json_object"},
-            max_tokens=150,
-        )
+@router.post("/check-sentence/stream")
+async def stream_check_sentence(
+    request: SentenceCheckRequest,
+    llm_service: LLMService = Depends(get_llm_service),
+):
+    """Server-sent events variant of /check-sentence: a "verdict" event with
+    isCorrect, an "explanation" event with correctUsage and message, then
+    "done". Failures arrive as an "error" event with the matching status."""
 
-        json_response = clean_json_response(response.choices[0].message.content)
-        return json_response
+    async def events():
+        try:
+            async for event, data in llm_service.stream_sentence_check(request):
+                yield sse_event(event, data)
+        except LLMBusyError as e:
+            yield sse_event("error", {"status": 503, "detail": str(e)})
+        except LLMTimeoutError as e:
+            yield sse_event("error", {"status": 504, "detail": str(e)})
+        except Exception as e:
+            yield sse_event("error", {"status": 500, "detail": str(e)})
+        yield sse_event("done", {})
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,57 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from typing import Any, Dict, Optional
+from app.config.env import env
+from app.models.base import Response
+from app.middleware.auth import token_cache
+from app.services.identity import identity_cache
+from app.services.sentence_cache import sentence_check_cache
+from app.services.llm import sentence_check_flight
+from app.services.sentence_precheck import sentence_precheck
+from app.services.leaderboard_ranks import leaderboard_ranks
+from app.services.write_behind import write_behind
+from app.services.events import event_log, event_aggregator
+import hmac
+
+router = APIRouter()
+
+security = HTTPBearer(auto_error=False)
+
+
+async def require_metrics_token(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+) -> None:
+    # Counters expose cache sizes and traffic patterns, so they are only
+    # served to operators holding METRICS_TOKEN
+    if not env.metrics_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if credentials is None or not hmac.compare_digest(
+        credentials.credentials.encode(), env.metrics_token.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token"
+        )
+
+
+@router.get(
+    "/",
+    response_model=Response[Dict[str, Any]],
+    dependencies=[Depends(require_metrics_token)],
+)
+async def get_metrics() -> Response[Dict[str, Any]]:
+    """In-process counters of the worker that served the request."""
+    return Response(
+        success=True,
+        message="Metrics retrieved successfully",
+        payload={
+            "identity_cache": identity_cache.stats(),
+            "token_cache": token_cache.stats(),
+            "sentence_check_cache": sentence_check_cache.stats(),
+            "sentence_check_flight": sentence_check_flight.stats(),
+            "sentence_precheck": sentence_precheck.stats(),
+            "leaderboard_ranks": leaderboard_ranks.stats(),
+            "write_behind": write_behind.stats(),
+            "event_log": event_log.stats(),
+            "event_aggregator": event_aggregator.stats(),
+        },
+    )
@@ -6,6 +6,7 @@ from app.models.quiz import (
 )
 from app.models.base import Response
 from app.models.user import User
+from app.models.word import WordNotFoundError
 from app.api.errors import SERVER_ERROR, UNAUTHORIZED, NOT_FOUND
 from app.services.quizzes import (
     get_quiz_service,
@@ -48,6 +49,8 @@ async def create_quiz(
         return Response(
             success=True, message="Quiz created successfully", payload=new_quiz
         )
+    except WordNotFoundError as e:
+        return Response(success=False, message=str(e), error_code=NOT_FOUND)
     except Exception as e:
         return Response(success=False, message=str(e), error_code=SERVER_ERROR)
 
@@ -5,6 +5,7 @@ from app.api.words import router as words_routes
 from app.api.quizzes import router as quizzes_routes
 from app.api.llm import router as llm_routes
 from app.api.webhooks.clerk import router as clerk_webhooks_routes
+from app.api.metrics import router as metrics_routes
 
 api_router = APIRouter()
 
@@ -14,3 +15,4 @@ api_router.include_router(words_routes, prefix="/words", tags=["Words"])
 api_router.include_router(quizzes_routes, prefix="/quizzes", tags=["Quizzes"])
 api_router.include_router(llm_routes, prefix="/llm", tags=["LLM"])
 api_router.include_router(clerk_webhooks_routes, prefix="/webhooks", tags=["Webhooks"])
+api_router.include_router(metrics_routes, prefix="/metrics", tags=["Metrics"])
@@ -1,13 +1,15 @@
 from fastapi import APIRouter, Depends, Query
-from typing import List, Optional
+from typing import List, Optional, Union
 from app.middleware.auth import get_current_user
 from app.models.list import WordList
 from app.models.user import (
     User,
     UserListCreate,
+    UserListsBulkCreate,
     UserList,
     WordProgress,
     WordProgressUpdate,
+    WordProgressBatchUpdate,
     UserStatsUpdate,
     UserStats,
     FullUserStats,
@@ -15,9 +17,15 @@ from app.models.user import (
     UserListUpdate,
     UserListsQueryParams,
     TopFiveUsers,
+    LeaderboardEntry,
+    LeaderboardStanding,
+    WindowedLeaderboardEntry,
+    UserNotRankedError,
 )
 from app.models.word import Word
-from app.models.base import Response, PaginatedPayload
+from app.models.base import Response, PaginatedPayload, CursorPaginatedPayload
+from app.utils.pagination import InvalidCursorError
+from app.services.leaderboard import LeaderboardService, get_leaderboard_service
 from app.services.users import (
     get_user_service,
     UserService,
@@ -27,6 +35,7 @@ from app.api.errors import (
     USER_NOT_FOUND,
     SERVER_ERROR,
     DUPLICATE_INSERTION,
+    INVALID_CURSOR,
 )
 
 
@@ -92,6 +101,40 @@ async def create_user_list(
         )
 
 
+@router.post("/lists/bulk")
+async def create_user_lists(
+    user_lists_data: UserListsBulkCreate,
+    user_service: UserService = Depends(get_user_service),
+    current_user: Optional[User] = Depends(get_current_user),
+) -> Response[List[UserList]]:
+    try:
+        if current_user is None:
+            return Response(
+                success=False,
+                message="Authentication required",
+                error_code=SERVER_ERROR,
+            )
+
+        user_lists = await user_service.create_user_lists(
+            current_user.id, user_lists_data.list_ids
+        )
+        return Response(
+            success=True,
+            message="User lists created successfully",
+            payload=user_lists,
+        )
+    except Exception as e:
+        print(f"Error during bulk user list creation: {e}")
+        import traceback
+
+        print(traceback.format_exc())
+        return Response(
+            success=False,
+            message="Could not create user lists due to an internal error",
+            error_code=SERVER_ERROR,
+        )
+
+
 @router.delete("/lists/{list_id}")
 async def remove_list_from_user_lists(
     list_id: int,
@@ -230,13 +273,60 @@ async def update_word_progress(
         )
 
 
+@router.put("/progress/words")
+async def update_word_progress_batch(
+    batch: WordProgressBatchUpdate,
+    user_service: UserService = Depends(get_user_service),
+    current_user: Optional[User] = Depends(get_current_user),
+) -> Response[List[WordProgress]]:
+    """
+    Submit every answer of a practice session in one request. The session's
+    practice time, when given, is recorded in the same transaction.
+    """
+    try:
+        if current_user is None:
+            return Response(
+                success=False,
+                message="Authentication required",
+                error_code=SERVER_ERROR,
+            )
+
+        updated_progress = await user_service.update_word_progress_batch(
+            current_user.id, batch
+        )
+
+        return Response(
+            success=True,
+            message="Word progress updated successfully",
+            payload=updated_progress,
+        )
+    except Exception as e:
+        print(f"Error updating word progress batch: {e}")
+        import traceback
+
+        print(traceback.format_exc())
+        return Response(
+            success=False,
+            message="Could not update word progress due to an internal error",
+            error_code=SERVER_ERROR,
+        )
+
+
 @router.get("/progress/words")
 async def get_word_progress(
     page: int = Query(1, ge=1, description="Page number to retrieve"),
     per_page: int = Query(10, ge=1, le=100, description="Number of items per page"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Keyset cursor from the previous page; pass it empty to "
+        "start cursor pagination instead of page numbers",
+    ),
+    include_total: bool = Query(
+        False, description="Count all of the user's words (cursor pagination only)"
+    ),
     user_service: UserService = Depends(get_user_service),
     current_user: Optional[User] = Depends(get_current_user),
-) -> Response[PaginatedPayload[Word]]:
+) -> Response[Union[PaginatedPayload[Word], CursorPaginatedPayload[Word]]]:
     try:
         if current_user is None:
             return Response(
@@ -245,15 +335,25 @@ async def get_word_progress(
                 error_code=SERVER_ERROR,
             )
 
-        paginated_progress = await user_service.get_word_progress(
-            current_user.id, page=page, per_page=per_page
-        )
+        if cursor is not None:
+            paginated_progress = await user_service.get_word_progress_after(
+                current_user.id,
+                cursor=cursor,
+                per_page=per_page,
+                include_total=include_total,
+            )
+        else:
+            paginated_progress = await user_service.get_word_progress(
+                current_user.id, page=page, per_page=per_page
+            )
 
         return Response(
             success=True,
             message="Word progress retrieved successfully",
             payload=paginated_progress,
         )
+    except InvalidCursorError as e:
+        return Response(success=False, message=str(e), error_code=INVALID_CURSOR)
     except Exception as e:
         print(f"Error retrieving word progress: {e}")
         import traceback
@@ -432,3 +532,107 @@ async def get_top_five_users(
             message="Could not retrieve top five users due to an internal error",
             error_code=SERVER_ERROR,
         )
+
+
+@router.get("/leaderboard")
+async def get_leaderboard(
+    limit: int = Query(10, ge=1, le=100, description="Number of users to return"),
+    leaderboard_service: LeaderboardService = Depends(get_leaderboard_service),
+) -> Response[List[LeaderboardEntry]]:
+    try:
+        entries = await leaderboard_service.get_top(limit)
+        return Response(
+            success=True,
+            message="Leaderboard retrieved successfully",
+            payload=entries,
+        )
+    except Exception as e:
+        print(f"Error retrieving leaderboard: {e}")
+        return Response(
+            success=False,
+            message="Could not retrieve leaderboard due to an internal error",
+            error_code=SERVER_ERROR,
+        )
+
+
+@router.get("/leaderboard/me")
+async def get_leaderboard_standing(
+    radius: int = Query(
+        5, ge=0, le=50, description="Number of users to include above and below"
+    ),
+    current_user: Optional[User] = Depends(get_current_user),
+    leaderboard_service: LeaderboardService = Depends(get_leaderboard_service),
+) -> Response[LeaderboardStanding]:
+    """The signed-in user's rank and the users ranked around them."""
+    try:
+        if current_user is None:
+            return Response(
+                success=False,
+                message="Authentication required",
+                error_code=SERVER_ERROR,
+            )
+
+        standing = await leaderboard_service.get_standing(current_user.id, radius)
+        return Response(
+            success=True,
+            message="Leaderboard standing retrieved successfully",
+            payload=standing,
+        )
+    except UserNotRankedError as e:
+        return Response(
+            success=False,
+            message=str(e),
+            error_code=USER_NOT_FOUND,
+        )
+    except Exception as e:
+        print(f"Error retrieving leaderboard standing: {e}")
+        return Response(
+            success=False,
+            message="Could not retrieve leaderboard standing due to an internal error",
+            error_code=SERVER_ERROR,
+        )
+
+
+@router.get("/leaderboard/daily")
+async def get_daily_leaderboard(
+    limit: int = Query(10, ge=1, le=100, description="Number of users to return"),
+    leaderboard_service: LeaderboardService = Depends(get_leaderboard_service),
+) -> Response[List[WindowedLeaderboardEntry]]:
+    """Most active users today (UTC)."""
+    return await _get_windowed_leaderboard("daily", limit, leaderboard_service)
+
+
+@router.get("/leaderboard/weekly")
+async def get_weekly_leaderboard(
+    limit: int = Query(10, ge=1, le=100, description="Number of users to return"),
+    leaderboard_service: LeaderboardService = Depends(get_leaderboard_service),
+) -> Response[List[WindowedLeaderboardEntry]]:
+    """Most active users over the last seven days (UTC)."""
+    return await _get_windowed_leaderboard("weekly", limit, leaderboard_service)
+
+
+@router.get("/leaderboard/all-time")
+async def get_all_time_leaderboard(
+    limit: int = Query(10, ge=1, le=100, description="Number of users to return"),
+    leaderboard_service: LeaderboardService = Depends(get_leaderboard_service),
+) -> Response[List[LeaderboardEntry]]:
+    return await get_leaderboard(limit, leaderboard_service)
+
+
+async def _get_windowed_leaderboard(
+    window: str, limit: int, leaderboard_service: LeaderboardService
+) -> Response[List[WindowedLeaderboardEntry]]:
+    try:
+        entries = await leaderboard_service.get_window(window, limit)
+        return Response(
+            success=True,
+            message=f"{window.capitalize()} leaderboard retrieved successfully",
+            payload=entries,
+        )
+    except Exception as e:
+        print(f"Error retrieving {window} leaderboard: {e}")
+        return Response(
+            success=False,
+            message=f"Could not retrieve {window} leaderboard due to an internal error",
+            error_code=SERVER_ERROR,
+        )
@@ -0,0 +1,63 @@
+"""Fold learning events into the summary tables.
+
+Runs the same aggregation worker the app starts with
+EVENT_AGGREGATOR_ENABLED, as a separate process.
+
+    python -m app.cli.aggregate_events [--once]
+    python -m app.cli.aggregate_events --replay [--from-id N]
+"""
+
+import argparse
+import asyncio
+
+from app.config.db import create_pool, close_pool
+from app.services.events import event_aggregator
+
+
+async def aggregate(once: bool, replay: bool, from_id: int) -> None:
+    pool = await create_pool()
+    try:
+        if replay:
+            await event_aggregator.replay(pool, from_id)
+            print(f"Rewound '{event_aggregator.consumer}' to event {from_id}")
+
+        if not once:
+            await event_aggregator.run(pool)
+            return
+
+        # Drain the backlog and exit
+        while True:
+            folded = await event_aggregator.run_once(pool)
+            if folded:
+                print(f"Processed {folded} events")
+            if folded < event_aggregator.batch_size:
+                break
+    finally:
+        await close_pool()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Fold learning events into word progress, stats and rollups"
+    )
+    parser.add_argument(
+        "--once", action="store_true", help="Fold the current backlog and exit"
+    )
+    parser.add_argument(
+        "--replay",
+        action="store_true",
+        help="Rewind the consumer before folding, to recompute summary tables",
+    )
+    parser.add_argument(
+        "--from-id",
+        type=int,
+        default=0,
+        help="Event id to rewind to with --replay (default: the start of the log)",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(aggregate(args.once, args.replay, args.from_id))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Backfill the daily_activity rollup from existing progress and sessions.
+
+Each word_progress row counts as one word practiced on the local day it was
+last updated, and practice sessions are summed per local day. Rows that the
+app has already been maintaining keep the larger of the two values, so the
+command is safe to re-run.
+
+    python -m app.cli.backfill_daily_activity [--days N]
+"""
+
+import argparse
+import asyncio
+from typing import Optional
+
+from app.config.db import create_pool, close_pool
+
+
+BACKFILL_QUERY = """
+    WITH tz AS (
+        SELECT u.id AS user_id, COALESCE(p.time_zone, 'UTC') AS name
+        FROM users u
+        LEFT JOIN user_preferences p ON p.user_id = u.id
+    ),
+    words AS (
+        SELECT
+            wp.user_id,
+            (wp.updated_at AT TIME ZONE 'UTC' AT TIME ZONE tz.name)::date AS local_date,
+            COUNT(*) AS words_practiced
+        FROM word_progress wp
+        JOIN tz ON tz.user_id = wp.user_id
+        WHERE wp.practice_count > 0
+          AND ($1::int IS NULL OR wp.updated_at >= CURRENT_TIMESTAMP - make_interval(days => $1))
+        GROUP BY 1, 2
+    ),
+    sessions AS (
+        SELECT
+            s.user_id,
+            (s.created_at AT TIME ZONE 'UTC' AT TIME ZONE tz.name)::date AS local_date,
+            SUM(s.practice_time) AS practice_time
+        FROM user_practice_sessions s
+        JOIN tz ON tz.user_id = s.user_id
+        WHERE $1::int IS NULL OR s.created_at >= CURRENT_TIMESTAMP - make_interval(days => $1)
+        GROUP BY 1, 2
+    )
+    INSERT INTO daily_activity (user_id, local_date, words_practiced, practice_time)
+    SELECT
+        COALESCE(w.user_id, s.user_id),
+        COALESCE(w.local_date, s.local_date),
+        COALESCE(w.words_practiced, 0),
+        COALESCE(s.practice_time, 0)
+    FROM words w
+    FULL JOIN sessions s
+        ON s.user_id = w.user_id AND s.local_date = w.local_date
+    ON CONFLICT (user_id, local_date) DO UPDATE
+    SET words_practiced = GREATEST(daily_activity.words_practiced, EXCLUDED.words_practiced),
+        practice_time = GREATEST(daily_activity.practice_time, EXCLUDED.practice_time),
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+
+async def backfill(days: Optional[int]) -> str:
+    pool = await create_pool()
+    try:
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                return await conn.execute(BACKFILL_QUERY, days)
+    finally:
+        await close_pool()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Backfill the daily_activity rollup from existing data"
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=None,
+        help="Only backfill activity from the last N days (default: all)",
+    )
+    args = parser.parse_args()
+
+    status = asyncio.run(backfill(args.days))
+    print(f"daily_activity backfill complete: {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Import word lists from JSON files.
+
+Each file holds one list or an array of lists in the same shape the
+POST /api/v1/lists/import endpoint accepts.
+
+    python -m app.cli.import_lists path/to/list.json [more.json ...]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from app.config.db import create_pool, close_pool
+from app.models.list import WordListCreate
+from app.services.lists import ListService
+from app.services.quizzes import QuizService
+from app.services.words import WordService
+
+
+async def import_files(paths: list[str]) -> int:
+    pool = await create_pool()
+    list_service = ListService(
+        pool=pool,
+        word_service=WordService(pool=pool),
+        quiz_service=QuizService(pool),
+    )
+
+    failures = 0
+    try:
+        for path in paths:
+            with open(path, "r") as f:
+                data = json.load(f)
+
+            for item in data if isinstance(data, list) else [data]:
+                name = item.get("name", "<unnamed>")
+                try:
+                    result = await list_service.import_list(WordListCreate(**item))
+                except Exception as e:
+                    failures += 1
+                    print(f"{path}: failed to import '{name}': {e}", file=sys.stderr)
+                    continue
+
+                phases = ", ".join(
+                    f"{phase}={ms}ms" for phase, ms in result.timings.items()
+                )
+                print(
+                    f"{path}: imported '{name}' (id {result.word_list.id}): "
+                    f"{result.words_created} new words, {result.words_reused} reused, "
+                    f"{result.quizzes_created} quizzes [{phases}]"
+                )
+    finally:
+        await close_pool()
+
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import word lists from JSON files")
+    parser.add_argument("paths", nargs="+", help="JSON files to import")
+    args = parser.parse_args()
+
+    failures = asyncio.run(import_files(args.paths))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
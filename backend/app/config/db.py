@@ -2,6 +2,10 @@ from fastapi import FastAPI
 import asyncpg
 from contextlib import asynccontextmanager
 from app.config.env import env
+from app.services.identity import identity_listener
+from app.services.leaderboard_ranks import leaderboard_ranks
+from app.services.write_behind import write_behind
+from app.services.events import event_log, event_aggregator
 
 pool = None
 
@@ -9,7 +13,20 @@ pool = None
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await create_pool()
+    await identity_listener.start()
+    await leaderboard_ranks.start(pool)
+    await write_behind.start(pool)
+    if env.progress_write_mode == "events":
+        await event_log.start(pool)
+    if env.event_aggregator_enabled:
+        await event_aggregator.start(pool)
     yield
+    # Flush buffered writes while the pool is still open
+    await event_aggregator.stop()
+    await event_log.stop()
+    await write_behind.stop()
+    await leaderboard_ranks.stop()
+    await identity_listener.stop()
     await close_pool()
 
 
@@ -7,11 +7,65 @@ class Env(BaseSettings):
     database_url: Optional[str] = Field(default=None, env="DATABASE_URL")
     env: str = Field(default="development", env="ENV")
     openai_api_key: str = Field(default="", env="OPENAI_API_KEY")
+    openai_base_url: Optional[str] = Field(default=None, env="OPENAI_BASE_URL")
+    llm_model: str = Field(default="gpt-4o", env="LLM_MODEL")
+    llm_max_concurrency: int = Field(default=8, env="LLM_MAX_CONCURRENCY")
+    llm_timeout: float = Field(default=20.0, env="LLM_TIMEOUT")
+    llm_queue_timeout: float = Field(default=5.0, env="LLM_QUEUE_TIMEOUT")
+    llm_max_retries: int = Field(default=1, env="LLM_MAX_RETRIES")
+    llm_batch_max_tokens: int = Field(default=1500, env="LLM_BATCH_MAX_TOKENS")
+    sentence_cache_ttl: int = Field(default=2592000, env="SENTENCE_CACHE_TTL")
+    sentence_cache_max_rows: int = Field(
+        default=100000, env="SENTENCE_CACHE_MAX_ROWS"
+    )
+    sentence_cache_memory_size: int = Field(
+        default=5000, env="SENTENCE_CACHE_MEMORY_SIZE"
+    )
     clerk_webhook_secret: Optional[str] = Field(
         default=None, env="CLERK_WEBHOOK_SECRET"
     )
     clerk_jwks_url: Optional[str] = Field(default=None, env="CLERK_JWKS_URL")
     clerk_issuer: Optional[str] = Field(default=None, env="CLERK_ISSUER")
+    clerk_jwks_max_age: int = Field(default=3600, env="CLERK_JWKS_MAX_AGE")
+    auth_token_cache_size: int = Field(default=10000, env="AUTH_TOKEN_CACHE_SIZE")
+    auth_token_cache_ttl: int = Field(default=60, env="AUTH_TOKEN_CACHE_TTL")
+    identity_cache_size: int = Field(default=10000, env="IDENTITY_CACHE_SIZE")
+    identity_cache_ttl: int = Field(default=300, env="IDENTITY_CACHE_TTL")
+    # Bearer token for GET /metrics; the endpoint is disabled while unset
+    metrics_token: Optional[str] = Field(default=None, env="METRICS_TOKEN")
+    leaderboard_bucket_retention_days: int = Field(
+        default=14, env="LEADERBOARD_BUCKET_RETENTION_DAYS"
+    )
+    # "off" writes diamonds and practice sessions through on the request;
+    # "buffered" acknowledges them from memory and flushes them in bulk, so a
+    # crashed worker loses up to one flush interval of them
+    write_behind_mode: str = Field(default="off", env="WRITE_BEHIND_MODE")
+    write_behind_flush_interval: float = Field(
+        default=5.0, env="WRITE_BEHIND_FLUSH_INTERVAL"
+    )
+    write_behind_max_pending: int = Field(
+        default=10000, env="WRITE_BEHIND_MAX_PENDING"
+    )
+    write_behind_max_attempts: int = Field(
+        default=5, env="WRITE_BEHIND_MAX_ATTEMPTS"
+    )
+    # "direct" applies progress, sessions and diamonds on the request;
+    # "events" appends them to learning_events for the aggregation worker
+    progress_write_mode: str = Field(default="direct", env="PROGRESS_WRITE_MODE")
+    event_flush_interval: float = Field(default=1.0, env="EVENT_FLUSH_INTERVAL")
+    event_max_batch: int = Field(default=5000, env="EVENT_MAX_BATCH")
+    event_aggregator_enabled: bool = Field(
+        default=False, env="EVENT_AGGREGATOR_ENABLED"
+    )
+    event_aggregator_interval: float = Field(
+        default=2.0, env="EVENT_AGGREGATOR_INTERVAL"
+    )
+    event_aggregator_batch_size: int = Field(
+        default=5000, env="EVENT_AGGREGATOR_BATCH_SIZE"
+    )
+    event_aggregator_settle_seconds: float = Field(
+        default=10.0, env="EVENT_AGGREGATOR_SETTLE_SECONDS"
+    )
     allowed_hosts: str = Field(default="", env="ALLOWED_HOSTS")
     allowed_origins: str = Field(default="", env="ALLOWED_ORIGINS")
 
@@ -1,11 +1,24 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt, JWTError
+from app.config.env import env
+from app.middleware.jwks import JWKSClient
 from app.services.users import get_user_service, UserService
+from app.utils.cache import TTLCache
+import time
 
 
 security = HTTPBearer()
 
+jwks_client = JWKSClient(env.clerk_jwks_url, max_age=env.clerk_jwks_max_age)
+
+# token -> clerk_id, so repeat requests with the same token skip verification;
+# the user itself comes from the identity cache behind get_user_by_clerk_id.
+# Entries never outlive the token's own expiry.
+token_cache = TTLCache(
+    maxsize=env.auth_token_cache_size, ttl=env.auth_token_cache_ttl
+)
+
 
 class AuthError(Exception):
     pass
@@ -19,6 +32,19 @@ class ExpiredTokenError(AuthError):
     pass
 
 
+async def verify_token(token: str) -> dict:
+    header = jwt.get_unverified_header(token)
+    key = await jwks_client.get_signing_key(header.get("kid"))
+
+    return jwt.decode(
+        token,
+        key=key,
+        algorithms=[key.get("alg", "RS256")],
+        issuer=env.clerk_issuer,
+        options={"verify_aud": False},
+    )
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     user_service: UserService = Depends(get_user_service),
@@ -26,20 +52,19 @@ async def get_current_user(
     try:
         token = credentials.credentials
 
-        payload = jwt.decode(
-            token,
-            key=None,
-            options={
-                "verify_signature": False,
-            },
-        )
-
-        clerk_id = payload.get("sub")
+        clerk_id = token_cache.get(token)
         if clerk_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token: No user identifier found",
-            )
+            payload = await verify_token(token)
+
+            clerk_id = payload.get("sub")
+            if clerk_id is None:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Invalid token: No user identifier found",
+                )
+
+            expires_in = payload.get("exp", 0) - time.time()
+            token_cache.set(token, clerk_id, ttl=expires_in)
 
         user = await user_service.get_user_by_clerk_id(clerk_id)
 
@@ -0,0 +1,92 @@
+from typing import Any, Dict, Optional
+import asyncio
+import logging
+import time
+
+import httpx
+from jose import JWTError
+
+
+logger = logging.getLogger("jwks")
+
+
+class JWKSClient:
+    """Caches the signing keys published at a JWKS endpoint.
+
+    Keys are served from memory. Once the set is older than ``max_age`` it is
+    refreshed in the background while the cached keys keep being used. A token
+    signed with an unknown ``kid`` triggers a refresh, at most once every
+    ``min_refresh_interval`` seconds, so forged key ids cannot hammer the
+    endpoint. While no keys could be fetched at all, refetches are held to
+    the same interval and requests fail fast in between.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str],
+        max_age: float = 3600,
+        min_refresh_interval: float = 30,
+        timeout: float = 5,
+    ):
+        self.url = url
+        self.max_age = max_age
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._fetched_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def get_signing_key(self, kid: Optional[str]) -> Dict[str, Any]:
+        if not self.url:
+            raise JWTError("JWKS URL is not configured")
+
+        if not self._keys:
+            if not self._may_refetch():
+                raise JWTError("Signing keys are unavailable")
+            await self._refresh()
+        elif time.monotonic() - self._fetched_at > self.max_age:
+            self._start_refresh()
+
+        key = self._keys.get(kid)
+        if key is not None:
+            return key
+
+        if self._may_refetch():
+            await self._refresh()
+            key = self._keys.get(kid)
+
+        if key is None:
+            raise JWTError(f"Unknown signing key: {kid}")
+        return key
+
+    def _may_refetch(self) -> bool:
+        return (
+            self._fetched_at is None
+            or time.monotonic() - self._fetched_at >= self.min_refresh_interval
+        )
+
+    def _start_refresh(self) -> asyncio.Task:
+        # Concurrent callers share a single in-flight fetch
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._fetch())
+        return self._refresh_task
+
+    async def _refresh(self) -> None:
+        await asyncio.shield(self._start_refresh())
+
+    async def _fetch(self) -> None:
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.get(self.url)
+                response.raise_for_status()
+                jwks = response.json()
+        except Exception as e:
+            logger.error(f"Error fetching JWKS from {self.url}: {e}")
+            if not self._keys:
+                raise JWTError(f"Could not fetch signing keys: {str(e)}")
+            return
+        finally:
+            # Failed fetches are rate limited like successful ones
+            self._fetched_at = time.monotonic()
+
+        self._keys = {key["kid"]: key for key in jwks.get("keys", []) if "kid" in key}
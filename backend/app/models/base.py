@@ -38,6 +38,22 @@ class PaginatedPayload(CamelModel, Generic[ItemType]):
     page_info: PageInfo = Field(..., description="Pagination details")
 
 
+class CursorPageInfo(CamelModel):
+    per_page: int = Field(..., description="Number of items per page")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor to pass to fetch the next page"
+    )
+    has_next_page: bool = Field(..., description="Whether there is a next page")
+    total_items: Optional[int] = Field(
+        None, description="Total number of items available, when requested"
+    )
+
+
+class CursorPaginatedPayload(CamelModel, Generic[ItemType]):
+    items: List[ItemType] = Field(..., description="List of items on the current page")
+    page_info: CursorPageInfo = Field(..., description="Pagination details")
+
+
 class Response(CamelModel, Generic[T]):
     success: bool
     message: str
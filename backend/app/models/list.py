@@ -1,5 +1,5 @@
 from .base import BaseEntity, CamelModel
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 from app.models.word import Word, WordCreate
 
@@ -14,6 +14,8 @@ class WordList(BaseEntity):
     updated_at: Optional[datetime] = None
     words: Optional[List[Word]] = None
     word_count: Optional[int] = None
+    mastered_count: Optional[int] = None
+    is_completed: Optional[bool] = None
     in_users_bank: Optional[bool] = None
     is_favorite: Optional[bool] = None
 
@@ -71,6 +73,14 @@ class WordListBrief(CamelModel):
     updated_at: Optional[datetime] = None
 
 
+class ListImportResult(CamelModel):
+    word_list: WordList
+    words_created: int
+    words_reused: int
+    quizzes_created: int
+    timings: Dict[str, float]
+
+
 # List Errors
 
 
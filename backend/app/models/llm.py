@@ -0,0 +1,32 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+class SentenceCheckRequest(BaseModel):
+    word: str
+    sentence: str
+
+
+class SentenceCheckResponse(BaseModel):
+    isCorrect: bool
+    correctUsage: Optional[str] = None
+    message: str
+
+
+class SentenceCheckBatchRequest(BaseModel):
+    items: List[SentenceCheckRequest] = Field(..., min_length=1, max_length=50)
+
+
+class SentenceCheckBatchResponse(BaseModel):
+    results: List[SentenceCheckResponse]
+
+
+# LLM Errors
+
+
+class LLMBusyError(Exception):
+    pass
+
+
+class LLMTimeoutError(Exception):
+    pass
@@ -1,5 +1,5 @@
-from pydantic import EmailStr, BaseModel, ConfigDict
-from typing import Optional
+from pydantic import EmailStr, BaseModel, ConfigDict, Field
+from typing import List, Optional
 from datetime import datetime
 from .base import BaseEntity, CamelModel
 
@@ -148,6 +148,10 @@ class UserListCreate(CamelModel):
     list_id: int
 
 
+class UserListsBulkCreate(CamelModel):
+    list_ids: List[int]
+
+
 # User Progress
 
 
@@ -160,6 +164,10 @@ class WordProgress(BaseEntity):
     success_count: int = 0
     last_practiced: Optional[datetime] = None
     number_of_times_to_practice: int = 5
+    repetitions: int = 0
+    interval_days: int = 0
+    ease_factor: float = 2.5
+    next_due_at: Optional[datetime] = None
 
 
 class WordProgressUpdate(CamelModel):
@@ -172,6 +180,14 @@ class WordProgressUpdate(CamelModel):
     number_of_times_to_practice: Optional[int] = None
 
 
+class WordProgressBatchUpdate(CamelModel):
+    updates: List[WordProgressUpdate] = Field(..., min_length=1, max_length=200)
+    practice_time: Optional[int] = Field(
+        None, ge=0, description="Session practice time in minutes"
+    )
+    session_type: str = "quiz"
+
+
 class UserListUpdate(CamelModel):
     is_favorite: Optional[bool] = None
 
@@ -192,6 +208,37 @@ class TopFiveUsers(CamelModel):
     last_active: Optional[datetime] = None
 
 
+class LeaderboardEntry(CamelModel):
+    rank: int
+    id: int
+    username: str
+    profile_picture_url: Optional[str] = None
+    score: float
+    total_words_learned: int
+    total_practice_time: int
+    total_diamonds: int
+    total_streak: int
+    last_active: Optional[datetime] = None
+
+
+class WindowedLeaderboardEntry(CamelModel):
+    rank: int
+    id: int
+    username: str
+    profile_picture_url: Optional[str] = None
+    score: float
+    words_practiced: int
+    practice_time: int
+    active_days: int
+
+
+class LeaderboardStanding(CamelModel):
+    rank: int
+    score: float
+    total_users: int
+    entries: List[LeaderboardEntry]
+
+
 # User Errors
 
 
@@ -207,5 +254,9 @@ class UserListAlreadyExistsError(Exception):
     pass
 
 
+class UserNotRankedError(Exception):
+    pass
+
+
 class UserListNotFoundError(Exception):
     pass
@@ -0,0 +1,105 @@
+"""Daily activity rollups and streak bookkeeping for practice writes.
+
+Like the review schedule in scheduler.py, these are SQL fragments so that the
+statement recording progress can also fold it into daily_activity, the UTC
+leaderboard buckets and the user's streak. Days are calendar days in the time
+zone from user_preferences (UTC when unset); stored timestamps are UTC.
+"""
+
+
+def activity_ctes(
+    user_id: str,
+    words_practiced: str,
+    practice_time: str,
+    now: str = "CURRENT_TIMESTAMP",
+) -> str:
+    """Return the CTEs ``tz``, ``today``, ``activity``, ``daily`` and ``bucket``.
+
+    ``words_practiced`` and ``practice_time`` are SQL integer expressions that
+    may refer to ``today.time_zone`` and ``today.local_date``. ``now`` is the
+    timestamptz the activity happened at; it picks the day and is kept as
+    ``today.reference_time``. The ``daily`` and ``bucket`` CTEs add the counts
+    to the user's rows for that day.
+    """
+    return f"""
+        tz AS (
+            SELECT COALESCE(
+                (SELECT time_zone FROM user_preferences WHERE user_id = {user_id}),
+                'UTC'
+            ) AS name
+        ),
+        today AS (
+            SELECT
+                name AS time_zone,
+                reference_time,
+                (reference_time AT TIME ZONE name)::date AS local_date
+            FROM tz, (SELECT {now} AS reference_time) reference
+        ),
+        activity AS (
+            SELECT
+                today.time_zone,
+                today.reference_time,
+                today.local_date,
+                ({words_practiced})::int AS words_practiced,
+                ({practice_time})::int AS practice_time
+            FROM today
+        ),
+        daily AS (
+            INSERT INTO daily_activity (user_id, local_date, words_practiced, practice_time)
+            SELECT {user_id}, local_date, words_practiced, practice_time
+            FROM activity
+            ON CONFLICT (user_id, local_date) DO UPDATE
+            SET words_practiced = daily_activity.words_practiced + EXCLUDED.words_practiced,
+                practice_time = daily_activity.practice_time + EXCLUDED.practice_time,
+                updated_at = CURRENT_TIMESTAMP
+        ),
+        bucket AS (
+            INSERT INTO leaderboard_buckets (bucket_date, user_id, words_practiced, practice_time)
+            SELECT (reference_time AT TIME ZONE 'UTC')::date, {user_id}, words_practiced, practice_time
+            FROM activity
+            ON CONFLICT (bucket_date, user_id) DO UPDATE
+            SET words_practiced = leaderboard_buckets.words_practiced + EXCLUDED.words_practiced,
+                practice_time = leaderboard_buckets.practice_time + EXCLUDED.practice_time
+        )
+    """
+
+
+def local_date(timestamp: str, time_zone: str = "today.time_zone") -> str:
+    """SQL for the calendar day of a UTC ``timestamp`` in ``time_zone``."""
+    return f"(({timestamp}) AT TIME ZONE 'UTC' AT TIME ZONE {time_zone})::date"
+
+
+def streak_cte(user_id: str) -> str:
+    """Return the CTE ``streak`` that counts the activity's day towards the
+    user's streak.
+
+    Requires the ``today`` CTE from ``activity_ctes``. The streak grows when the
+    last counted day was yesterday, is kept when it was today (or later, for
+    activity folded in late) and restarts at one otherwise. Returns no row
+    when the user has no stats yet.
+    """
+    last_day = local_date("user_stats.last_streak_updated_at")
+    new_streak = f"""
+        CASE
+            WHEN user_stats.current_streak = 0
+              OR user_stats.last_streak_updated_at IS NULL THEN 1
+            WHEN {last_day} >= today.local_date THEN user_stats.current_streak
+            WHEN {last_day} = today.local_date - 1 THEN user_stats.current_streak + 1
+            ELSE 1
+        END
+    """
+    return f"""
+        streak AS (
+            UPDATE user_stats
+            SET current_streak = {new_streak},
+                longest_streak = GREATEST(user_stats.longest_streak, {new_streak}),
+                last_streak_updated_at = GREATEST(
+                    user_stats.last_streak_updated_at,
+                    today.reference_time AT TIME ZONE 'UTC'
+                ),
+                updated_at = CURRENT_TIMESTAMP AT TIME ZONE 'UTC'
+            FROM today
+            WHERE user_stats.user_id = {user_id}
+            RETURNING user_stats.user_id
+        )
+    """
@@ -0,0 +1,393 @@
+from app.config.env import env
+from app.models.user import WordProgressUpdate
+from app.services.activity import local_date
+from app.services.progress import apply_word_progress
+from app.services.write_behind import FLUSH_QUERY
+from typing import Any, Dict, List, Optional, Set, Tuple
+from datetime import date, datetime, timezone
+import asyncio
+import json
+import logging
+import time
+
+import asyncpg
+
+
+logger = logging.getLogger("events")
+
+PROGRESS_WRITE_MODES = ("direct", "events")
+
+EVENT_COLUMNS = ("user_id", "event_type", "word_id", "payload", "occurred_at")
+
+ANSWER = "answer"
+PRACTICE_SESSION = "practice_session"
+DIAMONDS = "diamonds"
+
+DEFAULT_CONSUMER = "summary_tables"
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def next_month(day: date) -> date:
+    return date(day.year + day.month // 12, day.month % 12 + 1, 1)
+
+
+class EventLog:
+    """Buffers learning events and appends them to learning_events with COPY.
+
+    Events are acknowledged once queued and written every ``flush_interval``
+    seconds, when ``max_batch`` are queued, and at shutdown. Like the
+    write-behind buffer, a crashed worker loses events not yet flushed. The
+    monthly partition for an event is created the first time it is needed.
+    """
+
+    def __init__(self, flush_interval: float, max_batch: int):
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._pool: Optional[asyncpg.Pool] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self._events: List[Tuple[int, str, Optional[int], str, datetime]] = []
+        self._partitions: Set[date] = set()
+        self.appended = 0
+        self.flushes = 0
+        self.flush_failures = 0
+        self.last_flush_ms = 0.0
+
+    async def append(
+        self,
+        user_id: int,
+        event_type: str,
+        payload: Dict[str, Any],
+        word_id: Optional[int] = None,
+    ) -> None:
+        occurred_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        self._events.append(
+            (user_id, event_type, word_id, json.dumps(payload), occurred_at)
+        )
+        self.appended += 1
+        if len(self._events) >= self.max_batch:
+            await self.flush()
+
+    async def append_answers(
+        self, user_id: int, updates: List[WordProgressUpdate]
+    ) -> None:
+        for update in updates:
+            payload = update.model_dump(
+                exclude={"word_id", "last_practiced"}, exclude_none=True
+            )
+            await self.append(user_id, ANSWER, payload, word_id=update.word_id)
+
+    async def start(self, pool: asyncpg.Pool) -> None:
+        self._pool = pool
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._pool is not None:
+            await self.flush()
+            if self._events:
+                logger.error(f"Dropping {len(self._events)} unflushed learning events")
+            self._pool = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if self._pool is None or not self._events:
+                return
+
+            events, self._events = self._events, []
+            started = time.perf_counter()
+            try:
+                async with self._pool.acquire() as conn:
+                    for month in {month_start(event[4].date()) for event in events}:
+                        await self._ensure_partition(conn, month)
+                    await conn.copy_records_to_table(
+                        "learning_events", records=events, columns=EVENT_COLUMNS
+                    )
+            except Exception as e:
+                logger.error(f"Error writing learning events: {e}")
+                self.flush_failures += 1
+                self._events[:0] = events
+                return
+
+            self.flushes += 1
+            self.last_flush_ms = (time.perf_counter() - started) * 1000
+
+    async def _ensure_partition(self, conn: asyncpg.Connection, month: date) -> None:
+        if month in self._partitions:
+            return
+        name = f"learning_events_{month:%Y%m}"
+        query = f"""
+            CREATE TABLE IF NOT EXISTS {name}
+            PARTITION OF learning_events
+            FOR VALUES FROM ('{month.isoformat()}') TO ('{next_month(month).isoformat()}')
+        """
+        try:
+            await conn.execute(query)
+        except asyncpg.DuplicateTableError:
+            # Another worker created it between our check and create
+            pass
+        self._partitions.add(month)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._events),
+            "appended": self.appended,
+            "flushes": self.flushes,
+            "flush_failures": self.flush_failures,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+        }
+
+
+class EventAggregator:
+    """Folds learning events into word_progress, user_stats and the rollups.
+
+    Events are read in id order after a consumer offset stored in
+    learning_event_offsets; the offset row is locked for the batch, so any
+    number of app workers or CLI runs can aggregate without double-folding.
+    Only events recorded more than ``settle_seconds`` ago are read, so that
+    COPY batches still committing are not skipped past.
+
+    Answers repeat absolute progress values and are re-applied in order, so
+    several answers to one word in a batch each advance its review schedule.
+    They are applied as of the time they occurred, which sets the review
+    schedule, the day's activity and the streak. Practice sessions and
+    diamonds are increments and are folded with the same statement the
+    write-behind buffer flushes with.
+
+    Events that cannot be folded (the user or word was deleted, or the
+    payload is malformed) are skipped and counted by reason, so they cannot
+    hold the offset back.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        interval: float,
+        settle_seconds: float,
+        consumer: str = DEFAULT_CONSUMER,
+    ):
+        self.batch_size = batch_size
+        self.interval = interval
+        self.settle_seconds = settle_seconds
+        self.consumer = consumer
+        self._task: Optional[asyncio.Task] = None
+        self.folded = 0
+        self.batches = 0
+        self.failures = 0
+        self.skipped: Dict[str, int] = {}
+        self.last_batch_ms = 0.0
+
+    async def run_once(self, pool: asyncpg.Pool) -> int:
+        offset_query = """
+            INSERT INTO learning_event_offsets (consumer) VALUES ($1)
+            ON CONFLICT (consumer) DO NOTHING
+        """
+        lock_query = """
+            SELECT last_event_id FROM learning_event_offsets
+            WHERE consumer = $1
+            FOR UPDATE
+        """
+        events_query = f"""
+            SELECT
+                e.id, e.user_id, e.event_type, e.word_id, e.payload, e.occurred_at,
+                u.id IS NOT NULL AS user_exists,
+                e.word_id IS NULL OR w.id IS NOT NULL AS word_exists,
+                {local_date("e.occurred_at", "COALESCE(p.time_zone, 'UTC')")} AS local_date
+            FROM learning_events e
+            LEFT JOIN users u ON u.id = e.user_id
+            LEFT JOIN words w ON w.id = e.word_id
+            LEFT JOIN user_preferences p ON p.user_id = e.user_id
+            WHERE e.id > $1
+              AND e.recorded_at < CURRENT_TIMESTAMP - make_interval(secs => $2)
+            ORDER BY e.id
+            LIMIT $3
+        """
+        advance_query = """
+            UPDATE learning_event_offsets
+            SET last_event_id = $2, updated_at = CURRENT_TIMESTAMP
+            WHERE consumer = $1
+        """
+
+        started = time.perf_counter()
+        async with pool.acquire() as conn:
+            await conn.execute(offset_query, self.consumer)
+            async with conn.transaction():
+                last_event_id = await conn.fetchval(lock_query, self.consumer)
+                events = await conn.fetch(
+                    events_query, last_event_id, self.settle_seconds, self.batch_size
+                )
+                if not events:
+                    return 0
+
+                skipped = await self._fold(conn, events)
+                await conn.execute(advance_query, self.consumer, events[-1]["id"])
+
+        for reason, count in skipped.items():
+            self.skipped[reason] = self.skipped.get(reason, 0) + count
+        self.folded += len(events) - sum(skipped.values())
+        self.batches += 1
+        self.last_batch_ms = (time.perf_counter() - started) * 1000
+        return len(events)
+
+    async def _fold(
+        self, conn: asyncpg.Connection, events: List[asyncpg.Record]
+    ) -> Dict[str, int]:
+        """Applies a batch of events and returns the skipped ones by reason."""
+        sessions = []
+        diamonds: Dict[int, int] = {}
+        practice_time: Dict[int, int] = {}
+        # Per user and local day, the n-th answer to each word goes into
+        # round n, so each apply counts towards a single day
+        answer_rounds: Dict[
+            Tuple[int, date], List[List[Tuple[WordProgressUpdate, datetime]]]
+        ] = {}
+        answer_counts: Dict[Tuple[int, date, int], int] = {}
+        skipped: Dict[str, int] = {}
+
+        for event in events:
+            user_id = event["user_id"]
+            if not event["user_exists"]:
+                reason = "deleted_user"
+            elif not event["word_exists"]:
+                reason = "deleted_word"
+            elif event["event_type"] not in (ANSWER, PRACTICE_SESSION, DIAMONDS):
+                logger.error(
+                    f"Skipping learning event {event['id']} of unknown type "
+                    f"{event['event_type']}"
+                )
+                reason = "unknown_type"
+            else:
+                reason = None
+            if reason is not None:
+                skipped[reason] = skipped.get(reason, 0) + 1
+                continue
+
+            try:
+                payload = json.loads(event["payload"])
+                if event["event_type"] == ANSWER:
+                    update = WordProgressUpdate(word_id=event["word_id"], **payload)
+                elif event["event_type"] == PRACTICE_SESSION:
+                    session = (
+                        user_id,
+                        int(payload["practice_time"]),
+                        str(payload["session_type"]),
+                        event["occurred_at"],
+                    )
+                else:
+                    amount = int(payload["amount"])
+            except (ValueError, KeyError, TypeError) as e:
+                logger.error(f"Skipping malformed learning event {event['id']}: {e}")
+                skipped["malformed"] = skipped.get("malformed", 0) + 1
+                continue
+
+            if event["event_type"] == ANSWER:
+                day = (user_id, event["local_date"])
+                key = (user_id, event["local_date"], event["word_id"])
+                round_index = answer_counts.get(key, 0)
+                answer_counts[key] = round_index + 1
+                rounds = answer_rounds.setdefault(day, [])
+                while len(rounds) <= round_index:
+                    rounds.append([])
+                rounds[round_index].append((update, event["occurred_at"]))
+            elif event["event_type"] == PRACTICE_SESSION:
+                sessions.append(session)
+                practice_time[user_id] = practice_time.get(user_id, 0) + session[1]
+            else:
+                diamonds[user_id] = diamonds.get(user_id, 0) + amount
+
+        if sessions or diamonds:
+            user_ids = sorted(set(diamonds) | set(practice_time))
+            await conn.execute(
+                FLUSH_QUERY,
+                [session[0] for session in sessions],
+                [session[1] for session in sessions],
+                [session[2] for session in sessions],
+                [session[3] for session in sessions],
+                user_ids,
+                [diamonds.get(user_id, 0) for user_id in user_ids],
+                [practice_time.get(user_id, 0) for user_id in user_ids],
+            )
+
+        for (user_id, _), rounds in answer_rounds.items():
+            for answers in rounds:
+                await apply_word_progress(
+                    conn,
+                    user_id,
+                    [update for update, _ in answers],
+                    occurred_at=[at for _, at in answers],
+                )
+        return skipped
+
+    async def replay(self, pool: asyncpg.Pool, from_event_id: int = 0) -> None:
+        """Rewinds the consumer so events after ``from_event_id`` fold again.
+
+        Increments are re-added, so summary tables should be reset first when
+        recomputing them from the full log.
+        """
+        query = """
+            INSERT INTO learning_event_offsets (consumer, last_event_id)
+            VALUES ($1, $2)
+            ON CONFLICT (consumer) DO UPDATE
+            SET last_event_id = EXCLUDED.last_event_id,
+                updated_at = CURRENT_TIMESTAMP
+        """
+        await pool.execute(query, self.consumer, from_event_id)
+
+    async def run(self, pool: asyncpg.Pool) -> None:
+        while True:
+            try:
+                folded = await self.run_once(pool)
+            except Exception as e:
+                logger.error(f"Error aggregating learning events: {e}")
+                self.failures += 1
+                folded = 0
+            # Keep going without a pause while there is a backlog
+            if folded < self.batch_size:
+                await asyncio.sleep(self.interval)
+
+    async def start(self, pool: asyncpg.Pool) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run(pool))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "folded": self.folded,
+            "batches": self.batches,
+            "failures": self.failures,
+            "skipped": sum(self.skipped.values()),
+            "skipped_by_reason": dict(self.skipped),
+            "last_batch_ms": round(self.last_batch_ms, 2),
+        }
+
+
+if env.progress_write_mode not in PROGRESS_WRITE_MODES:
+    raise ValueError(
+        f"Unknown progress write mode '{env.progress_write_mode}', "
+        f"expected one of {PROGRESS_WRITE_MODES}"
+    )
+
+event_log = EventLog(
+    flush_interval=env.event_flush_interval, max_batch=env.event_max_batch
+)
+event_aggregator = EventAggregator(
+    batch_size=env.event_aggregator_batch_size,
+    interval=env.event_aggregator_interval,
+    settle_seconds=env.event_aggregator_settle_seconds,
+)
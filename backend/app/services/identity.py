@@ -0,0 +1,90 @@
+from typing import Optional
+import asyncio
+import logging
+
+import asyncpg
+from app.config.env import env
+from app.utils.cache import TTLCache
+
+
+logger = logging.getLogger("identity")
+
+IDENTITY_INVALIDATION_CHANNEL = "user_identity_invalidated"
+
+# clerk_id -> User, in front of UserService.get_user_by_clerk_id
+identity_cache = TTLCache(maxsize=env.identity_cache_size, ttl=env.identity_cache_ttl)
+
+
+class IdentityInvalidationListener:
+    """Evicts identity cache entries when any worker announces a change.
+
+    Each worker holds one dedicated connection that LISTENs on the
+    invalidation channel. The cache is only consulted while that connection is
+    up, so a worker that cannot hear other workers never serves stale users.
+    """
+
+    def __init__(self, dsn: Optional[str], reconnect_delay: float = 5):
+        self.dsn = dsn
+        self.reconnect_delay = reconnect_delay
+        self._conn: Optional[asyncpg.Connection] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._stopped = False
+
+    @property
+    def is_listening(self) -> bool:
+        return self._conn is not None and not self._conn.is_closed()
+
+    async def start(self) -> None:
+        self._stopped = False
+        try:
+            self._conn = await asyncpg.connect(self.dsn)
+            await self._conn.add_listener(
+                IDENTITY_INVALIDATION_CHANNEL, self._on_notification
+            )
+            self._conn.add_termination_listener(self._on_termination)
+        except Exception as e:
+            logger.error(f"Error starting identity invalidation listener: {e}")
+            self._conn = None
+            self._schedule_reconnect()
+
+    async def stop(self) -> None:
+        self._stopped = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+    def _on_notification(self, conn, pid, channel, clerk_id: str) -> None:
+        identity_cache.pop(clerk_id)
+
+    def _on_termination(self, conn) -> None:
+        # Notifications may have been missed while disconnected
+        identity_cache.clear()
+        self._conn = None
+        self._schedule_reconnect()
+
+    def _schedule_reconnect(self) -> None:
+        if self._stopped:
+            return
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        await asyncio.sleep(self.reconnect_delay)
+        identity_cache.clear()
+        await self.start()
+
+
+identity_listener = IdentityInvalidationListener(env.database_url)
+
+
+async def invalidate_identity(pool: asyncpg.Pool, clerk_id: str) -> None:
+    identity_cache.pop(clerk_id)
+    try:
+        await pool.execute(
+            "SELECT pg_notify($1, $2)", IDENTITY_INVALIDATION_CHANNEL, clerk_id
+        )
+    except Exception as e:
+        logger.error(f"Error broadcasting identity invalidation for {clerk_id}: {e}")
@@ -0,0 +1,193 @@
+from app.config.db import get_pool
+from app.models.user import (
+    LeaderboardEntry,
+    LeaderboardStanding,
+    WindowedLeaderboardEntry,
+    UserNotRankedError,
+)
+from app.services.leaderboard_ranks import leaderboard_ranks
+from fastapi import Depends
+from typing import Dict, List, Optional, Set
+import asyncpg
+
+# Leaderboard rows in display order. Ties on score are broken by user_id so
+# that keyset reads around a user are stable; both directions walk
+# idx_user_stats_score_user_id.
+ENTRY_SELECT = """
+    SELECT
+        u.id,
+        u.username,
+        u.profile_picture_url,
+        ranked.score,
+        ranked.total_words_learned,
+        ranked.total_practice_time,
+        ranked.diamonds AS total_diamonds,
+        ranked.current_streak AS total_streak,
+        (
+            SELECT MAX(updated_at)
+            FROM word_progress
+            WHERE user_id = u.id
+        ) AS last_active
+    FROM ({ranked}) ranked
+    JOIN users u ON u.id = ranked.user_id
+    ORDER BY ranked.score DESC, ranked.user_id DESC
+"""
+
+# Scores a window from its UTC day buckets. Days active in the window stand in
+# for the streak term of the all-time score, so new users can rank.
+WINDOW_SELECT = """
+    SELECT
+        u.id,
+        u.username,
+        u.profile_picture_url,
+        w.score,
+        w.words_practiced,
+        w.practice_time,
+        w.active_days
+    FROM (
+        SELECT
+            user_id,
+            SUM(words_practiced) AS words_practiced,
+            SUM(practice_time) AS practice_time,
+            COUNT(*) AS active_days,
+            (
+                SUM(words_practiced) * 0.4
+                + SUM(practice_time) * 0.3
+                + COUNT(*) * 0.3
+            )::double precision AS score
+        FROM leaderboard_buckets
+        WHERE bucket_date > (CURRENT_TIMESTAMP AT TIME ZONE 'UTC')::date - $1::int
+        GROUP BY user_id
+        ORDER BY score DESC, user_id DESC
+        LIMIT $2
+    ) w
+    JOIN users u ON u.id = w.user_id
+    ORDER BY w.score DESC, w.user_id DESC
+"""
+
+LEADERBOARD_WINDOW_DAYS = {"daily": 1, "weekly": 7}
+
+
+class LeaderboardService:
+    def __init__(self, pool: asyncpg.Pool):
+        self.pool = pool
+
+    async def get_top(self, limit: int) -> List[LeaderboardEntry]:
+        query = ENTRY_SELECT.format(
+            ranked="""
+                SELECT * FROM user_stats
+                ORDER BY score DESC, user_id DESC
+                LIMIT $1
+            """
+        )
+        try:
+            records = await self.pool.fetch(query, limit)
+            return await self._ranked_entries(records, first_rank=1)
+        except Exception as e:
+            raise Exception(f"Error getting leaderboard: {str(e)}")
+
+    async def get_window(
+        self, window: str, limit: int
+    ) -> List[WindowedLeaderboardEntry]:
+        """Top users by activity over the last day or week (UTC days)."""
+        try:
+            records = await self.pool.fetch(
+                WINDOW_SELECT, LEADERBOARD_WINDOW_DAYS[window], limit
+            )
+            entries = []
+            for position, record in enumerate(records):
+                if position == 0 or record["score"] < records[position - 1]["score"]:
+                    rank = position + 1
+                entries.append(WindowedLeaderboardEntry(rank=rank, **record))
+            return entries
+        except Exception as e:
+            raise Exception(f"Error getting {window} leaderboard: {str(e)}")
+
+    async def get_standing(self, user_id: int, radius: int) -> LeaderboardStanding:
+        """The user's rank plus up to ``radius`` users on either side."""
+        score = await self.pool.fetchval(
+            "SELECT score FROM user_stats WHERE user_id = $1", user_id
+        )
+        if score is None:
+            raise UserNotRankedError(f"User with ID {user_id} has no stats yet")
+
+        query = ENTRY_SELECT.format(
+            ranked="""
+                (
+                    SELECT * FROM user_stats
+                    WHERE (score, user_id) > ($1, $2)
+                    ORDER BY score ASC, user_id ASC
+                    LIMIT $3
+                )
+                UNION ALL
+                (
+                    SELECT * FROM user_stats
+                    WHERE (score, user_id) <= ($1, $2)
+                    ORDER BY score DESC, user_id DESC
+                    LIMIT $3 + 1
+                )
+            """
+        )
+        try:
+            records = await self.pool.fetch(query, score, user_id, radius)
+            entries = await self._ranked_entries(records)
+            own = next(entry for entry in entries if entry.id == user_id)
+            return LeaderboardStanding(
+                rank=own.rank,
+                score=own.score,
+                total_users=await self._total_users(),
+                entries=entries,
+            )
+        except Exception as e:
+            raise Exception(f"Error getting leaderboard standing: {str(e)}")
+
+    async def _ranked_entries(
+        self, records: List[asyncpg.Record], first_rank: Optional[int] = None
+    ) -> List[LeaderboardEntry]:
+        """Ranks records ordered by score descending.
+
+        With ``first_rank`` the records are taken to be every user from that
+        rank down, so ranks follow from positions. Otherwise the window may
+        start partway through a tie, and each distinct score is ranked against
+        all users.
+        """
+        if not records:
+            return []
+        if first_rank is None:
+            ranks = await self._ranks_of({record["score"] for record in records})
+        else:
+            ranks = {}
+            for position, record in enumerate(records):
+                # Tied scores share a rank; the next distinct score skips ahead
+                ranks.setdefault(record["score"], first_rank + position)
+
+        return [
+            LeaderboardEntry(rank=ranks[record["score"]], **record)
+            for record in records
+        ]
+
+    async def _ranks_of(self, scores: Set[float]) -> Dict[float, int]:
+        """One plus the number of users scoring above each of ``scores``."""
+        if leaderboard_ranks.is_loaded:
+            return {score: leaderboard_ranks.rank(score) for score in scores}
+        records = await self.pool.fetch(
+            """
+            SELECT
+                s.score,
+                (SELECT COUNT(*) FROM user_stats WHERE score > s.score) + 1 AS rank
+            FROM unnest($1::double precision[]) AS s(score)
+            """,
+            list(scores),
+        )
+        return {record["score"]: record["rank"] for record in records}
+
+    async def _total_users(self) -> int:
+        if leaderboard_ranks.is_loaded:
+            return leaderboard_ranks.total
+        return await self.pool.fetchval("SELECT COUNT(*) FROM user_stats")
+
+
+async def get_leaderboard_service(
+    pool: asyncpg.Pool = Depends(get_pool),
+) -> LeaderboardService:
+    return LeaderboardService(pool)
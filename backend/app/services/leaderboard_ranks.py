@@ -0,0 +1,328 @@
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from array import array
+from bisect import bisect_left, bisect_right, insort
+import asyncio
+import json
+import logging
+import time
+
+import asyncpg
+from app.config.env import env
+
+
+logger = logging.getLogger("leaderboard")
+
+LEADERBOARD_SCORES_CHANNEL = "leaderboard_scores"
+
+ROLL_OFF_INTERVAL = 3600
+
+Snapshot = Tuple[int, int, Set[int]]
+
+
+def parse_snapshot(text: str) -> Snapshot:
+    """Parses txid_current_snapshot() text, ``xmin:xmax:xip,...``."""
+    xmin, xmax, xip = text.split(":")
+    return int(xmin), int(xmax), {int(xid) for xid in xip.split(",") if xid}
+
+
+def visible_in(xid: int, snapshot: Snapshot) -> bool:
+    """Whether a committed transaction's changes are part of ``snapshot``."""
+    xmin, xmax, xip = snapshot
+    return xid < xmin or (xid < xmax and xid not in xip)
+
+
+class SortedScores:
+    """A sorted multiset of scores with O(log n) counts and O(sqrt n) updates.
+
+    Scores are kept in sorted blocks of ``load`` to ``2 * load`` doubles, so an
+    insert or delete only shifts one block, and a Fenwick tree over the block
+    sizes counts the scores in the blocks before a given one. A million scores
+    take about 8 MB.
+    """
+
+    def __init__(self, scores: Sequence[float] = (), load: int = 1000):
+        self._load = load
+        self._blocks = [
+            array("d", scores[start : start + load])
+            for start in range(0, len(scores), load)
+        ]
+        self._len = len(scores)
+        self._reindex()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def count_at_most(self, score: float) -> int:
+        index = bisect_right(self._maxes, score)
+        if index == len(self._blocks):
+            return self._len
+        return self._count_before(index) + bisect_right(self._blocks[index], score)
+
+    def add(self, score: float) -> None:
+        if not self._blocks:
+            self._blocks.append(array("d", [score]))
+            self._len = 1
+            self._reindex()
+            return
+
+        index = min(bisect_left(self._maxes, score), len(self._blocks) - 1)
+        block = self._blocks[index]
+        insort(block, score)
+        self._maxes[index] = block[-1]
+        self._len += 1
+        if len(block) > 2 * self._load:
+            self._blocks[index : index + 1] = [block[: self._load], block[self._load :]]
+            self._reindex()
+        else:
+            self._add_count(index, 1)
+
+    def remove(self, score: float) -> bool:
+        index = bisect_left(self._maxes, score)
+        if index == len(self._blocks):
+            return False
+        block = self._blocks[index]
+        position = bisect_left(block, score)
+        if block[position] != score:
+            return False
+
+        del block[position]
+        self._len -= 1
+        if block:
+            self._maxes[index] = block[-1]
+            self._add_count(index, -1)
+        else:
+            del self._blocks[index]
+            self._reindex()
+        return True
+
+    def _reindex(self) -> None:
+        self._maxes = [block[-1] for block in self._blocks]
+        tree = [0] * (len(self._blocks) + 1)
+        for node, block in enumerate(self._blocks, 1):
+            tree[node] += len(block)
+            parent = node + (node & -node)
+            if parent < len(tree):
+                tree[parent] += tree[node]
+        self._tree = tree
+
+    def _add_count(self, index: int, delta: int) -> None:
+        node = index + 1
+        while node < len(self._tree):
+            self._tree[node] += delta
+            node += node & -node
+
+    def _count_before(self, index: int) -> int:
+        total = 0
+        node = index
+        while node > 0:
+            total += self._tree[node]
+            node -= node & -node
+        return total
+
+
+class LeaderboardRanks:
+    """In-memory index of every user's score, kept current as stats change.
+
+    A user's rank is one plus the number of scores above theirs, found with a
+    binary search instead of counting rows in Postgres. The index is loaded
+    once, then a trigger on user_stats NOTIFYs each committed score change and
+    every worker applies it, so ranks trail writes only by notification
+    latency. Each worker LISTENs on a dedicated connection; the index is only
+    used while it is up, and is reloaded after a reconnect or if a change does
+    not match it.
+
+    Changes already in the loaded snapshot are recognised by transaction id
+    and skipped, so none are applied twice or lost around a reload.
+
+    A background loop also drops windowed leaderboard buckets older than
+    ``bucket_retention_days`` once an hour.
+    """
+
+    def __init__(
+        self,
+        dsn: Optional[str],
+        bucket_retention_days: int,
+        reconnect_delay: float = 5,
+    ):
+        self.dsn = dsn
+        self.bucket_retention_days = bucket_retention_days
+        self.reconnect_delay = reconnect_delay
+        self.buckets_rolled_off = 0
+        self.reloads = 0
+        self.reload_ms = 0.0
+        self.changes_applied = 0
+        self.mismatches = 0
+        self._scores: Optional[SortedScores] = None
+        self._snapshot: Optional[Snapshot] = None
+        self._loading: Optional[List[Dict[str, Any]]] = None
+        self._stale = False
+        self._pool: Optional[asyncpg.Pool] = None
+        self._conn: Optional[asyncpg.Connection] = None
+        self._reload_task: Optional[asyncio.Task] = None
+        self._roll_off_task: Optional[asyncio.Task] = None
+        self._stopped = False
+
+    @property
+    def is_listening(self) -> bool:
+        return self._conn is not None and not self._conn.is_closed()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._scores is not None and self.is_listening
+
+    @property
+    def total(self) -> int:
+        return len(self._scores)
+
+    def rank(self, score: float) -> int:
+        return len(self._scores) - self._scores.count_at_most(score) + 1
+
+    async def start(self, pool: asyncpg.Pool) -> None:
+        self._pool = pool
+        self._stopped = False
+        if self._roll_off_task is None or self._roll_off_task.done():
+            self._roll_off_task = asyncio.create_task(self._run_roll_off())
+        self._schedule_reload()
+
+    async def stop(self) -> None:
+        self._stopped = True
+        for task in (self._roll_off_task, self._reload_task):
+            if task is not None:
+                task.cancel()
+        self._roll_off_task = self._reload_task = None
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+        self._scores = None
+
+    async def reload(self) -> None:
+        """Replaces the index with a fresh snapshot of user_stats."""
+        started = time.perf_counter()
+        self._stale = False
+        self._loading = []
+        try:
+            async with self._pool.acquire() as conn:
+                async with conn.transaction(isolation="repeatable_read", readonly=True):
+                    snapshot = parse_snapshot(
+                        await conn.fetchval("SELECT txid_current_snapshot()::text")
+                    )
+                    scores = await conn.fetchval(
+                        "SELECT array_agg(score ORDER BY score) FROM user_stats"
+                    )
+            index = SortedScores(scores or [])
+            for change in self._loading:
+                if not visible_in(change["xid"], snapshot):
+                    if self._apply(index, change):
+                        self._stale = True
+        finally:
+            self._loading = None
+
+        self._scores = index
+        self._snapshot = snapshot
+        self.reloads += 1
+        self.reload_ms = (time.perf_counter() - started) * 1000
+
+    async def _listen(self) -> bool:
+        try:
+            self._conn = await asyncpg.connect(self.dsn)
+            await self._conn.add_listener(
+                LEADERBOARD_SCORES_CHANNEL, self._on_notification
+            )
+            self._conn.add_termination_listener(self._on_termination)
+            return True
+        except Exception as e:
+            logger.error(f"Error starting leaderboard score listener: {e}")
+            self._conn = None
+            return False
+
+    def _on_notification(self, conn, pid, channel, payload: str) -> None:
+        change = json.loads(payload)
+        if self._loading is not None:
+            self._loading.append(change)
+        if self._scores is None or visible_in(change["xid"], self._snapshot):
+            return
+        # While a reload runs the old index keeps serving; it is replaced, so
+        # a mismatch there does not matter
+        if self._apply(self._scores, change) and self._loading is None:
+            self._stale = True
+            self._schedule_reload()
+
+    def _apply(self, index: SortedScores, change: Dict[str, Any]) -> int:
+        """Applies one change and returns how many removals did not match."""
+        mismatches = 0
+        for score in change["removed"]:
+            if not index.remove(score):
+                mismatches += 1
+        for score in change["added"]:
+            index.add(score)
+        self.changes_applied += 1
+        self.mismatches += mismatches
+        return mismatches
+
+    def _on_termination(self, conn) -> None:
+        # Changes may have been missed while disconnected
+        self._conn = None
+        self._scores = None
+        self._stale = True
+        self._schedule_reload(self.reconnect_delay)
+
+    def _schedule_reload(self, delay: float = 0) -> None:
+        if self._stopped:
+            return
+        if self._reload_task is None or self._reload_task.done():
+            self._reload_task = asyncio.create_task(self._run_reload(delay))
+
+    async def _run_reload(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        # LISTEN before loading, so every change committed after the
+        # snapshot is heard
+        if self.is_listening or await self._listen():
+            try:
+                await self.reload()
+            except Exception as e:
+                logger.error(f"Error loading leaderboard ranks: {e}")
+                self._stale = True
+        else:
+            self._stale = True
+
+        if (self._stale or not self.is_listening) and not self._stopped:
+            self._reload_task = asyncio.create_task(
+                self._run_reload(self.reconnect_delay)
+            )
+
+    async def roll_off(self, pool: asyncpg.Pool) -> None:
+        # Windows only read recent buckets, so expired days are dropped as a
+        # contiguous range at the front of the primary key
+        status = await pool.execute(
+            """
+            DELETE FROM leaderboard_buckets
+            WHERE bucket_date <= (CURRENT_TIMESTAMP AT TIME ZONE 'UTC')::date - $1::int
+            """,
+            self.bucket_retention_days,
+        )
+        self.buckets_rolled_off += int(status.split()[-1])
+
+    async def _run_roll_off(self) -> None:
+        while True:
+            try:
+                await self.roll_off(self._pool)
+            except Exception as e:
+                logger.error(f"Error rolling off leaderboard buckets: {e}")
+            await asyncio.sleep(ROLL_OFF_INTERVAL)
+
+    def stats(self) -> dict:
+        return {
+            "users": self.total if self._scores is not None else None,
+            "loaded": self.is_loaded,
+            "listening": self.is_listening,
+            "reloads": self.reloads,
+            "reload_ms": round(self.reload_ms, 2),
+            "changes_applied": self.changes_applied,
+            "mismatches": self.mismatches,
+            "buckets_rolled_off": self.buckets_rolled_off,
+        }
+
+
+leaderboard_ranks = LeaderboardRanks(
+    env.database_url, env.leaderboard_bucket_retention_days
+)
@@ -1,5 +1,10 @@
 from app.config.db import get_pool
-from app.models.base import PaginatedPayload, PageInfo
+from app.models.base import (
+    PaginatedPayload,
+    PageInfo,
+    CursorPaginatedPayload,
+    CursorPageInfo,
+)
 from app.models.list import (
     WordList,
     WordListCategory,
@@ -11,15 +16,23 @@ from app.models.list import (
     CategoryNotFoundError,
     CategoryAlreadyExistsError,
     WordListCreate,
+    ListImportResult,
 )
 from app.models.word import WordNotFoundError, Word
 from app.services.words import WordService, get_word_service
 from app.services.quizzes import QuizService, get_quiz_service
+from app.utils.pagination import (
+    encode_cursor,
+    decode_cursor,
+    cursor_id,
+    cursor_text,
+)
 import asyncpg
-from typing import List
+from typing import List, Optional
 from fastapi import Depends
 import json
 import math
+import time
 
 
 class ListService:
@@ -162,6 +175,174 @@ class ListService:
         except Exception as e:
             raise Exception(f"Error inserting list: {str(e)}")
 
+    async def import_list(self, word_list: WordListCreate) -> ListImportResult:
+        """Bulk variant of insert_list: resolves words and categories in batch
+        and writes everything in one transaction, so a failure leaves nothing
+        behind. Quizzes are only added for words that did not exist yet."""
+        timings = {}
+        started = phase_started = time.perf_counter()
+
+        def finish_phase(name: str) -> None:
+            nonlocal phase_started
+            now = time.perf_counter()
+            timings[name] = round((now - phase_started) * 1000, 2)
+            phase_started = now
+
+        category_names = list(dict.fromkeys(word_list.categories or []))
+        words_by_name = {}
+        for word in word_list.words or []:
+            words_by_name.setdefault(word.word, word)
+
+        try:
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    list_data = await conn.fetchrow(
+                        """
+                        INSERT INTO lists (name, description, difficulty_level, icon_name)
+                        VALUES ($1, $2, $3, $4)
+                        RETURNING *
+                        """,
+                        word_list.name,
+                        word_list.description,
+                        word_list.difficulty_level,
+                        word_list.icon_name,
+                    )
+                    list_id = list_data["id"]
+                    finish_phase("list")
+
+                    if category_names:
+                        await conn.execute(
+                            """
+                            INSERT INTO categories (name, difficulty_level)
+                            SELECT name, 'beginner' FROM unnest($1::text[]) AS name
+                            ON CONFLICT (name) DO NOTHING
+                            """,
+                            category_names,
+                        )
+                        await conn.execute(
+                            """
+                            INSERT INTO list_categories (list_id, category_id)
+                            SELECT $1, id FROM categories WHERE name = ANY($2::text[])
+                            """,
+                            list_id,
+                            category_names,
+                        )
+                    finish_phase("categories")
+
+                    existing_words = await conn.fetch(
+                        "SELECT id, word FROM words WHERE word = ANY($1::text[])",
+                        list(words_by_name),
+                    )
+                    word_ids = {record["word"]: record["id"] for record in existing_words}
+                    new_words = [
+                        word
+                        for name, word in words_by_name.items()
+                        if name not in word_ids
+                    ]
+                    finish_phase("resolve_words")
+
+                    if new_words:
+                        await conn.copy_records_to_table(
+                            "words",
+                            columns=[
+                                "word",
+                                "definition",
+                                "part_of_speech",
+                                "difficulty_level",
+                                "examples",
+                                "synonyms",
+                                "antonyms",
+                                "tags",
+                                "etymology",
+                                "usage_notes",
+                                "audio_url",
+                                "image_url",
+                                "quiz_count",
+                            ],
+                            records=[
+                                (
+                                    word.word,
+                                    word.definition,
+                                    word.part_of_speech,
+                                    word.difficulty_level,
+                                    word.examples or [],
+                                    word.synonyms or [],
+                                    word.antonyms or [],
+                                    word.tags or [],
+                                    word.etymology,
+                                    word.usage_notes,
+                                    word.audio_url,
+                                    word.image_url,
+                                    len(word.quizzes or []),
+                                )
+                                for word in new_words
+                            ],
+                        )
+                        created_words = await conn.fetch(
+                            "SELECT id, word FROM words WHERE word = ANY($1::text[])",
+                            [word.word for word in new_words],
+                        )
+                        word_ids.update(
+                            {record["word"]: record["id"] for record in created_words}
+                        )
+                    finish_phase("words")
+
+                    quiz_records = [
+                        (
+                            word_ids[word.word],
+                            ordinal,
+                            quiz.quiz_type.value,
+                            quiz.question,
+                            quiz.options,
+                            quiz.correct_options,
+                        )
+                        for word in new_words
+                        for ordinal, quiz in enumerate(word.quizzes or [])
+                    ]
+                    if quiz_records:
+                        await conn.copy_records_to_table(
+                            "quizzes",
+                            columns=[
+                                "word_id",
+                                "ordinal",
+                                "quiz_type",
+                                "question",
+                                "options",
+                                "correct_options",
+                            ],
+                            records=quiz_records,
+                        )
+                    finish_phase("quizzes")
+
+                    await conn.execute(
+                        """
+                        INSERT INTO list_words (list_id, word_id)
+                        SELECT $1, word_id FROM unnest($2::int[]) AS word_id
+                        ON CONFLICT DO NOTHING
+                        """,
+                        list_id,
+                        list(word_ids.values()),
+                    )
+                    finish_phase("list_words")
+
+            final_list = await self.get_full_list(list_id)
+            finish_phase("reload")
+            timings["total"] = round((time.perf_counter() - started) * 1000, 2)
+
+            return ListImportResult(
+                word_list=final_list,
+                words_created=len(new_words),
+                words_reused=len(words_by_name) - len(new_words),
+                quizzes_created=len(quiz_records),
+                timings=timings,
+            )
+        except asyncpg.UniqueViolationError as e:
+            if e.table_name == "lists":
+                raise ListAlreadyExistsError("List already exists")
+            raise Exception(f"Error importing list: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Error importing list: {str(e)}")
+
     async def insert_list_word(self, list_id: int, word_id: int) -> None:
         try:
             async with self.pool.acquire() as conn:
@@ -286,21 +467,25 @@ class ListService:
         offset = (page - 1) * per_page
 
         items_query = """
-            SELECT id, name, description, difficulty_level, icon_name, created_at, updated_at 
-            FROM lists 
-            ORDER BY name ASC
+            SELECT l.id, l.name, l.description, l.difficulty_level, l.icon_name, l.created_at, l.updated_at
+            FROM list_categories lc
+            JOIN lists l ON l.id = lc.list_id
+            WHERE lc.category_id = $1
+            ORDER BY l.name ASC, l.id ASC
             LIMIT $2 OFFSET $3
         """
 
-        count_query = "SELECT COUNT(*) FROM lists"
+        count_query = "SELECT COUNT(*) FROM list_categories WHERE category_id = $1"
 
         try:
             async with self.pool.acquire() as conn:
-                total_items_record = await conn.fetchrow(count_query)
+                total_items_record = await conn.fetchrow(count_query, category_id)
                 total_items = total_items_record["count"] if total_items_record else 0
 
                 if total_items > 0:
-                    list_records = await conn.fetch(items_query, per_page, offset)
+                    list_records = await conn.fetch(
+                        items_query, category_id, per_page, offset
+                    )
                     items = [WordListBrief(**record) for record in list_records]
                 else:
                     items = []
@@ -324,6 +509,65 @@ class ListService:
                 f"Error retrieving lists for category {category_id}: {str(e)}"
             )
 
+    async def get_lists_by_category_after(
+        self, category_id: int, cursor: Optional[str] = None, per_page: int = 10
+    ) -> CursorPaginatedPayload[WordListBrief]:
+        # Keyset pagination on (name, id): every page is a seek past the last
+        # row of the previous one, so deep pages cost the same as the first.
+        # The first page and later pages are separate statements so that a
+        # generic prepared plan still seeks rather than filtering a scan.
+        first_page_query = """
+            SELECT l.id, l.name, l.description, l.difficulty_level, l.icon_name, l.created_at, l.updated_at
+            FROM list_categories lc
+            JOIN lists l ON l.id = lc.list_id
+            WHERE lc.category_id = $1
+            ORDER BY l.name ASC, l.id ASC
+            LIMIT $2
+        """
+        next_page_query = """
+            SELECT l.id, l.name, l.description, l.difficulty_level, l.icon_name, l.created_at, l.updated_at
+            FROM list_categories lc
+            JOIN lists l ON l.id = lc.list_id
+            WHERE lc.category_id = $1
+              AND (l.name, l.id) > ($2::text, $3::int)
+            ORDER BY l.name ASC, l.id ASC
+            LIMIT $4
+        """
+
+        if cursor:
+            after_name, after_id = decode_cursor(cursor, 2)
+            after_name, after_id = cursor_text(after_name), cursor_id(after_id)
+
+        try:
+            if cursor:
+                list_records = await self.pool.fetch(
+                    next_page_query, category_id, after_name, after_id, per_page + 1
+                )
+            else:
+                list_records = await self.pool.fetch(
+                    first_page_query, category_id, per_page + 1
+                )
+            has_next_page = len(list_records) > per_page
+            items = [WordListBrief(**record) for record in list_records[:per_page]]
+
+            next_cursor = None
+            if has_next_page:
+                next_cursor = encode_cursor([items[-1].name, items[-1].id])
+
+            page_info = CursorPageInfo(
+                per_page=per_page,
+                next_cursor=next_cursor,
+                has_next_page=has_next_page,
+            )
+            return CursorPaginatedPayload[WordListBrief](
+                items=items, page_info=page_info
+            )
+        except Exception as e:
+            print(f"Database error getting lists for category {category_id}: {e}")
+            raise Exception(
+                f"Error retrieving lists for category {category_id}: {str(e)}"
+            )
+
     async def create_category(
         self, category: WordListCategoryCreate
     ) -> WordListCategory:
@@ -418,119 +662,73 @@ class ListService:
     ) -> PaginatedPayload[WordList]:
         offset = (page - 1) * per_page
 
-        # Base query for fetching lists
-        base_query = """
-            SELECT 
+        # Word count, categories and the in-bank flag are resolved per row by
+        # correlated subqueries, so a page costs two statements in total
+        items_query = """
+            SELECT
                 lists.*,
-                COUNT(list_words.word_id) as word_count
+                (
+                    SELECT COUNT(*)
+                    FROM list_words
+                    WHERE list_words.list_id = lists.id
+                ) as word_count,
+                ARRAY(
+                    SELECT DISTINCT categories.name
+                    FROM list_categories
+                    JOIN categories ON list_categories.category_id = categories.id
+                    WHERE list_categories.list_id = lists.id
+                ) as categories,
+                (
+                    $2::int IS NOT NULL AND EXISTS (
+                        SELECT 1
+                        FROM user_lists
+                        WHERE user_lists.user_id = $2 AND user_lists.list_id = lists.id
+                    )
+                ) as in_users_bank
             FROM lists
-            LEFT JOIN list_words ON lists.id = list_words.list_id
+            WHERE ($1::text IS NULL OR lists.name ILIKE $1 OR lists.description ILIKE $1)
+            ORDER BY
+                CASE
+                    WHEN $1::text IS NULL THEN 0
+                    WHEN lists.name ILIKE $1 THEN 0
+                    WHEN lists.description ILIKE $1 THEN 1
+                    ELSE 2
+                END,
+                lists.name ASC
+            LIMIT $3 OFFSET $4
         """
 
-        # Build the query based on whether we're searching or not
-        params = []
-        if search_query and search_query.strip():
-            # Clean and prepare the search query
-            search_query = search_query.strip()
-
-            # Use LIKE for partial word matching
-            search_condition = """
-                WHERE (lists.name ILIKE $1 OR lists.description ILIKE $1)
-            """
-            params.append(f"%{search_query}%")
-
-            items_query = (
-                base_query
-                + search_condition
-                + """
-                GROUP BY lists.id
-                ORDER BY 
-                    CASE 
-                        WHEN lists.name ILIKE $1 THEN 0 
-                        WHEN lists.description ILIKE $1 THEN 1
-                        ELSE 2
-                    END,
-                    lists.name ASC
-                LIMIT $2 OFFSET $3
-            """
-            )
-            params.extend([per_page, offset])
-
-            count_query = (
-                """
-                SELECT COUNT(DISTINCT lists.id) FROM lists
-            """
-                + search_condition
-            )
-        else:
-            items_query = (
-                base_query
-                + """
-                GROUP BY lists.id
-                ORDER BY lists.name ASC
-                LIMIT $1 OFFSET $2
-            """
-            )
-            params.extend([per_page, offset])
+        count_query = """
+            SELECT COUNT(*) FROM lists
+            WHERE ($1::text IS NULL OR lists.name ILIKE $1 OR lists.description ILIKE $1)
+        """
 
-            count_query = """
-                SELECT COUNT(DISTINCT lists.id) FROM lists
-            """
+        search_pattern = None
+        if search_query and search_query.strip():
+            search_pattern = f"%{search_query.strip()}%"
 
         try:
             async with self.pool.acquire() as conn:
-                # Get total count
-                total_items_record = await conn.fetchrow(
-                    count_query,
-                    *params[:1] if search_query and search_query.strip() else [],
-                )
-                total_items = total_items_record["count"] if total_items_record else 0
+                total_items = await conn.fetchval(count_query, search_pattern) or 0
 
-                # Get paginated results
                 items = []
                 if total_items > 0:
-                    lists_data = await conn.fetch(items_query, *params)
-
-                    for list_data in lists_data:
-                        categories_data = await conn.fetch(
-                            """
-                            SELECT DISTINCT categories.name
-                            FROM list_categories
-                            JOIN categories ON list_categories.category_id = categories.id
-                            WHERE list_categories.list_id = $1
-                            """,
-                            list_data["id"],
-                        )
-
-                        categories_list = [
-                            category["name"] for category in categories_data
-                        ]
-
-                        in_users_bank = False
-                        if user_id is not None:
-                            user_list_record = await conn.fetchrow(
-                                "SELECT COUNT(*) FROM user_lists WHERE user_id = $1 AND list_id = $2",
-                                user_id,
-                                list_data["id"],
-                            )
-                            in_users_bank = (
-                                user_list_record["count"] > 0
-                                if user_list_record
-                                else False
-                            )
-
-                        items.append(
-                            WordList(
-                                id=list_data["id"],
-                                name=list_data["name"],
-                                description=list_data["description"],
-                                difficulty_level=list_data["difficulty_level"],
-                                icon_name=list_data["icon_name"],
-                                word_count=list_data["word_count"],
-                                categories=categories_list,
-                                in_users_bank=in_users_bank,
-                            )
+                    lists_data = await conn.fetch(
+                        items_query, search_pattern, user_id, per_page, offset
+                    )
+                    items = [
+                        WordList(
+                            id=list_data["id"],
+                            name=list_data["name"],
+                            description=list_data["description"],
+                            difficulty_level=list_data["difficulty_level"],
+                            icon_name=list_data["icon_name"],
+                            word_count=list_data["word_count"],
+                            categories=list_data["categories"],
+                            in_users_bank=list_data["in_users_bank"],
                         )
+                        for list_data in lists_data
+                    ]
 
                 total_pages = math.ceil(total_items / per_page) if per_page > 0 else 0
 
@@ -0,0 +1,462 @@
+from app.config.env import env
+from app.models.llm import (
+    SentenceCheckRequest,
+    SentenceCheckResponse,
+    SentenceCheckBatchRequest,
+    SentenceCheckBatchResponse,
+    LLMBusyError,
+    LLMTimeoutError,
+)
+from app.config.db import get_pool
+from app.services.sentence_cache import sentence_check_cache, sentence_cache_key
+from app.services.sentence_precheck import sentence_precheck
+from app.utils.json_stream import JSONObjectStream
+from app.utils.singleflight import SingleFlight
+from contextlib import asynccontextmanager
+from fastapi import Depends
+from openai import AsyncOpenAI, APITimeoutError
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+import asyncio
+import asyncpg
+import json
+import logging
+import time
+
+
+logger = logging.getLogger("llm")
+
+
+client = AsyncOpenAI(
+    api_key=env.openai_api_key,
+    base_url=env.openai_base_url,
+    timeout=env.llm_timeout,
+    max_retries=env.llm_max_retries,
+)
+
+# Identical checks arriving while one is in flight share its completion
+sentence_check_flight = SingleFlight()
+
+# Caps the completions in flight per worker; requests beyond it wait up to
+# llm_queue_timeout for a slot and are then turned away.
+llm_semaphore = asyncio.Semaphore(env.llm_max_concurrency)
+
+# Streamed completions still being read after their client went away
+_upstream_streams: Set[asyncio.Task] = set()
+
+
+@asynccontextmanager
+async def llm_slot():
+    try:
+        await asyncio.wait_for(llm_semaphore.acquire(), timeout=env.llm_queue_timeout)
+    except asyncio.TimeoutError:
+        raise LLMBusyError("Too many sentence checks in progress, try again")
+
+    try:
+        yield
+    finally:
+        llm_semaphore.release()
+
+
+SENTENCE_CHECK_PROMPT = """You are a helpful assistant designed to output JSON.
+                    Make sure your response does not include any extra characters.
+                    The response should easily parse to JSON.
+
+                    You are part of a word learning app. You will be given a word below,
+                    and a sentence using that word. You determine the correct usage of the word in the
+                    sentence provided.
+
+                    The JSON response format should be this type declaration:
+
+                    {
+                      "isCorrect": boolean;
+                      "correctUsage": string;
+                      "message": string;
+                    }
+
+                    The message field should include a general message about the user's usage even if it was correct.
+                    """
+
+
+BATCH_SENTENCE_CHECK_PROMPT = """You are a helpful assistant designed to output JSON.
+                    Make sure your response does not include any extra characters.
+                    The response should easily parse to JSON.
+
+                    You are part of a word learning app. You will be given a numbered list of
+                    words, each with a sentence using that word. For every item, determine the
+                    correct usage of the word in its sentence. Judge each item on its own.
+
+                    The JSON response format should be this type declaration:
+
+                    {
+                      "results": [
+                        {
+                          "index": number;
+                          "isCorrect": boolean;
+                          "correctUsage": string;
+                          "message": string;
+                        }
+                      ]
+                    }
+
+                    Return exactly one result per item, using the item's index.
+                    The message field should include a general message about the user's usage even if it was correct.
+                    """
+
+# Completion tokens reserved for each sentence check, single or batched
+SENTENCE_CHECK_MAX_TOKENS = 150
+
+
+def clean_json_response(json_string: str):
+    try:
+        return json.loads(json_string)
+    except:
+        # Clean up common JSON formatting issues
+        cleaned = json_string.replace("\\n", "\n")
+        cleaned = cleaned.replace('\\"', '"')
+        cleaned = cleaned.replace("\\", "")
+        return json.loads(cleaned)
+
+
+def sentence_check_messages(request: SentenceCheckRequest) -> List[Dict[str, str]]:
+    return [
+        {"role": "system", "content": SENTENCE_CHECK_PROMPT},
+        {
+            "role": "user",
+            "content": f"""
+                    Current Word: {request.word}
+                    Current Sentence: {request.sentence}
+                    """,
+        },
+    ]
+
+
+def batch_sentence_check_messages(
+    requests: List[SentenceCheckRequest],
+) -> List[Dict[str, str]]:
+    items = "\n".join(
+        f"""
+                    Index: {index}
+                    Current Word: {request.word}
+                    Current Sentence: {request.sentence}
+                    """
+        for index, request in enumerate(requests)
+    )
+    return [
+        {"role": "system", "content": BATCH_SENTENCE_CHECK_PROMPT},
+        {"role": "user", "content": items},
+    ]
+
+
+def estimate_tokens(text: str) -> int:
+    # Roughly four characters per token for English text
+    return len(text) // 4 + 1
+
+
+def pack_sentence_checks(
+    requests: List[SentenceCheckRequest], max_tokens: int
+) -> List[List[SentenceCheckRequest]]:
+    """Splits requests into chunks whose estimated prompt and completion
+    tokens fit in max_tokens; every chunk holds at least one request."""
+    chunks: List[List[SentenceCheckRequest]] = []
+    chunk: List[SentenceCheckRequest] = []
+    budget = max_tokens - estimate_tokens(BATCH_SENTENCE_CHECK_PROMPT)
+    used = 0
+
+    for request in requests:
+        cost = (
+            estimate_tokens(request.word + request.sentence)
+            + 20
+            + SENTENCE_CHECK_MAX_TOKENS
+        )
+        if chunk and used + cost > budget:
+            chunks.append(chunk)
+            chunk, used = [], 0
+        chunk.append(request)
+        used += cost
+
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+class LLMService:
+    def __init__(self, pool: asyncpg.Pool):
+        self.pool = pool
+
+    async def check_sentence(
+        self, request: SentenceCheckRequest
+    ) -> SentenceCheckResponse:
+        cache_key = sentence_cache_key(request.word, request.sentence)
+        cached = await sentence_check_cache.get(self.pool, cache_key)
+        if cached is not None:
+            return cached
+
+        local_verdict = await self._precheck(request)
+        if local_verdict is not None:
+            return local_verdict
+
+        return await self._flight_sentence_check(request, cache_key)
+
+    async def _flight_sentence_check(
+        self, request: SentenceCheckRequest, cache_key: Optional[str] = None
+    ) -> SentenceCheckResponse:
+        cache_key = cache_key or sentence_cache_key(request.word, request.sentence)
+        return await sentence_check_flight.do(
+            cache_key, lambda: self._complete_sentence_check(request, cache_key)
+        )
+
+    async def check_sentences(
+        self, batch: SentenceCheckBatchRequest
+    ) -> SentenceCheckBatchResponse:
+        results: List[Optional[SentenceCheckResponse]] = [None] * len(batch.items)
+        by_key: Dict[str, List[int]] = {}
+        for index, request in enumerate(batch.items):
+            cache_key = sentence_cache_key(request.word, request.sentence)
+            by_key.setdefault(cache_key, []).append(index)
+
+        # Cached verdicts and stored examples for the whole batch are read
+        # with one query each, concurrently; the prechecks then run in memory
+        cached, examples = await asyncio.gather(
+            sentence_check_cache.get_many(self.pool, list(by_key)),
+            self._load_examples({request.word for request in batch.items}),
+        )
+
+        pending: Dict[str, List[int]] = {}
+        for cache_key, indexes in by_key.items():
+            request = batch.items[indexes[0]]
+            result = cached.get(cache_key)
+            if result is None:
+                result = sentence_precheck.check(
+                    request.word,
+                    request.sentence,
+                    examples=examples.get(request.word),
+                )
+            if result is None:
+                pending[cache_key] = indexes
+                continue
+            for index in indexes:
+                results[index] = result
+
+        requests = [batch.items[indexes[0]] for indexes in pending.values()]
+        chunks = pack_sentence_checks(requests, env.llm_batch_max_tokens)
+        chunk_results = await asyncio.gather(
+            *(self._complete_sentence_check_batch(chunk) for chunk in chunks)
+        )
+
+        resolved = [result for chunk in chunk_results for result in chunk]
+        for indexes, result in zip(pending.values(), resolved):
+            for index in indexes:
+                results[index] = result
+
+        return SentenceCheckBatchResponse(results=results)
+
+    async def _complete_sentence_check_batch(
+        self, requests: List[SentenceCheckRequest]
+    ) -> List[SentenceCheckResponse]:
+        if len(requests) == 1:
+            return [await self._flight_sentence_check(requests[0])]
+
+        started = time.perf_counter()
+        response = await self._create_completion(
+            messages=batch_sentence_check_messages(requests),
+            max_tokens=SENTENCE_CHECK_MAX_TOKENS * len(requests),
+        )
+        sentence_precheck.record_llm_latency(time.perf_counter() - started)
+
+        by_index: Dict[int, SentenceCheckResponse] = {}
+        try:
+            json_response = clean_json_response(response.choices[0].message.content)
+            for item in json_response.get("results", []):
+                index = item.get("index")
+                if isinstance(index, int) and 0 <= index < len(requests):
+                    by_index[index] = SentenceCheckResponse(**item)
+        except Exception as e:
+            logger.error(f"Error parsing batch sentence check response: {e}")
+
+        usage = response.usage
+        results = []
+        for index, request in enumerate(requests):
+            result = by_index.get(index)
+            if result is None:
+                # Items the model skipped or garbled are checked on their own
+                result = await self._flight_sentence_check(request)
+            else:
+                await sentence_check_cache.set(
+                    self.pool,
+                    sentence_cache_key(request.word, request.sentence),
+                    request.word,
+                    request.sentence,
+                    result,
+                    prompt_tokens=usage.prompt_tokens // len(requests) if usage else 0,
+                    completion_tokens=(
+                        usage.completion_tokens // len(requests) if usage else 0
+                    ),
+                )
+            results.append(result)
+        return results
+
+    async def stream_sentence_check(
+        self, request: SentenceCheckRequest
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Yields ("verdict", ...) as soon as isCorrect is known, then
+        ("explanation", ...) with the rest of the response."""
+        cache_key = sentence_cache_key(request.word, request.sentence)
+        result = await sentence_check_cache.get(self.pool, cache_key)
+        if result is None:
+            result = await self._precheck(request)
+
+        if result is not None:
+            yield "verdict", {"isCorrect": result.isCorrect}
+            yield "explanation", {
+                "correctUsage": result.correctUsage,
+                "message": result.message,
+            }
+            return
+
+        # The completion is read by its own task into a queue, so the LLM slot
+        # is held only as long as upstream takes and never waits on a slow
+        # client. It runs to completion and caches the result even if the
+        # client disconnects.
+        deltas: asyncio.Queue = asyncio.Queue()
+        upstream = asyncio.create_task(
+            self._read_sentence_check_stream(request, cache_key, deltas)
+        )
+        _upstream_streams.add(upstream)
+        upstream.add_done_callback(_forget_upstream_stream)
+
+        parser = JSONObjectStream()
+        verdict_sent = False
+        while (delta := await deltas.get()) is not None:
+            if verdict_sent:
+                continue
+            for key, value in parser.feed(delta):
+                if key == "isCorrect" and isinstance(value, bool):
+                    yield "verdict", {"isCorrect": value}
+                    verdict_sent = True
+                    break
+
+        result = await upstream
+        if not verdict_sent:
+            yield "verdict", {"isCorrect": result.isCorrect}
+        yield "explanation", {
+            "correctUsage": result.correctUsage,
+            "message": result.message,
+        }
+
+    async def _read_sentence_check_stream(
+        self, request: SentenceCheckRequest, cache_key: str, deltas: asyncio.Queue
+    ) -> SentenceCheckResponse:
+        """Streams the completion into ``deltas``, ending with None."""
+        started = time.perf_counter()
+        content = ""
+        usage = None
+
+        try:
+            async with llm_slot():
+                try:
+                    stream = await client.chat.completions.create(
+                        model=env.llm_model,
+                        response_format={"type": "json_object"},
+                        messages=sentence_check_messages(request),
+                        max_tokens=SENTENCE_CHECK_MAX_TOKENS,
+                        stream=True,
+                        stream_options={"include_usage": True},
+                    )
+                    async for chunk in stream:
+                        if chunk.usage:
+                            usage = chunk.usage
+                        if not chunk.choices:
+                            continue
+                        delta = chunk.choices[0].delta.content or ""
+                        content += delta
+                        deltas.put_nowait(delta)
+                except APITimeoutError:
+                    raise LLMTimeoutError(
+                        "The language model took too long to respond"
+                    )
+        finally:
+            deltas.put_nowait(None)
+
+        sentence_precheck.record_llm_latency(time.perf_counter() - started)
+        result = SentenceCheckResponse(**clean_json_response(content))
+        await sentence_check_cache.set(
+            self.pool,
+            cache_key,
+            request.word,
+            request.sentence,
+            result,
+            prompt_tokens=usage.prompt_tokens if usage else 0,
+            completion_tokens=usage.completion_tokens if usage else 0,
+        )
+        return result
+
+    async def _precheck(
+        self, request: SentenceCheckRequest
+    ) -> Optional[SentenceCheckResponse]:
+        query = "SELECT examples FROM words WHERE word = $1"
+        try:
+            word_record = await self.pool.fetchrow(query, request.word)
+        except Exception as e:
+            logger.error(f"Error loading word for sentence pre-check: {e}")
+            word_record = None
+
+        return sentence_precheck.check(
+            request.word,
+            request.sentence,
+            examples=word_record["examples"] if word_record else None,
+        )
+
+    async def _load_examples(self, words: Set[str]) -> Dict[str, Any]:
+        query = "SELECT word, examples FROM words WHERE word = ANY($1::text[])"
+        try:
+            records = await self.pool.fetch(query, list(words))
+        except Exception as e:
+            logger.error(f"Error loading words for sentence pre-check: {e}")
+            records = []
+        return {record["word"]: record["examples"] for record in records}
+
+    async def _complete_sentence_check(
+        self, request: SentenceCheckRequest, cache_key: str
+    ) -> SentenceCheckResponse:
+        started = time.perf_counter()
+        response = await self._create_completion(
+            messages=sentence_check_messages(request), max_tokens=SENTENCE_CHECK_MAX_TOKENS
+        )
+        sentence_precheck.record_llm_latency(time.perf_counter() - started)
+        json_response = clean_json_response(response.choices[0].message.content)
+        result = SentenceCheckResponse(**json_response)
+
+        await sentence_check_cache.set(
+            self.pool,
+            cache_key,
+            request.word,
+            request.sentence,
+            result,
+            prompt_tokens=response.usage.prompt_tokens if response.usage else 0,
+            completion_tokens=(
+                response.usage.completion_tokens if response.usage else 0
+            ),
+        )
+        return result
+
+    async def _create_completion(self, **kwargs: Any):
+        async with llm_slot():
+            try:
+                return await client.chat.completions.create(
+                    model=env.llm_model,
+                    response_format={"type": "json_object"},
+                    **kwargs,
+                )
+            except APITimeoutError:
+                raise LLMTimeoutError("The language model took too long to respond")
+
+
+def _forget_upstream_stream(task: asyncio.Task) -> None:
+    _upstream_streams.discard(task)
+    if not task.cancelled():
+        # Mark the exception retrieved even if the client went away
+        task.exception()
+
+
+async def get_llm_service(pool: asyncpg.Pool = Depends(get_pool)) -> LLMService:
+    return LLMService(pool)
@@ -0,0 +1,211 @@
+"""Set-based progress writes shared by the request path and the event worker.
+
+Each function runs on the caller's connection so it can be combined with
+other writes in one transaction.
+"""
+
+from app.models.user import WordProgressUpdate
+from app.services.activity import activity_ctes, local_date, streak_cte
+from app.services.scheduler import sm2_set_clauses
+from typing import List, Optional
+from datetime import datetime, timezone
+import asyncpg
+
+
+async def apply_word_progress(
+    conn: asyncpg.Connection,
+    user_id: int,
+    updates: List[WordProgressUpdate],
+    practice_time: int = 0,
+    occurred_at: Optional[List[datetime]] = None,
+) -> List[asyncpg.Record]:
+    """Upserts progress for distinct words and does the day's bookkeeping.
+
+    One statement inserts or updates the word_progress rows (advancing their
+    review schedule), adds the words and practice_time minutes to the day's
+    activity rollups and counts that day towards the streak. A second
+    statement runs only for users who have no stats row yet.
+
+    ``occurred_at`` gives the UTC time each update was answered, for answers
+    applied after the fact. Reviews are scheduled from it and the activity is
+    counted on the day of the latest one; without it the current time is used.
+    """
+    # Fields left out of an update keep their stored value. An answer was
+    # submitted when the practice count moved forward, and it was correct
+    # when the success count moved with it.
+    answered = "i.practice_count IS NOT NULL AND i.practice_count > wp.practice_count"
+    correct = (
+        f"{answered} AND i.success_count IS NOT NULL "
+        "AND i.success_count > wp.success_count"
+    )
+    # A word counts towards today's progress once per local day
+    words_practiced = f"""
+        SELECT COUNT(*) FROM changed c
+        WHERE c.practice_count > 0
+          AND (
+              c.previous_practice_count IS NULL
+              OR c.previous_practice_count = 0
+              OR {local_date("c.previous_updated_at")} <> today.local_date
+          )
+    """
+    answered_at = "COALESCE(i.answered_at, CURRENT_TIMESTAMP)"
+    query = f"""
+        WITH input AS (
+            SELECT *
+            FROM unnest(
+                $2::int[], $3::int[], $4::int[], $5::int[], $6::int[], $7::int[],
+                $9::timestamptz[]
+            ) AS t(
+                word_id,
+                recognition_mastery_score,
+                usage_mastery_score,
+                practice_count,
+                success_count,
+                number_of_times_to_practice,
+                answered_at
+            )
+        ),
+        previous AS (
+            SELECT wp.word_id, wp.practice_count, wp.updated_at
+            FROM word_progress wp
+            JOIN input i ON i.word_id = wp.word_id
+            WHERE wp.user_id = $1
+        ),
+        updated AS (
+            UPDATE word_progress wp
+            SET recognition_mastery_score = COALESCE(
+                    i.recognition_mastery_score, wp.recognition_mastery_score
+                ),
+                usage_mastery_score = COALESCE(
+                    i.usage_mastery_score, wp.usage_mastery_score
+                ),
+                practice_count = COALESCE(i.practice_count, wp.practice_count),
+                success_count = COALESCE(i.success_count, wp.success_count),
+                number_of_times_to_practice = COALESCE(
+                    i.number_of_times_to_practice, wp.number_of_times_to_practice
+                ),
+                {sm2_set_clauses(
+                    answered=answered, correct=correct, current="wp", now=answered_at
+                )},
+                updated_at = {answered_at}
+            FROM input i
+            JOIN previous p ON p.word_id = i.word_id
+            WHERE wp.user_id = $1 AND wp.word_id = i.word_id
+            RETURNING
+                wp.*,
+                p.practice_count AS previous_practice_count,
+                p.updated_at AS previous_updated_at
+        ),
+        inserted AS (
+            INSERT INTO word_progress
+            (user_id, word_id, recognition_mastery_score, usage_mastery_score,
+             practice_count, success_count, number_of_times_to_practice,
+             next_due_at, updated_at)
+            SELECT
+                $1,
+                i.word_id,
+                COALESCE(i.recognition_mastery_score, 0),
+                COALESCE(i.usage_mastery_score, 0),
+                COALESCE(i.practice_count, 0),
+                COALESCE(i.success_count, 0),
+                COALESCE(i.number_of_times_to_practice, 5),
+                {answered_at},
+                {answered_at}
+            FROM input i
+            WHERE NOT EXISTS (SELECT 1 FROM previous p WHERE p.word_id = i.word_id)
+            ON CONFLICT (user_id, word_id) DO NOTHING
+            RETURNING
+                *,
+                NULL::int AS previous_practice_count,
+                NULL::timestamp AS previous_updated_at
+        ),
+        changed AS (
+            SELECT * FROM updated
+            UNION ALL
+            SELECT * FROM inserted
+        ),
+        {activity_ctes(
+            "$1",
+            words_practiced=words_practiced,
+            practice_time="$8",
+            now="(SELECT COALESCE(MAX(answered_at), CURRENT_TIMESTAMP) FROM input)",
+        )},
+        {streak_cte("$1")}
+        SELECT changed.*, EXISTS (SELECT 1 FROM streak) AS has_stats
+        FROM changed
+    """
+    create_stats_query = """
+        INSERT INTO user_stats
+        (user_id, diamonds, total_words_learned, current_streak, longest_streak,
+         total_practice_time, average_accuracy, last_streak_updated_at)
+        SELECT $1, 0, 0, 1, 1, 0, 0,
+               COALESCE($2::timestamptz, CURRENT_TIMESTAMP) AT TIME ZONE 'UTC'
+        WHERE NOT EXISTS (SELECT 1 FROM user_stats WHERE user_id = $1)
+    """
+
+    by_word = {}
+    for update, at in zip(updates, occurred_at or [None] * len(updates)):
+        by_word[update.word_id] = (
+            update,
+            at.replace(tzinfo=timezone.utc) if at is not None else None,
+        )
+    updates = [update for update, _ in by_word.values()]
+    answered_times = [at for _, at in by_word.values()]
+    params = [
+        user_id,
+        [update.word_id for update in updates],
+        [update.recognition_mastery_score for update in updates],
+        [update.usage_mastery_score for update in updates],
+        [update.practice_count for update in updates],
+        [update.success_count for update in updates],
+        [update.number_of_times_to_practice for update in updates],
+        practice_time,
+        answered_times,
+    ]
+
+    records = await conn.fetch(query, *params)
+    if len(records) < len(updates):
+        # A row was inserted concurrently after our snapshot; running the
+        # statement again updates it like any existing row. The session
+        # time was already added by the first run.
+        params[7] = 0
+        records = await conn.fetch(query, *params)
+
+    if records and not records[0]["has_stats"]:
+        latest = max((at for at in answered_times if at is not None), default=None)
+        await conn.execute(create_stats_query, user_id, latest)
+    return records
+
+
+async def insert_practice_session(
+    conn: asyncpg.Connection,
+    user_id: int,
+    practice_time: int,
+    session_type: str,
+) -> None:
+    query = """
+        WITH session AS (
+            INSERT INTO user_practice_sessions
+            (user_id, practice_time, session_type)
+            VALUES ($1, $2, $3)
+        )
+        UPDATE user_stats
+        SET total_practice_time = total_practice_time + $2
+        WHERE user_id = $1
+    """
+    await conn.execute(query, user_id, practice_time, session_type)
+
+
+async def record_daily_activity(
+    conn: asyncpg.Connection,
+    user_id: int,
+    words_practiced: int = 0,
+    practice_time: int = 0,
+) -> None:
+    """Adds to the user's daily_activity row for their current local day
+    and to today's UTC leaderboard bucket."""
+    query = f"""
+        WITH {activity_ctes("$1", words_practiced="$2", practice_time="$3")}
+        SELECT 1
+    """
+    await conn.execute(query, user_id, words_practiced, practice_time)
@@ -2,9 +2,9 @@ import asyncpg
 from app.config.db import get_pool
 from fastapi import Depends
 from app.models.quiz import Quiz, QuizCreate
+from app.models.word import WordNotFoundError
 from typing import List, Dict, Any
-from app.models.word import Word
-from app.models.user import WordProgress
+import json
 
 
 class QuizService:
@@ -12,9 +12,18 @@ class QuizService:
         self.pool = pool
 
     async def insert_quiz(self, quiz: QuizCreate) -> Quiz:
+        # Bumping words.quiz_count locks the word row, so concurrent inserts for
+        # the same word are handed consecutive ordinals 0..quiz_count - 1.
         query = """
-        INSERT INTO quizzes (word_id, quiz_type, question, options, correct_options)
-        VALUES ($1, $2, $3, $4, $5)
+        WITH counter AS (
+            UPDATE words
+            SET quiz_count = quiz_count + 1
+            WHERE id = $1
+            RETURNING quiz_count
+        )
+        INSERT INTO quizzes (word_id, ordinal, quiz_type, question, options, correct_options)
+        SELECT $1, counter.quiz_count - 1, $2, $3, $4, $5
+        FROM counter
         RETURNING *
         """
         values = (
@@ -26,15 +35,23 @@ class QuizService:
         )
         try:
             quiz_record = await self.pool.fetchrow(query, *values)
+            if quiz_record is None:
+                raise WordNotFoundError(f"Word with ID {quiz.word_id} not found")
             return Quiz(**quiz_record)
+        except WordNotFoundError:
+            raise
         except Exception as e:
             raise Exception(f"Error inserting quiz: {str(e)}")
 
     async def get_random_quiz_by_word_id(self, word_id: int) -> Quiz:
         query = """
-        SELECT * FROM quizzes WHERE word_id = $1
-        ORDER BY RANDOM()
-        LIMIT 1
+        SELECT q.*
+        FROM words w
+        CROSS JOIN LATERAL (
+            SELECT FLOOR(RANDOM() * w.quiz_count)::int AS ordinal
+        ) pick
+        JOIN quizzes q ON q.word_id = w.id AND q.ordinal = pick.ordinal
+        WHERE w.id = $1
         """
         try:
             quiz_record = await self.pool.fetchrow(query, word_id)
@@ -44,13 +61,13 @@ class QuizService:
 
     async def get_random_quizzes_by_word_ids(self, word_ids: List[int]) -> List[Quiz]:
         query = """
-        WITH RandomizedQuizzes AS (
-            SELECT *, ROW_NUMBER() OVER (PARTITION BY word_id ORDER BY RANDOM()) as rn
-            FROM quizzes
-            WHERE word_id = ANY($1)
-        )
-        SELECT * FROM RandomizedQuizzes
-        WHERE rn = 1
+        SELECT q.*
+        FROM words w
+        CROSS JOIN LATERAL (
+            SELECT FLOOR(RANDOM() * w.quiz_count)::int AS ordinal
+        ) pick
+        JOIN quizzes q ON q.word_id = w.id AND q.ordinal = pick.ordinal
+        WHERE w.id = ANY($1)
         """
         try:
             quizzes = await self.pool.fetch(query, word_ids)
@@ -59,115 +76,117 @@ class QuizService:
             raise Exception(f"Error fetching random quizzes by word_ids: {str(e)}")
 
     async def get_daily_words_with_quizzes(self, user_id: int) -> List[Dict[str, Any]]:
-        query_word_ids = """
-        WITH RankedWords AS (
-            SELECT 
-                w.id,
-                wp.recognition_mastery_score,
-                wp.updated_at,
-                CASE 
-                    WHEN wp.recognition_mastery_score BETWEEN 1 AND 3 THEN 1
-                    WHEN wp.recognition_mastery_score < 3 THEN 2
-                    ELSE 3
-                END as priority
-            FROM words w
-            JOIN word_progress wp ON w.id = wp.word_id
-            JOIN list_words lw ON w.id = lw.word_id
-            JOIN user_lists ul ON ul.list_id = lw.list_id
+        # The whole daily payload (goal, word selection, one random quiz per word
+        # and the user's progress) is assembled by Postgres as a single JSON
+        # document, keyed the same way the API models serialize (camelCase).
+        query = """
+        WITH daily_goal AS (
+            SELECT COALESCE(
+                (SELECT daily_word_goal FROM user_preferences WHERE user_id = $1),
+                5
+            ) AS goal
+        ),
+        subscribed AS NOT MATERIALIZED (
+            SELECT wp.word_id, wp.next_due_at, wp.recognition_mastery_score
+            FROM word_progress wp
             WHERE wp.user_id = $1
-            AND ul.user_id = $1
-            AND wp.recognition_mastery_score <= 4  -- THRESHOLD FOR WORDS TO BE PRACTICED
-        )
-        SELECT DISTINCT id, priority, updated_at
-        FROM RankedWords
-        ORDER BY priority, updated_at ASC
-        LIMIT $2;  
-        """
-
-        query_words = """
-        SELECT * FROM words WHERE id = ANY($1)
-        """
-
-        # one random quiz per word using a window function
-        query_quizzes = """
-        WITH RankedQuizzes AS (
-            SELECT *, ROW_NUMBER() OVER (PARTITION BY word_id ORDER BY RANDOM()) as rn
-            FROM quizzes
-            WHERE word_id = ANY($1)
-        )
-        SELECT * FROM RankedQuizzes WHERE rn = 1
-        """
-
-        # progress information for each word
-        query_progress = """
-        SELECT * FROM word_progress
-        WHERE user_id = $1 AND word_id = ANY($2)
-        """
-
-        daily_word_goal_query = """
-        SELECT daily_word_goal FROM user_preferences WHERE user_id = $1
-        """
-
-        try:
-            daily_word_goal_record = await self.pool.fetchrow(
-                daily_word_goal_query, user_id
-            )
-            daily_word_goal = (
-                daily_word_goal_record["daily_word_goal"]
-                if daily_word_goal_record
-                else 5
+            AND EXISTS (
+                SELECT 1
+                FROM list_words lw
+                JOIN user_lists ul ON ul.list_id = lw.list_id
+                WHERE lw.word_id = wp.word_id AND ul.user_id = $1
             )
-
-            word_records = await self.pool.fetch(
-                query_word_ids, user_id, daily_word_goal
-            )
-
-            word_ids = [record["id"] for record in word_records]
-
-            if not word_ids:
-                return []
-
-            words_records = await self.pool.fetch(query_words, word_ids)
-            quizzes_records = await self.pool.fetch(query_quizzes, word_ids)
-            progress_records = await self.pool.fetch(query_progress, user_id, word_ids)
-
-            quizzes_dict = {}
-            for quiz_record in quizzes_records:
-                quiz = Quiz(**dict(quiz_record))
-                quizzes_dict[quiz.word_id] = quiz
-
-            progress_dict = {}
-            for progress_record in progress_records:
-                progress = WordProgress(**dict(progress_record))
-                progress_dict[progress.word_id] = progress
-
-            words_with_quizzes = []
-            for word_record in words_records:
-                word_dict = dict(word_record)
-                word_id = word_dict["id"]
-
-                quiz = quizzes_dict.get(word_id)
-                if quiz:
-                    word_dict["quiz"] = quiz.model_dump(
-                        by_alias=True, exclude_none=False
-                    )
-                else:
-                    word_dict["quiz"] = None
-
-                progress = progress_dict.get(word_id)
-                if progress:
-                    word_dict["word_progress"] = progress.model_dump(
-                        by_alias=True, exclude_none=False
+        ),
+        due_words AS (
+            -- Words whose review is due come first, in due order, whatever their
+            -- mastery. A short day is topped up with the not yet mastered words
+            -- (recognition mastery up to 4) that are due soonest. Both branches
+            -- read the (user_id, next_due_at) index and stop at the goal.
+            SELECT word_id, next_due_at
+            FROM (
+                (
+                    SELECT word_id, next_due_at
+                    FROM subscribed
+                    WHERE next_due_at <= CURRENT_TIMESTAMP
+                    ORDER BY next_due_at ASC
+                    LIMIT (SELECT goal FROM daily_goal)
+                )
+                UNION ALL
+                (
+                    SELECT word_id, next_due_at
+                    FROM subscribed
+                    WHERE next_due_at > CURRENT_TIMESTAMP
+                    AND recognition_mastery_score <= 4
+                    ORDER BY next_due_at ASC
+                    LIMIT (SELECT goal FROM daily_goal)
+                )
+            ) candidates
+            ORDER BY next_due_at ASC
+            LIMIT (SELECT goal FROM daily_goal)
+        )
+        SELECT COALESCE(
+            json_agg(
+                json_build_object(
+                    'id', w.id,
+                    'createdAt', w.created_at,
+                    'updatedAt', w.updated_at,
+                    'word', w.word,
+                    'definition', w.definition,
+                    'partOfSpeech', w.part_of_speech,
+                    'difficultyLevel', w.difficulty_level,
+                    'etymology', w.etymology,
+                    'usageNotes', w.usage_notes,
+                    'audioUrl', w.audio_url,
+                    'imageUrl', w.image_url,
+                    'examples', w.examples,
+                    'synonyms', w.synonyms,
+                    'antonyms', w.antonyms,
+                    'tags', w.tags,
+                    'quiz', CASE WHEN q.id IS NULL THEN NULL ELSE json_build_object(
+                        'id', q.id,
+                        'createdAt', q.created_at,
+                        'updatedAt', q.updated_at,
+                        'wordId', q.word_id,
+                        'quizType', q.quiz_type,
+                        'question', q.question,
+                        'options', q.options,
+                        'correctOptions', q.correct_options
+                    ) END,
+                    'wordProgress', json_build_object(
+                        'id', NULL,
+                        'createdAt', wp.created_at,
+                        'updatedAt', wp.updated_at,
+                        'userId', wp.user_id,
+                        'wordId', wp.word_id,
+                        'recognitionMasteryScore', wp.recognition_mastery_score,
+                        'usageMasteryScore', wp.usage_mastery_score,
+                        'practiceCount', wp.practice_count,
+                        'successCount', wp.success_count,
+                        'lastPracticed', NULL,
+                        'numberOfTimesToPractice', wp.number_of_times_to_practice,
+                        'repetitions', wp.repetitions,
+                        'intervalDays', wp.interval_days,
+                        'easeFactor', wp.ease_factor,
+                        'nextDueAt', wp.next_due_at
                     )
-                else:
-                    word_dict["word_progress"] = None
-
-                word = Word(**word_dict)
-                words_with_quizzes.append(
-                    word.model_dump(by_alias=True, exclude_none=False)
                 )
+                ORDER BY dw.next_due_at
+            ),
+            '[]'
+        ) AS words
+        FROM due_words dw
+        JOIN words w ON w.id = dw.word_id
+        JOIN word_progress wp ON wp.user_id = $1 AND wp.word_id = dw.word_id
+        -- one random quiz per word, looked up by its ordinal
+        CROSS JOIN LATERAL (
+            SELECT FLOOR(RANDOM() * w.quiz_count)::int AS ordinal
+        ) pick
+        LEFT JOIN quizzes q ON q.word_id = w.id AND q.ordinal = pick.ordinal
+        """
 
-            return words_with_quizzes
+        try:
+            words_json = await self.pool.fetchval(query, user_id)
+            return json.loads(words_json) if words_json else []
         except Exception as e:
             raise Exception(f"Error fetching daily words with quizzes: {str(e)}")
 
@@ -0,0 +1,56 @@
+"""SM-2 spaced repetition scheduling for word_progress.
+
+The schedule is expressed as SQL so it can be applied inside the statement that
+writes the progress row, whether that is a single-row update or a set-based
+upsert. Answers are binary in the app, so a correct answer is graded as quality
+4 (ease factor unchanged) and an incorrect one as quality 1.
+"""
+
+DEFAULT_EASE_FACTOR = 2.5
+MIN_EASE_FACTOR = 1.3
+# EF' = EF + (0.1 - (5 - q) * (0.08 + (5 - q) * 0.02)) with q = 1
+FAILED_EASE_PENALTY = 0.54
+
+
+def sm2_set_clauses(
+    answered: str,
+    correct: str,
+    current: str = "word_progress",
+    now: str = "CURRENT_TIMESTAMP",
+) -> str:
+    """Return the SET clauses that advance the review schedule of a row.
+
+    ``answered`` and ``correct`` are SQL boolean expressions, ``current`` is the
+    name under which the pre-update row is visible (the table name in a plain
+    UPDATE or in ``ON CONFLICT DO UPDATE``). ``now`` is the time the answer was
+    given, from which the next review is scheduled.
+    """
+    c = current
+    new_interval = f"""
+        CASE
+            WHEN NOT ({correct}) THEN 1
+            WHEN {c}.repetitions = 0 THEN 1
+            WHEN {c}.repetitions = 1 THEN 6
+            ELSE GREATEST(1, ROUND({c}.interval_days * {c}.ease_factor))::int
+        END
+    """
+    return f"""
+        repetitions = CASE
+            WHEN NOT ({answered}) THEN {c}.repetitions
+            WHEN {correct} THEN {c}.repetitions + 1
+            ELSE 0
+        END,
+        interval_days = CASE
+            WHEN NOT ({answered}) THEN {c}.interval_days
+            ELSE {new_interval}
+        END,
+        ease_factor = CASE
+            WHEN ({answered}) AND NOT ({correct})
+                THEN GREATEST({MIN_EASE_FACTOR}, {c}.ease_factor - {FAILED_EASE_PENALTY})
+            ELSE {c}.ease_factor
+        END,
+        next_due_at = CASE
+            WHEN NOT ({answered}) THEN {c}.next_due_at
+            ELSE {now} + make_interval(days => {new_interval})
+        END
+    """
@@ -0,0 +1,214 @@
+from app.config.env import env
+from app.models.llm import SentenceCheckResponse
+from app.utils.cache import TTLCache
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import asyncpg
+import hashlib
+import json
+import logging
+import re
+import unicodedata
+
+
+logger = logging.getLogger("sentence_cache")
+
+_PUNCTUATION = re.compile(r"[^\w\s']")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = text.replace("’", "'")
+    text = _PUNCTUATION.sub(" ", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def sentence_cache_key(word: str, sentence: str) -> str:
+    """Sentences differing only in casing, punctuation or spacing share a key."""
+    normalized = f"{normalize_text(word)}\n{normalize_text(sentence)}"
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+class SentenceCheckCache:
+    """Two-tier cache of sentence check verdicts.
+
+    A per-worker TTLCache sits in front of the sentence_check_cache table,
+    which is shared by all workers and survives restarts. Rows older than
+    ``ttl`` are ignored and purged, and the table is trimmed to ``max_rows``
+    (newest kept) every ``prune_every`` writes. Pruning runs in the
+    background, one at a time, so no request waits for it.
+    """
+
+    def __init__(
+        self, ttl: int, max_rows: int, memory_size: int, prune_every: int = 100
+    ):
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self.prune_every = prune_every
+        self.memory = TTLCache(maxsize=memory_size, ttl=ttl)
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.tokens_saved = 0
+        self.prunes = 0
+        self._writes = 0
+        self._prune_task: Optional[asyncio.Task] = None
+
+    async def get(
+        self, pool: asyncpg.Pool, key: str
+    ) -> Optional[SentenceCheckResponse]:
+        entry = self.memory.get(key)
+        if entry is not None:
+            self.memory_hits += 1
+            return self._hit(entry)
+
+        query = """
+            SELECT response, prompt_tokens, completion_tokens
+            FROM sentence_check_cache
+            WHERE cache_key = $1
+              AND created_at > CURRENT_TIMESTAMP - make_interval(secs => $2)
+        """
+        try:
+            record = await pool.fetchrow(query, key, self.ttl)
+        except Exception as e:
+            logger.error(f"Error reading sentence check cache: {e}")
+            record = None
+
+        if record is None:
+            self.misses += 1
+            return None
+
+        entry = (
+            SentenceCheckResponse(**json.loads(record["response"])),
+            record["prompt_tokens"] + record["completion_tokens"],
+        )
+        self.memory.set(key, entry)
+        self.db_hits += 1
+        return self._hit(entry)
+
+    async def get_many(
+        self, pool: asyncpg.Pool, keys: List[str]
+    ) -> Dict[str, SentenceCheckResponse]:
+        """Like ``get`` for several keys, reading the table in one query."""
+        found: Dict[str, SentenceCheckResponse] = {}
+        missing = []
+        for key in keys:
+            entry = self.memory.get(key)
+            if entry is not None:
+                self.memory_hits += 1
+                found[key] = self._hit(entry)
+            else:
+                missing.append(key)
+        if not missing:
+            return found
+
+        query = """
+            SELECT cache_key, response, prompt_tokens, completion_tokens
+            FROM sentence_check_cache
+            WHERE cache_key = ANY($1::text[])
+              AND created_at > CURRENT_TIMESTAMP - make_interval(secs => $2)
+        """
+        try:
+            records = await pool.fetch(query, missing, self.ttl)
+        except Exception as e:
+            logger.error(f"Error reading sentence check cache: {e}")
+            records = []
+
+        for record in records:
+            entry = (
+                SentenceCheckResponse(**json.loads(record["response"])),
+                record["prompt_tokens"] + record["completion_tokens"],
+            )
+            self.memory.set(record["cache_key"], entry)
+            self.db_hits += 1
+            found[record["cache_key"]] = self._hit(entry)
+        self.misses += len(missing) - len(records)
+        return found
+
+    async def set(
+        self,
+        pool: asyncpg.Pool,
+        key: str,
+        word: str,
+        sentence: str,
+        response: SentenceCheckResponse,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+    ) -> None:
+        self.memory.set(key, (response, prompt_tokens + completion_tokens))
+
+        query = """
+            INSERT INTO sentence_check_cache
+            (cache_key, word, sentence, response, prompt_tokens, completion_tokens)
+            VALUES ($1, $2, $3, $4::jsonb, $5, $6)
+            ON CONFLICT (cache_key) DO UPDATE
+            SET response = EXCLUDED.response,
+                prompt_tokens = EXCLUDED.prompt_tokens,
+                completion_tokens = EXCLUDED.completion_tokens,
+                created_at = CURRENT_TIMESTAMP
+        """
+        try:
+            await pool.execute(
+                query,
+                key,
+                normalize_text(word),
+                normalize_text(sentence),
+                response.model_dump_json(),
+                prompt_tokens,
+                completion_tokens,
+            )
+            self._writes += 1
+            if self._writes % self.prune_every == 0:
+                self._schedule_prune(pool)
+        except Exception as e:
+            logger.error(f"Error writing sentence check cache: {e}")
+
+    def _schedule_prune(self, pool: asyncpg.Pool) -> None:
+        # A prune still running covers this one
+        if self._prune_task is None or self._prune_task.done():
+            self._prune_task = asyncio.create_task(self._run_prune(pool))
+
+    async def _run_prune(self, pool: asyncpg.Pool) -> None:
+        try:
+            await self.prune(pool)
+            self.prunes += 1
+        except Exception as e:
+            logger.error(f"Error pruning sentence check cache: {e}")
+
+    async def prune(self, pool: asyncpg.Pool) -> None:
+        query = """
+            DELETE FROM sentence_check_cache
+            WHERE created_at <= CURRENT_TIMESTAMP - make_interval(secs => $1)
+               OR cache_key IN (
+                    SELECT cache_key FROM sentence_check_cache
+                    ORDER BY created_at DESC
+                    OFFSET $2
+               )
+        """
+        await pool.execute(query, self.ttl, self.max_rows)
+
+    def _hit(self, entry: Tuple[SentenceCheckResponse, int]) -> SentenceCheckResponse:
+        response, tokens = entry
+        self.tokens_saved += tokens
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self.memory_hits + self.db_hits
+        lookups = hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "tokens_saved": self.tokens_saved,
+            "prunes": self.prunes,
+            "memory": self.memory.stats(),
+        }
+
+
+sentence_check_cache = SentenceCheckCache(
+    ttl=env.sentence_cache_ttl,
+    max_rows=env.sentence_cache_max_rows,
+    memory_size=env.sentence_cache_memory_size,
+)
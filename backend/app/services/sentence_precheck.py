@@ -0,0 +1,347 @@
+from app.models.llm import SentenceCheckResponse
+from app.services.sentence_cache import normalize_text
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Set
+import re
+
+VOWELS = set("aeiou")
+
+SUFFIXES_BY_PART_OF_SPEECH = {
+    "noun": ["s", "es", "'s", "s'", "ful", "less", "ish"],
+    "verb": ["s", "es", "d", "ed", "ing", "er", "ers", "ment", "ments", "able"],
+    "adjective": ["er", "est", "ly", "ily", "ally", "ness", "ity"],
+    "other": ["ible", "ion", "ions", "ation", "ations", "ive", "al"],
+}
+# The word's own part of speech is not trusted to narrow these, so that no
+# valid form is missed
+SUFFIXES = sorted({s for group in SUFFIXES_BY_PART_OF_SPEECH.values() for s in group})
+
+# Irregular verb forms, matched on the end of the word so compounds such as
+# "undertake" -> "undertook" are covered too
+IRREGULAR_VERB_ENDINGS = {
+    "arise": ["arose", "arisen"],
+    "awake": ["awoke", "awoken"],
+    "be": ["am", "is", "are", "was", "were", "been", "being"],
+    "bear": ["bore", "borne", "born"],
+    "beat": ["beaten"],
+    "become": ["became"],
+    "begin": ["began", "begun"],
+    "bend": ["bent"],
+    "bet": ["betting"],
+    "bid": ["bade", "bidden"],
+    "bind": ["bound"],
+    "bite": ["bit", "bitten"],
+    "bleed": ["bled"],
+    "blow": ["blew", "blown"],
+    "break": ["broke", "broken"],
+    "breed": ["bred"],
+    "bring": ["brought"],
+    "build": ["built"],
+    "burn": ["burnt"],
+    "buy": ["bought"],
+    "catch": ["caught"],
+    "choose": ["chose", "chosen"],
+    "cling": ["clung"],
+    "come": ["came"],
+    "creep": ["crept"],
+    "deal": ["dealt"],
+    "dig": ["dug"],
+    "do": ["does", "did", "done"],
+    "draw": ["drew", "drawn"],
+    "dream": ["dreamt"],
+    "drink": ["drank", "drunk"],
+    "drive": ["drove", "driven"],
+    "dwell": ["dwelt"],
+    "eat": ["ate", "eaten"],
+    "fall": ["fell", "fallen"],
+    "feed": ["fed"],
+    "feel": ["felt"],
+    "fight": ["fought"],
+    "find": ["found"],
+    "flee": ["fled"],
+    "fling": ["flung"],
+    "fly": ["flew", "flown", "flies"],
+    "forbid": ["forbade", "forbidden"],
+    "forget": ["forgot", "forgotten"],
+    "forgive": ["forgave", "forgiven"],
+    "forsake": ["forsook", "forsaken"],
+    "freeze": ["froze", "frozen"],
+    "get": ["got", "gotten"],
+    "give": ["gave", "given"],
+    "go": ["goes", "went", "gone"],
+    "grind": ["ground"],
+    "grow": ["grew", "grown"],
+    "hang": ["hung"],
+    "have": ["has", "had", "having"],
+    "hear": ["heard"],
+    "hide": ["hid", "hidden"],
+    "hold": ["held"],
+    "keep": ["kept"],
+    "kneel": ["knelt"],
+    "know": ["knew", "known"],
+    "lay": ["laid"],
+    "lead": ["led"],
+    "lean": ["leant"],
+    "leap": ["leapt"],
+    "learn": ["learnt"],
+    "leave": ["left"],
+    "lend": ["lent"],
+    "lie": ["lay", "lain", "lying"],
+    "light": ["lit"],
+    "lose": ["lost"],
+    "make": ["made"],
+    "mean": ["meant"],
+    "meet": ["met"],
+    "pay": ["paid"],
+    "ride": ["rode", "ridden"],
+    "ring": ["rang", "rung"],
+    "rise": ["rose", "risen"],
+    "run": ["ran"],
+    "say": ["said"],
+    "see": ["saw", "seen"],
+    "seek": ["sought"],
+    "sell": ["sold"],
+    "send": ["sent"],
+    "sew": ["sewn"],
+    "shake": ["shook", "shaken"],
+    "shine": ["shone"],
+    "shoot": ["shot"],
+    "show": ["shown"],
+    "shrink": ["shrank", "shrunk"],
+    "sing": ["sang", "sung"],
+    "sink": ["sank", "sunk"],
+    "sit": ["sat"],
+    "slay": ["slew", "slain"],
+    "sleep": ["slept"],
+    "slide": ["slid"],
+    "sling": ["slung"],
+    "smell": ["smelt"],
+    "speak": ["spoke", "spoken"],
+    "speed": ["sped"],
+    "spell": ["spelt"],
+    "spend": ["spent"],
+    "spill": ["spilt"],
+    "spin": ["spun"],
+    "spit": ["spat"],
+    "spoil": ["spoilt"],
+    "spring": ["sprang", "sprung"],
+    "stand": ["stood"],
+    "steal": ["stole", "stolen"],
+    "stick": ["stuck"],
+    "sting": ["stung"],
+    "stink": ["stank", "stunk"],
+    "stride": ["strode", "stridden"],
+    "strike": ["struck", "stricken"],
+    "string": ["strung"],
+    "strive": ["strove", "striven"],
+    "swear": ["swore", "sworn"],
+    "sweep": ["swept"],
+    "swell": ["swollen"],
+    "swim": ["swam", "swum"],
+    "swing": ["swung"],
+    "take": ["took", "taken"],
+    "teach": ["taught"],
+    "tear": ["tore", "torn"],
+    "tell": ["told"],
+    "think": ["thought"],
+    "throw": ["threw", "thrown"],
+    "tread": ["trod", "trodden"],
+    "wake": ["woke", "woken"],
+    "wear": ["wore", "worn"],
+    "weave": ["wove", "woven"],
+    "weep": ["wept"],
+    "win": ["won"],
+    "wind": ["wound"],
+    "wring": ["wrung"],
+    "write": ["wrote", "written"],
+}
+
+# Irregular plurals, comparisons and other whole-word forms
+IRREGULAR_FORMS = {
+    "man": ["men"],
+    "woman": ["women"],
+    "child": ["children"],
+    "person": ["people"],
+    "mouse": ["mice"],
+    "louse": ["lice"],
+    "goose": ["geese"],
+    "foot": ["feet"],
+    "tooth": ["teeth"],
+    "die": ["dice"],
+    "good": ["better", "best", "well"],
+    "well": ["better", "best"],
+    "bad": ["worse", "worst", "badly"],
+    "ill": ["worse", "worst"],
+    "far": ["farther", "farthest", "further", "furthest"],
+    "little": ["less", "least"],
+    "many": ["more", "most"],
+    "much": ["more", "most"],
+    "old": ["elder", "eldest"],
+}
+
+# Latin and Greek plural endings: singular ending -> plural ending
+CLASSICAL_PLURALS = [
+    ("is", "es"),
+    ("us", "i"),
+    ("um", "a"),
+    ("on", "a"),
+    ("a", "ae"),
+    ("ex", "ices"),
+    ("ix", "ices"),
+]
+
+# Tokens at least this similar to the word are taken as a possible form, which
+# covers irregular forms missing from the tables above (weep/wept, feed/fed)
+SIMILARITY_THRESHOLD = 0.7
+
+
+def tokenize(sentence: str) -> List[str]:
+    return [token.strip("'") for token in normalize_text(sentence).split()]
+
+
+def word_forms(word: str) -> Set[str]:
+    """Spellings that may be an inflection or derivation of ``word``."""
+    base = normalize_text(word)
+
+    stems = {base}
+    if base.endswith("e"):
+        stems.add(base[:-1])
+    if base.endswith("ie"):
+        stems.add(base[:-2] + "y")
+    if len(base) > 1 and base.endswith("y") and base[-2] not in VOWELS:
+        stems.add(base[:-1] + "i")
+    if base.endswith("le"):
+        stems.add(base[:-2])
+    if base.endswith("ic"):
+        stems.add(base + "k")
+    if (
+        len(base) > 2
+        and base[-1] not in VOWELS | {"w", "x", "y"}
+        and base[-2] in VOWELS
+    ):
+        stems.add(base + base[-1])
+
+    forms = {base}
+    for stem in stems:
+        forms.update(stem + suffix for suffix in SUFFIXES)
+    if base.endswith("le"):
+        forms.add(base[:-1] + "y")
+
+    if base.endswith("fe"):
+        forms.update({base[:-2] + "ves", base[:-2] + "ved"})
+    elif base.endswith("f"):
+        forms.update({base[:-1] + "ves", base[:-1] + "ved"})
+
+    for singular, plural in CLASSICAL_PLURALS:
+        if base.endswith(singular):
+            forms.add(base[: len(base) - len(singular)] + plural)
+
+    for ending, irregular in IRREGULAR_VERB_ENDINGS.items():
+        if base.endswith(ending):
+            prefix = base[: len(base) - len(ending)]
+            forms.update(prefix + form for form in irregular)
+
+    forms.update(IRREGULAR_FORMS.get(base, []))
+    return forms
+
+
+def may_be_form_of(token: str, word: str, forms: Set[str]) -> bool:
+    if token in forms:
+        return True
+    # Compounds and prefixed forms (unhappy, daydream)
+    if len(word) >= 4 and word in token:
+        return True
+    root_length = max(4, len(word) - 3)
+    if len(word) >= 4 and token[:root_length] == word[:root_length]:
+        return True
+    return SequenceMatcher(None, token, word).ratio() >= SIMILARITY_THRESHOLD
+
+
+class SentencePrecheck:
+    """Answers sentence checks whose outcome is certain without the LLM.
+
+    Returns a verdict for empty and one-word submissions, for sentences copied
+    from the word's stored examples, and for sentences in which no token could
+    be a form of the word. That last rule is deliberately conservative: regular
+    suffixes, tables of irregular verbs, plurals and comparisons, shared roots
+    and close spellings all count as a possible use, and anything that might be
+    one is left to the model.
+    """
+
+    def __init__(self):
+        self.checked = 0
+        self.short_circuited: Dict[str, int] = {}
+        self.llm_calls = 0
+        self.llm_seconds = 0.0
+
+    def check(
+        self,
+        word: str,
+        sentence: str,
+        examples: Optional[List[str]] = None,
+    ) -> Optional[SentenceCheckResponse]:
+        self.checked += 1
+        verdict = self._check(word, sentence, examples or [])
+        if verdict is not None:
+            reason, response = verdict
+            self.short_circuited[reason] = self.short_circuited.get(reason, 0) + 1
+            return response
+        return None
+
+    def _check(self, word: str, sentence: str, examples: List[str]):
+        tokens = tokenize(sentence)
+        example = examples[0] if examples else None
+
+        if len(tokens) <= 1:
+            return "single_token", SentenceCheckResponse(
+                isCorrect=False,
+                correctUsage=example,
+                message=f"Write a complete sentence that uses the word '{word}'.",
+            )
+
+        normalized_sentence = " ".join(tokens)
+        for stored in examples:
+            if " ".join(tokenize(stored)) == normalized_sentence:
+                return "copied_example", SentenceCheckResponse(
+                    isCorrect=True,
+                    correctUsage=stored,
+                    message=f"That is one of the example sentences for '{word}'. "
+                    "Try writing a sentence of your own to practice using it.",
+                )
+
+        # Phrases and very short words are always left to the model
+        base = normalize_text(word)
+        if len(base) >= 3 and re.fullmatch(r"[a-z]+", base):
+            forms = word_forms(base)
+            if not any(may_be_form_of(token, base, forms) for token in tokens):
+                return "word_missing", SentenceCheckResponse(
+                    isCorrect=False,
+                    correctUsage=example,
+                    message=f"Your sentence doesn't use the word '{word}'. "
+                    "Try again with the word in your sentence.",
+                )
+
+        return None
+
+    def record_llm_latency(self, seconds: float) -> None:
+        self.llm_calls += 1
+        self.llm_seconds += seconds
+
+    def stats(self) -> Dict[str, Any]:
+        short_circuited = sum(self.short_circuited.values())
+        average_llm_ms = (
+            self.llm_seconds / self.llm_calls * 1000 if self.llm_calls else 0.0
+        )
+        return {
+            "checked": self.checked,
+            "short_circuited": short_circuited,
+            "short_circuit_rate": (
+                short_circuited / self.checked if self.checked else 0.0
+            ),
+            "by_reason": dict(self.short_circuited),
+            "average_llm_ms": round(average_llm_ms, 2),
+            "estimated_ms_saved": round(short_circuited * average_llm_ms, 2),
+        }
+
+
+sentence_precheck = SentencePrecheck()
@@ -1,9 +1,21 @@
 import asyncpg
-from app.models.base import PaginatedPayload, PageInfo
+from app.models.base import (
+    PaginatedPayload,
+    PageInfo,
+    CursorPaginatedPayload,
+    CursorPageInfo,
+)
+from app.utils.pagination import (
+    InvalidCursorError,
+    encode_cursor,
+    decode_cursor,
+    cursor_id,
+)
 from app.models.user import (
     UserCreate,
     UserUpdate,
     WordProgressUpdate,
+    WordProgressBatchUpdate,
     WordProgress,
     UserStats,
     UserStatsUpdate,
@@ -19,10 +31,25 @@ from app.config.db import get_pool
 from fastapi import Depends
 from app.models.user import User, UserList, UserPreferences
 from app.services.lists import ListService, get_list_service
+from app.services.leaderboard import LeaderboardService
+from app.services.progress import (
+    apply_word_progress,
+    insert_practice_session,
+    record_daily_activity,
+)
+from app.services.write_behind import write_behind
+from app.services.events import event_log, DIAMONDS, PRACTICE_SESSION
+from app.config.env import env
+from app.services.identity import (
+    identity_cache,
+    identity_listener,
+    invalidate_identity,
+)
 from app.models.list import WordList
 from typing import List, Optional
-from datetime import datetime, timedelta
-import pytz
+from datetime import datetime
+import asyncio
+import json
 
 
 class UserNotFoundError(Exception):
@@ -73,19 +100,29 @@ class UserService:
             raise Exception(f"Error fetching user by email: {str(e)}")
 
     async def get_user_by_id(self, user_id: int) -> User:
-        query = "SELECT * FROM users WHERE id = $1"
-        preferences_query = "SELECT * FROM user_preferences WHERE user_id = $1"
+        query = """
+            SELECT u.*, to_jsonb(p) AS preferences
+            FROM users u
+            LEFT JOIN user_preferences p ON p.user_id = u.id
+            WHERE u.id = $1
+        """
         try:
-            user_record = await self.pool.fetchrow(query, user_id)
+            # Both reads are side-effect free, so they run concurrently; default
+            # stats are only created once the user is known to exist
+            user_record, stats_record = await asyncio.gather(
+                self.pool.fetchrow(query, user_id),
+                self._fetch_user_stats_record(user_id),
+            )
             if user_record is None:
                 raise UserNotFoundError(f"User with ID {user_id} not found")
-            preferences_record = await self.pool.fetchrow(preferences_query, user_id)
-            if preferences_record is None:
+            if user_record["preferences"] is None:
                 raise UserNotFoundError(f"User preferences with ID {user_id} not found")
-            full_user_stats = await self.get_user_stats(user_id)
+            full_user_stats = await self._build_user_stats(user_id, stats_record)
+            user_data = dict(user_record)
+            preferences = json.loads(user_data.pop("preferences"))
             return User(
-                **user_record,
-                preferences=UserPreferences(**preferences_record),
+                **user_data,
+                preferences=UserPreferences(**preferences),
                 user_stats=full_user_stats,
             )
         except Exception as e:
@@ -94,12 +131,18 @@ class UserService:
             raise Exception(f"Error fetching user by ID: {str(e)}")
 
     async def get_user_by_clerk_id(self, clerk_id: str) -> User:
+        use_cache = identity_listener.is_listening
+        if use_cache:
+            user = identity_cache.get(clerk_id)
+            if user is not None:
+                return user
+
         query = "SELECT * FROM users WHERE clerk_id = $1"
         try:
             user_record = await self.pool.fetchrow(query, clerk_id)
             if user_record is None:
                 raise UserNotFoundError(f"User with Clerk ID {clerk_id} not found")
-            return User(
+            user = User(
                 id=user_record["id"],
                 username=user_record["username"],
                 email=user_record["email"],
@@ -111,6 +154,9 @@ class UserService:
                 created_at=user_record["created_at"],
                 updated_at=user_record["updated_at"],
             )
+            if use_cache:
+                identity_cache.set(clerk_id, user)
+            return user
         except Exception as e:
             if isinstance(e, UserNotFoundError):
                 raise e
@@ -207,6 +253,7 @@ class UserService:
                 raise UserNotFoundError(
                     f"User with Clerk ID {clerk_id} not found for update"
                 )
+            await invalidate_identity(self.pool, clerk_id)
 
             if "preferences" in update_fields and update_fields["preferences"]:
                 current_prefs_query = """
@@ -324,6 +371,7 @@ class UserService:
         query = "DELETE FROM users WHERE clerk_id = $1"
         try:
             result = await self.pool.execute(query, clerk_id)
+            await invalidate_identity(self.pool, clerk_id)
             return result == "DELETE 1"
         except Exception as e:
             raise Exception(f"Error deleting user with Clerk ID {clerk_id}: {str(e)}")
@@ -334,47 +382,17 @@ class UserService:
             VALUES ($1, $2)
             RETURNING user_id, list_id, created_at, updated_at
         """
-        word_ids_query = """
-            SELECT word_id FROM list_words WHERE list_id = $1
-        """
-        word_progress_query = """
-            INSERT INTO word_progress (
-                user_id, 
-                word_id, 
-                recognition_mastery_score, 
-                usage_mastery_score, 
-                practice_count, 
-                number_of_times_to_practice, 
-                success_count,
-                created_at,
-                updated_at
-            )
-            VALUES ($1, $2, $3, $4, $5, $6, $7, CURRENT_TIMESTAMP - INTERVAL '30 days', CURRENT_TIMESTAMP - INTERVAL '30 days')
-        """
-
-        check_stats_query = """
-            SELECT COUNT(*) FROM user_stats
-            WHERE user_id = $1
-        """
 
         try:
             async with self.pool.acquire() as conn:
                 async with conn.transaction():
-                    stats_count = await conn.fetchval(check_stats_query, user_id)
-                    if stats_count == 0:
-                        await self._create_default_user_stats(user_id)
-
                     user_list_record = await conn.fetchrow(query, user_id, list_id)
-                    word_ids = await conn.fetch(word_ids_query, list_id)
-
-                    for record in word_ids:
-                        word_id = record["word_id"]
-                        await conn.execute(
-                            word_progress_query, user_id, word_id, 0, 0, 0, 5, 0
-                        )
-
                     if user_list_record is None:
                         raise Exception("Failed to create user list record.")
+
+                    await self._ensure_user_stats(conn, user_id)
+                    await self._seed_word_progress(conn, user_id, [list_id])
+
                     return UserList(**user_list_record)
         except asyncpg.UniqueViolationError as e:
             raise UserListAlreadyExistsError(
@@ -383,6 +401,71 @@ class UserService:
         except Exception as e:
             raise Exception(f"Error creating user list: {str(e)}")
 
+    async def create_user_lists(
+        self, user_id: int, list_ids: List[int]
+    ) -> List[UserList]:
+        """Subscribe to several lists at once; lists already in the bank are skipped."""
+        query = """
+            INSERT INTO user_lists (user_id, list_id)
+            SELECT $1, list_id FROM unnest($2::int[]) AS list_id
+            ON CONFLICT (user_id, list_id) DO NOTHING
+            RETURNING user_id, list_id, created_at, updated_at
+        """
+
+        list_ids = list(dict.fromkeys(list_ids))
+        if not list_ids:
+            return []
+
+        try:
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    user_list_records = await conn.fetch(query, user_id, list_ids)
+                    await self._ensure_user_stats(conn, user_id)
+                    await self._seed_word_progress(conn, user_id, list_ids)
+
+                    return [UserList(**record) for record in user_list_records]
+        except Exception as e:
+            raise Exception(f"Error creating user lists: {str(e)}")
+
+    async def _ensure_user_stats(self, conn: asyncpg.Connection, user_id: int) -> None:
+        query = """
+            INSERT INTO user_stats
+            (user_id, diamonds, total_words_learned, current_streak, longest_streak,
+             total_practice_time, average_accuracy)
+            SELECT $1, 0, 0, 0, 0, 0, 0
+            WHERE NOT EXISTS (SELECT 1 FROM user_stats WHERE user_id = $1)
+        """
+        await conn.execute(query, user_id)
+
+    async def _seed_word_progress(
+        self, conn: asyncpg.Connection, user_id: int, list_ids: List[int]
+    ) -> None:
+        # One statement regardless of list size; words the user already has
+        # progress for (e.g. shared with another list) are left untouched.
+        query = """
+            INSERT INTO word_progress (
+                user_id,
+                word_id,
+                recognition_mastery_score,
+                usage_mastery_score,
+                practice_count,
+                number_of_times_to_practice,
+                success_count,
+                created_at,
+                updated_at
+            )
+            SELECT DISTINCT
+                $1,
+                lw.word_id,
+                0, 0, 0, 5, 0,
+                CURRENT_TIMESTAMP - INTERVAL '30 days',
+                CURRENT_TIMESTAMP - INTERVAL '30 days'
+            FROM list_words lw
+            WHERE lw.list_id = ANY($2::int[])
+            ON CONFLICT (user_id, word_id) DO NOTHING
+        """
+        await conn.execute(query, user_id, list_ids)
+
     async def remove_list_from_user_lists(self, user_id: int, list_id: int) -> bool:
         query = """
             DELETE FROM user_lists
@@ -405,74 +488,67 @@ class UserService:
         filter_by: Optional[str] = None,
         search_query: Optional[str] = None,
     ) -> List[WordList]:
-        base_query = """
-            SELECT list_id
-            FROM user_lists
-            WHERE user_id = $1
+        query = """
+            SELECT
+                l.id,
+                l.name,
+                l.description,
+                l.difficulty_level,
+                l.icon_name,
+                l.created_at,
+                l.updated_at,
+                ul.is_favorite,
+                counts.word_count,
+                counts.mastered_count
+            FROM user_lists ul
+            JOIN lists l ON l.id = ul.list_id
+            CROSS JOIN LATERAL (
+                SELECT
+                    COUNT(*) AS word_count,
+                    COUNT(*) FILTER (
+                        WHERE wp.recognition_mastery_score >= 5
+                    ) AS mastered_count
+                FROM list_words lw
+                LEFT JOIN word_progress wp
+                    ON wp.word_id = lw.word_id AND wp.user_id = $1
+                WHERE lw.list_id = l.id
+            ) counts
+            WHERE ul.user_id = $1
+              AND ($2::text IS NULL OR l.name ILIKE $2 OR l.description ILIKE $2)
+              AND (NOT $3 OR ul.is_favorite)
+              AND (NOT $4 OR counts.mastered_count >= counts.word_count)
+            ORDER BY l.name
         """
-        try:
-            user_list_ids = await self.pool.fetch(base_query, user_id)
-
-            if not user_list_ids:
-                return []
-
-            user_lists = []
-            for record in user_list_ids:
-                try:
-                    user_list = await self.list_service.get_list_by_id(
-                        record["list_id"],
-                        user_id=user_id,
-                    )
-
-                    if search_query and search_query.strip():
-                        search_term = search_query.strip().lower()
-                        list_name = user_list.name.lower() if user_list.name else ""
-                        list_desc = (
-                            user_list.description.lower()
-                            if user_list.description
-                            else ""
-                        )
-
-                        if search_term in list_name or search_term in list_desc:
-                            user_lists.append(user_list)
-                    else:
-                        user_lists.append(user_list)
-                except Exception as e:
-                    print(f"Error fetching list {record['list_id']}: {e}")
-                    continue
-
-            if filter_by == "favorites":
-                user_lists = [
-                    user_list for user_list in user_lists if user_list.is_favorite
-                ]
-
-            if filter_by == "completed":
-                completed = []
-                for lst in user_lists:
-                    total_count = await self.pool.fetchval(
-                        "SELECT COUNT(*) FROM list_words WHERE list_id = $1",
-                        lst.id,
-                    )
-                    done_count = await self.pool.fetchval(
-                        """
-                        SELECT COUNT(*) 
-                        FROM list_words lw
-                        JOIN word_progress wp
-                            ON lw.word_id = wp.word_id
-                        AND wp.user_id = $1
-                        AND wp.recognition_mastery_score >= 5
-                        WHERE lw.list_id = $2
-                        """,
-                        user_id,
-                        lst.id,
-                    )
-                    if done_count >= total_count:
-                        completed.append(lst)
 
-                user_lists = completed
+        search_pattern = None
+        if search_query and search_query.strip():
+            search_pattern = f"%{search_query.strip()}%"
 
-            user_lists.sort(key=lambda x: x.name)
-            return user_lists
+        try:
+            records = await self.pool.fetch(
+                query,
+                user_id,
+                search_pattern,
+                filter_by == "favorites",
+                filter_by == "completed",
+            )
+            return [
+                WordList(
+                    id=record["id"],
+                    name=record["name"],
+                    description=record["description"],
+                    difficulty_level=record["difficulty_level"],
+                    icon_name=record["icon_name"],
+                    created_at=record["created_at"],
+                    updated_at=record["updated_at"],
+                    in_users_bank=True,
+                    is_favorite=record["is_favorite"],
+                    word_count=record["word_count"],
+                    mastered_count=record["mastered_count"],
+                    is_completed=record["mastered_count"] >= record["word_count"],
+                )
+                for record in records
+            ]
         except Exception as e:
             raise Exception(f"Error fetching user lists: {str(e)}")
 
@@ -498,165 +574,80 @@ class UserService:
     async def update_word_progress(
         self, user_id: int, progress_data: WordProgressUpdate
     ) -> WordProgress:
-        check_query = """
-            SELECT * FROM word_progress
-            WHERE user_id = $1 AND word_id = $2
-        """
         try:
-            record = await self.pool.fetchrow(
-                check_query, user_id, progress_data.word_id
-            )
-
-            if not record:
-                insert_query = """
-                    INSERT INTO word_progress 
-                    (user_id, word_id, recognition_mastery_score, usage_mastery_score, 
-                     practice_count, success_count, number_of_times_to_practice)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7)
-                    RETURNING *
-                """
-                new_record = await self.pool.fetchrow(
-                    insert_query,
-                    user_id,
-                    progress_data.word_id,
-                    progress_data.recognition_mastery_score or 0,
-                    progress_data.usage_mastery_score or 0,
-                    progress_data.practice_count or 0,
-                    progress_data.success_count or 0,
-                    progress_data.number_of_times_to_practice or 5,
-                )
-                await self._update_user_streak(user_id)
-                return WordProgress(**new_record)
-
-            update_fields = []
-            params = [user_id, progress_data.word_id]
-            param_index = 3
-
-            if progress_data.recognition_mastery_score is not None:
-                update_fields.append(f"recognition_mastery_score = ${param_index}")
-                params.append(progress_data.recognition_mastery_score)
-                param_index += 1
-
-            if progress_data.usage_mastery_score is not None:
-                update_fields.append(f"usage_mastery_score = ${param_index}")
-                params.append(progress_data.usage_mastery_score)
-                param_index += 1
-
-            if progress_data.practice_count is not None:
-                update_fields.append(f"practice_count = ${param_index}")
-                params.append(progress_data.practice_count)
-                param_index += 1
-
-            if progress_data.success_count is not None:
-                update_fields.append(f"success_count = ${param_index}")
-                params.append(progress_data.success_count)
-                param_index += 1
-
-            if progress_data.number_of_times_to_practice is not None:
-                update_fields.append(f"number_of_times_to_practice = ${param_index}")
-                params.append(progress_data.number_of_times_to_practice)
-                param_index += 1
-
-            update_fields.append("updated_at = CURRENT_TIMESTAMP")
-
-            if not update_fields:
-                return WordProgress(**record)
-
-            update_query = f"""
-                UPDATE word_progress
-                SET {', '.join(update_fields)}
-                WHERE user_id = $1 AND word_id = $2
-                RETURNING *
-            """
-
-            updated_record = await self.pool.fetchrow(update_query, *params)
-            await self._update_user_streak(user_id)
-            return WordProgress(**updated_record)
+            if env.progress_write_mode == "events":
+                await event_log.append_answers(user_id, [progress_data])
+                return (await self._project_word_progress(user_id, [progress_data]))[0]
 
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    records = await apply_word_progress(
+                        conn, user_id, [progress_data]
+                    )
+            return WordProgress(**records[0])
         except Exception as e:
             raise Exception(f"Error updating word progress: {str(e)}")
 
-    async def _update_user_streak(self, user_id: int) -> None:
-        """Internal method to update user streak based on activity."""
-        stats_query = """
-            SELECT * FROM user_stats
-            WHERE user_id = $1
-        """
-
-        check_query = """
-            SELECT COUNT(*) FROM user_stats
-            WHERE user_id = $1
-        """
+    async def update_word_progress_batch(
+        self, user_id: int, batch: WordProgressBatchUpdate
+    ) -> List[WordProgress]:
+        """Applies every answer of a session at once and records the session.
 
-        timezone_query = """
-            SELECT time_zone
-            FROM user_preferences
-            WHERE user_id = $1
+        When a word appears more than once, its last update wins.
         """
-
         try:
-            count = await self.pool.fetchval(check_query, user_id)
-            if count == 0:
-                stats_record = await self._create_default_user_stats(user_id)
-            else:
-                stats_record = await self.pool.fetchrow(stats_query, user_id)
-
-            timezone_record = await self.pool.fetchrow(timezone_query, user_id)
-            user_timezone = timezone_record["time_zone"] if timezone_record else "UTC"
-
-            tz = pytz.timezone(user_timezone)
-            current_date = datetime.now(tz).date()
-
-            # Get the last day the streak was updated
-            last_streak_updated_at = stats_record["last_streak_updated_at"]
-            if last_streak_updated_at:
-                # Ensure the timestamp is timezone-aware
-                if last_streak_updated_at.tzinfo is None:
-                    last_streak_updated_at = last_streak_updated_at.replace(
-                        tzinfo=pytz.UTC
+            if env.progress_write_mode == "events":
+                await event_log.append_answers(user_id, batch.updates)
+                if batch.practice_time:
+                    await event_log.append(
+                        user_id,
+                        PRACTICE_SESSION,
+                        {
+                            "practice_time": batch.practice_time,
+                            "session_type": batch.session_type,
+                        },
                     )
+                return await self._project_word_progress(user_id, batch.updates)
 
-                last_streak_date = last_streak_updated_at.astimezone(tz).date()
-            else:
-                last_streak_date = None
-
-            current_streak = stats_record["current_streak"]
-            longest_streak = stats_record["longest_streak"]
-
-            # If this is the first activity ever or streak is 0
-            if not last_streak_date or current_streak == 0:
-                current_streak = 1
-            # If we already updated the streak today, don't increment again
-            elif last_streak_date == current_date:
-                pass  # Keep current streak value
-            # If last streak update was yesterday, increment streak
-            elif last_streak_date == current_date - timedelta(days=1):
-                current_streak += 1
-            # If streak was last updated more than a day ago, reset streak to 1
-            else:
-                current_streak = 1
-
-            # Update longest streak if needed
-            if current_streak > longest_streak:
-                longest_streak = current_streak
-
-            # Update the database with the new streak values
-            update_query = """
-                UPDATE user_stats
-                SET current_streak = $2, 
-                    longest_streak = $3, 
-                    last_streak_updated_at = CURRENT_TIMESTAMP AT TIME ZONE 'UTC',
-                    updated_at = CURRENT_TIMESTAMP AT TIME ZONE 'UTC'
-                WHERE user_id = $1
-            """
-
-            await self.pool.execute(
-                update_query, user_id, current_streak, longest_streak
-            )
-
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    records = await apply_word_progress(
+                        conn,
+                        user_id,
+                        batch.updates,
+                        practice_time=batch.practice_time or 0,
+                    )
+                    if batch.practice_time:
+                        await insert_practice_session(
+                            conn, user_id, batch.practice_time, batch.session_type
+                        )
+            return [WordProgress(**record) for record in records]
         except Exception as e:
-            print(f"Error in _update_user_streak: {str(e)}")
-            raise Exception(f"Error updating user streak: {str(e)}")
+            raise Exception(f"Error updating word progress batch: {str(e)}")
+
+    async def _project_word_progress(
+        self, user_id: int, updates: List[WordProgressUpdate]
+    ) -> List[WordProgress]:
+        """Stored progress with the updates laid over it, for answers that the
+        aggregation worker has not folded in yet. The review schedule shown is
+        the stored one."""
+        query = """
+            SELECT * FROM word_progress
+            WHERE user_id = $1 AND word_id = ANY($2::int[])
+        """
+        updates = list({update.word_id: update for update in updates}.values())
+        records = await self.pool.fetch(
+            query, user_id, [update.word_id for update in updates]
+        )
+        stored = {record["word_id"]: record for record in records}
+
+        progress = []
+        for update in updates:
+            record = stored.get(update.word_id)
+            data = dict(record) if record else {"user_id": user_id}
+            data.update(update.model_dump(exclude={"last_practiced"}, exclude_none=True))
+            progress.append(WordProgress(**data))
+        return progress
 
     async def get_word_progress(
         self, user_id: int, page: int = 1, per_page: int = 10
@@ -690,7 +681,7 @@ class UserService:
             FROM word_progress wp
             JOIN words w ON wp.word_id = w.id
             WHERE wp.user_id = $1
-            ORDER BY wp.updated_at DESC
+            ORDER BY wp.updated_at DESC, wp.word_id DESC
             LIMIT $2 OFFSET $3
         """
 
@@ -705,40 +696,9 @@ class UserService:
                 total_count = await conn.fetchval(count_query, user_id)
                 records = await conn.fetch(query, user_id, per_page, offset)
 
-                items = []
-                for record in records:
-                    progress = WordProgress(
-                        user_id=user_id,
-                        word_id=record["id"],
-                        recognition_mastery_score=record["recognition_mastery_score"],
-                        usage_mastery_score=record["usage_mastery_score"],
-                        practice_count=record["practice_count"],
-                        success_count=record["success_count"],
-                        number_of_times_to_practice=record[
-                            "number_of_times_to_practice"
-                        ],
-                        created_at=record["wp_created_at"],
-                        updated_at=record["wp_updated_at"],
-                    )
-                    word = Word(
-                        id=record["id"],
-                        word=record["word"],
-                        definition=record["definition"],
-                        part_of_speech=record["part_of_speech"],
-                        difficulty_level=record["difficulty_level"],
-                        word_progress=progress,
-                        etymology=record["etymology"],
-                        usage_notes=record["usage_notes"],
-                        audio_url=record["audio_url"],
-                        image_url=record["image_url"],
-                        examples=record["examples"],
-                        synonyms=record["synonyms"],
-                        antonyms=record["antonyms"],
-                        tags=record["tags"],
-                        created_at=record["w_created_at"],
-                        updated_at=record["w_updated_at"],
-                    )
-                    items.append(word)
+                items = [
+                    self._word_with_progress(user_id, record) for record in records
+                ]
 
                 total_pages = (total_count + per_page - 1) // per_page
                 page_info = PageInfo(
@@ -754,103 +714,213 @@ class UserService:
         except Exception as e:
             raise Exception(f"Error retrieving word progress: {str(e)}")
 
-    async def get_user_stats(self, user_id: int) -> FullUserStats:
-        stats_query = """
-            SELECT * FROM user_stats
-            WHERE user_id = $1
-        """
-
-        last_active_query = """
-            SELECT MAX(updated_at) as last_active 
-            FROM word_progress 
-            WHERE user_id = $1
-        """
-
-        words_mastered_query = """
-            SELECT COUNT(*) 
-            FROM word_progress 
-            WHERE user_id = $1 AND recognition_mastery_score >= 5
+    async def get_word_progress_after(
+        self,
+        user_id: int,
+        cursor: Optional[str] = None,
+        per_page: int = 10,
+        include_total: bool = False,
+    ) -> CursorPaginatedPayload[Word]:
+        # Keyset pagination on (updated_at, word_id), newest first; each page
+        # seeks idx_word_progress_user_id_updated_at_word_id past the previous
+        # one, so deep pages cost the same as the first. The first page and
+        # later pages are separate statements so that a generic prepared plan
+        # still seeks rather than filtering a scan.
+        select = """
+            SELECT 
+                wp.recognition_mastery_score, 
+                wp.usage_mastery_score, 
+                wp.practice_count, 
+                wp.success_count, 
+                wp.number_of_times_to_practice, 
+                wp.created_at as wp_created_at, 
+                wp.updated_at as wp_updated_at,
+                w.id,
+                w.word,
+                w.definition,
+                w.part_of_speech,
+                w.difficulty_level,
+                w.etymology,
+                w.usage_notes,
+                w.audio_url,
+                w.image_url,
+                w.examples,
+                w.synonyms,
+                w.antonyms,
+                w.tags,
+                w.created_at as w_created_at,
+                w.updated_at as w_updated_at
+            FROM word_progress wp
+            JOIN words w ON wp.word_id = w.id
         """
-
-        today_practiced_query = """
-            SELECT COUNT(*) 
-            FROM word_progress 
-            WHERE user_id = $1 
-              AND DATE(updated_at) = CURRENT_DATE
-              AND practice_count > 0
+        first_page_query = f"""
+            {select}
+            WHERE wp.user_id = $1
+            ORDER BY wp.updated_at DESC, wp.word_id DESC
+            LIMIT $2
         """
-
-        today_time_query = """
-            SELECT COALESCE(SUM(practice_time), 0) as practice_time
-            FROM user_practice_sessions 
-            WHERE user_id = $1 AND DATE(created_at) = CURRENT_DATE
+        next_page_query = f"""
+            {select}
+            WHERE wp.user_id = $1
+              AND (wp.updated_at, wp.word_id) < ($2::timestamp, $3::int)
+            ORDER BY wp.updated_at DESC, wp.word_id DESC
+            LIMIT $4
         """
 
-        preferences_query = """
-            SELECT daily_word_goal, daily_practice_time_goal
-            FROM user_preferences
+        count_query = """
+            SELECT COUNT(*) as total
+            FROM word_progress
             WHERE user_id = $1
         """
 
-        try:
-            stats_record = await self.pool.fetchrow(stats_query, user_id)
-            if not stats_record:
-                stats_record = await self._create_default_user_stats(user_id)
+        if cursor:
+            after_updated_at, after_word_id = decode_cursor(cursor, 2)
+            try:
+                after_updated_at = datetime.fromisoformat(after_updated_at)
+            except (TypeError, ValueError):
+                raise InvalidCursorError("Invalid pagination cursor")
+            if after_updated_at.tzinfo is not None:
+                raise InvalidCursorError("Invalid pagination cursor")
+            after_word_id = cursor_id(after_word_id)
 
-            last_active_record = await self.pool.fetchrow(last_active_query, user_id)
-            last_active = (
-                last_active_record["last_active"] if last_active_record else None
+        try:
+            if cursor:
+                records = await self.pool.fetch(
+                    next_page_query,
+                    user_id,
+                    after_updated_at,
+                    after_word_id,
+                    per_page + 1,
+                )
+            else:
+                records = await self.pool.fetch(first_page_query, user_id, per_page + 1)
+            total_count = (
+                await self.pool.fetchval(count_query, user_id)
+                if include_total
+                else None
             )
 
-            words_mastered_record = await self.pool.fetchrow(
-                words_mastered_query, user_id
-            )
-            words_mastered = (
-                words_mastered_record["count"] if words_mastered_record else 0
+            has_next_page = len(records) > per_page
+            items = [
+                self._word_with_progress(user_id, record)
+                for record in records[:per_page]
+            ]
+
+            next_cursor = None
+            if has_next_page:
+                last = items[-1].word_progress
+                next_cursor = encode_cursor([last.updated_at, last.word_id])
+
+            page_info = CursorPageInfo(
+                per_page=per_page,
+                next_cursor=next_cursor,
+                has_next_page=has_next_page,
+                total_items=total_count,
             )
+            return CursorPaginatedPayload[Word](items=items, page_info=page_info)
+        except Exception as e:
+            raise Exception(f"Error retrieving word progress: {str(e)}")
 
-            today_practiced_record = await self.pool.fetchrow(
-                today_practiced_query, user_id
-            )
-            words_practiced_today = (
-                today_practiced_record["count"] if today_practiced_record else 0
-            )
+    def _word_with_progress(self, user_id: int, record: asyncpg.Record) -> Word:
+        progress = WordProgress(
+            user_id=user_id,
+            word_id=record["id"],
+            recognition_mastery_score=record["recognition_mastery_score"],
+            usage_mastery_score=record["usage_mastery_score"],
+            practice_count=record["practice_count"],
+            success_count=record["success_count"],
+            number_of_times_to_practice=record["number_of_times_to_practice"],
+            created_at=record["wp_created_at"],
+            updated_at=record["wp_updated_at"],
+        )
+        return Word(
+            id=record["id"],
+            word=record["word"],
+            definition=record["definition"],
+            part_of_speech=record["part_of_speech"],
+            difficulty_level=record["difficulty_level"],
+            word_progress=progress,
+            etymology=record["etymology"],
+            usage_notes=record["usage_notes"],
+            audio_url=record["audio_url"],
+            image_url=record["image_url"],
+            examples=record["examples"],
+            synonyms=record["synonyms"],
+            antonyms=record["antonyms"],
+            tags=record["tags"],
+            created_at=record["w_created_at"],
+            updated_at=record["w_updated_at"],
+        )
 
-            try:
-                today_time_record = await self.pool.fetchrow(today_time_query, user_id)
-                practice_time_today = (
-                    today_time_record["practice_time"] if today_time_record else 0
-                )
-            except:
-                practice_time_today = 0
+    async def get_user_stats(self, user_id: int) -> FullUserStats:
+        try:
+            record = await self._fetch_user_stats_record(user_id)
+            return await self._build_user_stats(user_id, record)
+        except Exception as e:
+            raise Exception(f"Error fetching user stats: {str(e)}")
 
-            preferences_record = await self.pool.fetchrow(preferences_query, user_id)
-            daily_word_goal = (
-                preferences_record["daily_word_goal"] if preferences_record else 10
-            )
-            daily_practice_time_goal = (
-                preferences_record["daily_practice_time_goal"]
-                if preferences_record
-                else 5
+    async def _fetch_user_stats_record(self, user_id: int) -> asyncpg.Record:
+        query = """
+            WITH progress AS (
+                SELECT
+                    MAX(updated_at) AS last_active,
+                    COUNT(*) FILTER (
+                        WHERE recognition_mastery_score >= 5
+                    ) AS words_mastered
+                FROM word_progress
+                WHERE user_id = $1
             )
+            SELECT
+                s.user_id IS NOT NULL AS has_stats,
+                s.diamonds,
+                s.current_streak,
+                s.average_accuracy,
+                progress.last_active,
+                progress.words_mastered,
+                COALESCE(da.words_practiced, 0) AS words_practiced_today,
+                COALESCE(da.practice_time, 0) AS practice_time_today,
+                pref.daily_word_goal,
+                pref.daily_practice_time_goal
+            FROM progress
+            LEFT JOIN user_stats s ON s.user_id = $1
+            LEFT JOIN user_preferences pref ON pref.user_id = $1
+            LEFT JOIN daily_activity da
+                ON da.user_id = $1
+               AND da.local_date = (
+                   CURRENT_TIMESTAMP AT TIME ZONE COALESCE(pref.time_zone, 'UTC')
+               )::date
+        """
 
-            return FullUserStats(
-                diamonds=stats_record["diamonds"],
-                streak=stats_record["current_streak"],
-                lastActive=last_active,
-                dailyProgress=DailyProgress(
-                    wordsPracticed=words_practiced_today,
-                    dailyWordGoal=daily_word_goal,
-                    practiceTime=practice_time_today,
-                    dailyPracticeTimeGoal=daily_practice_time_goal,
+        return await self.pool.fetchrow(query, user_id)
+
+    async def _build_user_stats(
+        self, user_id: int, record: asyncpg.Record
+    ) -> FullUserStats:
+        stats_record = record
+        if not record["has_stats"]:
+            stats_record = await self._create_default_user_stats(user_id)
+
+        has_preferences = record["daily_word_goal"] is not None
+
+        return FullUserStats(
+            diamonds=stats_record["diamonds"],
+            streak=stats_record["current_streak"],
+            lastActive=record["last_active"],
+            dailyProgress=DailyProgress(
+                wordsPracticed=record["words_practiced_today"],
+                dailyWordGoal=(
+                    record["daily_word_goal"] if has_preferences else 10
                 ),
-                learningInsights=LearningInsights(
-                    wordsMastered=words_mastered,
-                    accuracy=stats_record["average_accuracy"],
+                practiceTime=record["practice_time_today"],
+                dailyPracticeTimeGoal=(
+                    record["daily_practice_time_goal"] if has_preferences else 5
                 ),
-            )
-        except Exception as e:
-            raise Exception(f"Error fetching user stats: {str(e)}")
+            ),
+            learningInsights=LearningInsights(
+                wordsMastered=record["words_mastered"],
+                accuracy=stats_record["average_accuracy"],
+            ),
+        )
 
     async def _create_default_user_stats(self, user_id: int) -> dict:
         query = """
@@ -924,25 +994,43 @@ class UserService:
             raise Exception(f"Error updating user stats: {str(e)}")
 
     async def increment_diamonds(self, user_id: int, amount: int) -> UserStats:
-        check_query = """
-            SELECT COUNT(*) FROM user_stats
+        """Adds diamonds to the user's stats.
+
+        When the write-behind buffer takes the increment, the returned stats
+        are the stored row plus the user's increments still waiting to flush.
+        """
+        update_query = """
+            UPDATE user_stats
+            SET diamonds = diamonds + $2, updated_at = CURRENT_TIMESTAMP
             WHERE user_id = $1
+            RETURNING *
         """
+        stats_query = "SELECT * FROM user_stats WHERE user_id = $1"
 
         try:
-            count = await self.pool.fetchval(check_query, user_id)
-
-            if count == 0:
+            if env.progress_write_mode == "events":
+                await event_log.append(user_id, DIAMONDS, {"amount": amount})
+                record = await self.pool.fetchrow(stats_query, user_id)
+                if not record:
+                    record = await self._create_default_user_stats(user_id)
+                stats = UserStats(**record)
+                stats.diamonds += amount
+                return stats
+
+            if write_behind.enabled and await write_behind.add_diamonds(
+                user_id, amount
+            ):
+                record = await self.pool.fetchrow(stats_query, user_id)
+                if not record:
+                    record = await self._create_default_user_stats(user_id)
+                stats = UserStats(**record)
+                stats.diamonds += write_behind.pending_diamonds(user_id)
+                return stats
+
+            record = await self.pool.fetchrow(update_query, user_id, amount)
+            if not record:
                 await self._create_default_user_stats(user_id)
-
-            query = """
-                UPDATE user_stats
-                SET diamonds = diamonds + $2, updated_at = CURRENT_TIMESTAMP
-                WHERE user_id = $1
-                RETURNING *
-            """
-
-            record = await self.pool.fetchrow(query, user_id, amount)
+                record = await self.pool.fetchrow(update_query, user_id, amount)
             return UserStats(**record)
         except Exception as e:
             raise Exception(f"Error incrementing diamonds: {str(e)}")
@@ -950,21 +1038,28 @@ class UserService:
     async def record_practice_session(
         self, user_id: int, practice_time: int, session_type: str
     ) -> None:
-        insert_query = """
-            INSERT INTO user_practice_sessions 
-            (user_id, practice_time, session_type)
-            VALUES ($1, $2, $3)
-        """
+        try:
+            if env.progress_write_mode == "events":
+                await event_log.append(
+                    user_id,
+                    PRACTICE_SESSION,
+                    {"practice_time": practice_time, "session_type": session_type},
+                )
+                return
 
-        update_stats_query = """
-            UPDATE user_stats
-            SET total_practice_time = total_practice_time + $2
-            WHERE user_id = $1
-        """
+            if write_behind.enabled and await write_behind.add_practice_session(
+                user_id, practice_time, session_type
+            ):
+                return
 
-        try:
-            await self.pool.execute(insert_query, user_id, practice_time, session_type)
-            await self.pool.execute(update_stats_query, user_id, practice_time)
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    await insert_practice_session(
+                        conn, user_id, practice_time, session_type
+                    )
+                    await record_daily_activity(
+                        conn, user_id, practice_time=practice_time
+                    )
         except Exception as e:
             raise Exception(f"Error recording practice session: {str(e)}")
 
@@ -982,49 +1077,12 @@ class UserService:
             raise Exception(f"Error updating user preferences: {str(e)}")
 
     async def get_top_five_users(self) -> List[TopFiveUsers]:
-        query = """
-            SELECT 
-                u.id,
-                u.username,
-                u.profile_picture_url,
-                us.total_words_learned,
-                us.total_practice_time,
-                us.diamonds as total_diamonds,
-                us.current_streak as total_streak,
-                (
-                    SELECT MAX(updated_at) 
-                    FROM word_progress 
-                    WHERE user_id = u.id
-                ) as last_active
-            FROM 
-                users u
-            JOIN 
-                user_stats us ON u.id = us.user_id
-            ORDER BY 
-                (us.total_words_learned * 0.4 + 
-                 us.total_practice_time * 0.3 + 
-                 us.current_streak * 0.3) DESC
-            LIMIT 5
-        """
-
         try:
-            records = await self.pool.fetch(query)
-            result = []
-
-            for record in records:
-                user = TopFiveUsers(
-                    id=record["id"],
-                    username=record["username"],
-                    profile_picture_url=record["profile_picture_url"],
-                    total_words_learned=record["total_words_learned"],
-                    total_practice_time=record["total_practice_time"],
-                    total_diamonds=record["total_diamonds"],
-                    total_streak=record["total_streak"],
-                    last_active=record["last_active"],
-                )
-                result.append(user)
-
-            return result
+            entries = await LeaderboardService(self.pool).get_top(5)
+            return [
+                TopFiveUsers(**entry.model_dump(exclude={"rank", "score"}))
+                for entry in entries
+            ]
         except Exception as e:
             raise Exception(f"Error getting top five users: {str(e)}")
 
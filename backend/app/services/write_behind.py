@@ -0,0 +1,275 @@
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
+import asyncio
+import logging
+import time
+
+import asyncpg
+from app.config.env import env
+
+
+logger = logging.getLogger("write_behind")
+
+WRITE_BEHIND_MODES = ("off", "buffered")
+
+Session = Tuple[int, int, str, datetime]
+# Diamonds and practice minutes per user, and the sessions, of one flush
+Batch = Tuple[Dict[int, int], Dict[int, int], List[Session]]
+
+# Applies one flush: session inserts, their minutes in the daily and
+# leaderboard rollups, and the per-user stats increments. Rows for users
+# deleted since the write was buffered are skipped.
+FLUSH_QUERY = """
+    WITH sessions AS (
+        SELECT t.*
+        FROM unnest($1::int[], $2::int[], $3::text[], $4::timestamp[])
+            AS t(user_id, practice_time, session_type, created_at)
+        JOIN users u ON u.id = t.user_id
+    ),
+    inserted_sessions AS (
+        INSERT INTO user_practice_sessions
+        (user_id, practice_time, session_type, created_at, updated_at)
+        SELECT user_id, practice_time, session_type, created_at, created_at
+        FROM sessions
+    ),
+    daily AS (
+        INSERT INTO daily_activity (user_id, local_date, words_practiced, practice_time)
+        SELECT
+            s.user_id,
+            (s.created_at AT TIME ZONE 'UTC' AT TIME ZONE COALESCE(p.time_zone, 'UTC'))::date,
+            0,
+            SUM(s.practice_time)
+        FROM sessions s
+        LEFT JOIN user_preferences p ON p.user_id = s.user_id
+        GROUP BY 1, 2
+        ON CONFLICT (user_id, local_date) DO UPDATE
+        SET practice_time = daily_activity.practice_time + EXCLUDED.practice_time,
+            updated_at = CURRENT_TIMESTAMP
+    ),
+    bucket AS (
+        INSERT INTO leaderboard_buckets (bucket_date, user_id, words_practiced, practice_time)
+        SELECT created_at::date, user_id, 0, SUM(practice_time)
+        FROM sessions
+        GROUP BY 1, 2
+        ON CONFLICT (bucket_date, user_id) DO UPDATE
+        SET practice_time = leaderboard_buckets.practice_time + EXCLUDED.practice_time
+    ),
+    totals AS (
+        SELECT t.*
+        FROM unnest($5::int[], $6::int[], $7::int[])
+            AS t(user_id, diamonds, practice_time)
+        JOIN users u ON u.id = t.user_id
+    ),
+    missing AS (
+        INSERT INTO user_stats
+        (user_id, diamonds, total_words_learned, current_streak, longest_streak,
+         total_practice_time, average_accuracy)
+        SELECT t.user_id, t.diamonds, 0, 0, 0, t.practice_time, 0
+        FROM totals t
+        WHERE NOT EXISTS (SELECT 1 FROM user_stats s WHERE s.user_id = t.user_id)
+    )
+    UPDATE user_stats s
+    SET diamonds = s.diamonds + t.diamonds,
+        total_practice_time = s.total_practice_time + t.practice_time,
+        updated_at = CURRENT_TIMESTAMP
+    FROM totals t
+    WHERE s.user_id = t.user_id
+"""
+
+
+class WriteBehindBuffer:
+    """Coalesces diamond and practice-time increments and session inserts.
+
+    With ``mode="off"`` nothing is buffered and callers write through, so a
+    successful response means the write is committed. With
+    ``mode="buffered"`` writes are acknowledged once queued in this worker and
+    are committed by the next flush: every ``flush_interval`` seconds, when
+    ``max_pending`` sessions are queued, and at shutdown. A crash or kill
+    before a flush loses up to that much acknowledged activity. A batch whose
+    flush fails is kept apart and retried on later flushes, so it cannot hold
+    back newer writes; after ``max_attempts`` failures it is logged and
+    dropped. While the buffer is full, writes are refused so callers fall
+    back to writing through.
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        flush_interval: float,
+        max_pending: int,
+        max_attempts: int = 5,
+    ):
+        if mode not in WRITE_BEHIND_MODES:
+            raise ValueError(
+                f"Unknown write-behind mode '{mode}', expected one of {WRITE_BEHIND_MODES}"
+            )
+        self.mode = mode
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self._pool: Optional[asyncpg.Pool] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self._diamonds: Dict[int, int] = {}
+        self._practice_time: Dict[int, int] = {}
+        self._sessions: List[Session] = []
+        # Batches whose flush failed, with the number of attempts made
+        self._failed: List[Tuple[int, Batch]] = []
+        self.flushes = 0
+        self.flush_failures = 0
+        self.flushed_sessions = 0
+        self.dropped_batches = 0
+        self.dropped_sessions = 0
+        self.dropped_diamonds = 0
+        self.refused = 0
+        self.last_flush_ms = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode == "buffered" and self._pool is not None
+
+    @property
+    def pending(self) -> int:
+        return sum(
+            len(sessions) + len(diamonds)
+            for diamonds, _, sessions in self._batches()
+        )
+
+    def pending_diamonds(self, user_id: int) -> int:
+        return sum(diamonds.get(user_id, 0) for diamonds, _, _ in self._batches())
+
+    def _batches(self) -> List[Batch]:
+        current = (self._diamonds, self._practice_time, self._sessions)
+        return [current] + [batch for _, batch in self._failed]
+
+    async def add_diamonds(self, user_id: int, amount: int) -> bool:
+        if not await self._make_room():
+            return False
+        self._diamonds[user_id] = self._diamonds.get(user_id, 0) + amount
+        return True
+
+    async def add_practice_session(
+        self, user_id: int, practice_time: int, session_type: str
+    ) -> bool:
+        if not await self._make_room():
+            return False
+        created_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        self._sessions.append((user_id, practice_time, session_type, created_at))
+        self._practice_time[user_id] = (
+            self._practice_time.get(user_id, 0) + practice_time
+        )
+        return True
+
+    async def _make_room(self) -> bool:
+        if self.pending < self.max_pending:
+            return True
+        await self.flush()
+        if self.pending < self.max_pending:
+            return True
+        self.refused += 1
+        return False
+
+    async def start(self, pool: asyncpg.Pool) -> None:
+        if self.mode == "off":
+            return
+        self._pool = pool
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._pool is not None:
+            await self.flush()
+            if self.pending:
+                logger.error(
+                    f"Dropping {self.pending} buffered writes that could not be flushed"
+                )
+            self._pool = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if self._pool is None or not self.pending:
+                return
+
+            # Swap the buffers so writes arriving during the flush queue up
+            batches, self._failed = self._failed, []
+            if self._sessions or self._diamonds or self._practice_time:
+                batches.append((0, (self._diamonds, self._practice_time, self._sessions)))
+                self._diamonds, self._practice_time, self._sessions = {}, {}, []
+
+            for attempts, batch in batches:
+                if await self._apply(batch):
+                    continue
+                attempts += 1
+                if attempts < self.max_attempts:
+                    self._failed.append((attempts, batch))
+                else:
+                    self._drop(batch, attempts)
+
+    async def _apply(self, batch: Batch) -> bool:
+        diamonds, practice_time, sessions = batch
+        user_ids = sorted(set(diamonds) | set(practice_time))
+        started = time.perf_counter()
+        try:
+            await self._pool.execute(
+                FLUSH_QUERY,
+                [session[0] for session in sessions],
+                [session[1] for session in sessions],
+                [session[2] for session in sessions],
+                [session[3] for session in sessions],
+                user_ids,
+                [diamonds.get(user_id, 0) for user_id in user_ids],
+                [practice_time.get(user_id, 0) for user_id in user_ids],
+            )
+        except Exception as e:
+            logger.error(f"Error flushing write-behind buffer: {e}")
+            self.flush_failures += 1
+            return False
+
+        self.flushes += 1
+        self.flushed_sessions += len(sessions)
+        self.last_flush_ms = (time.perf_counter() - started) * 1000
+        return True
+
+    def _drop(self, batch: Batch, attempts: int) -> None:
+        diamonds, practice_time, sessions = batch
+        logger.error(
+            f"Dropping write-behind batch after {attempts} failed flushes: "
+            f"{len(sessions)} sessions, {sum(diamonds.values())} diamonds and "
+            f"{sum(practice_time.values())} practice minutes for users "
+            f"{sorted(set(diamonds) | set(practice_time))}"
+        )
+        self.dropped_batches += 1
+        self.dropped_sessions += len(sessions)
+        self.dropped_diamonds += sum(diamonds.values())
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "pending_sessions": len(self._sessions),
+            "pending_users": len(self._diamonds.keys() | self._practice_time.keys()),
+            "retrying_batches": len(self._failed),
+            "flushes": self.flushes,
+            "flush_failures": self.flush_failures,
+            "flushed_sessions": self.flushed_sessions,
+            "dropped_batches": self.dropped_batches,
+            "dropped_sessions": self.dropped_sessions,
+            "dropped_diamonds": self.dropped_diamonds,
+            "refused": self.refused,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+        }
+
+
+write_behind = WriteBehindBuffer(
+    mode=env.write_behind_mode,
+    flush_interval=env.write_behind_flush_interval,
+    max_pending=env.write_behind_max_pending,
+    max_attempts=env.write_behind_max_attempts,
+)
@@ -0,0 +1,120 @@
+from typing import Any, List, Tuple
+import json
+
+
+class JSONObjectStream:
+    """Incremental parser for a single JSON object arriving in chunks.
+
+    ``feed`` returns the top-level (key, value) pairs completed by the chunk,
+    so a field can be acted on as soon as its value has streamed in rather
+    than after the whole document. Nested values are collected and decoded
+    once they close.
+    """
+
+    def __init__(self):
+        self.done = False
+        self._state = "start"
+        self._key = None
+        self._raw = ""
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        completed = []
+        for char in chunk:
+            pair = self._consume(char)
+            if pair is not None:
+                completed.append(pair)
+        return completed
+
+    def _consume(self, char: str):
+        state = self._state
+
+        if state == "start":
+            if char == "{":
+                self._state = "key"
+            return None
+
+        if state == "key":
+            if char == '"':
+                self._state = "key_string"
+                self._raw = char
+            elif char == "}":
+                self._state = "done"
+                self.done = True
+            return None
+
+        if state == "key_string":
+            self._raw += char
+            if self._string_closed(char):
+                self._key = json.loads(self._raw)
+                self._state = "colon"
+            return None
+
+        if state == "colon":
+            if char == ":":
+                self._state = "value"
+            return None
+
+        if state == "value":
+            if char.isspace():
+                return None
+            self._raw = char
+            if char == '"':
+                self._state = "value_string"
+            elif char in "{[":
+                self._depth = 1
+                self._state = "value_nested"
+            else:
+                self._state = "value_scalar"
+            return None
+
+        if state == "value_string":
+            self._raw += char
+            if self._string_closed(char):
+                return self._complete("key")
+            return None
+
+        if state == "value_nested":
+            self._raw += char
+            if self._in_string:
+                self._string_closed(char)
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    return self._complete("key")
+            return None
+
+        if state == "value_scalar":
+            if char == "," or char == "}" or char.isspace():
+                pair = self._complete("key")
+                if char == "}":
+                    self._state = "done"
+                    self.done = True
+                return pair
+            self._raw += char
+            return None
+
+        return None
+
+    def _string_closed(self, char: str) -> bool:
+        if self._escaped:
+            self._escaped = False
+        elif char == "\\":
+            self._escaped = True
+        elif char == '"' and self._raw != '"':
+            self._in_string = False
+            return True
+        return False
+
+    def _complete(self, next_state: str) -> Tuple[str, Any]:
+        pair = (self._key, json.loads(self._raw))
+        self._state = next_state
+        self._key = None
+        self._raw = ""
+        return pair
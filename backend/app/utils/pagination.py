@@ -0,0 +1,44 @@
+from typing import Any, List
+import base64
+import json
+
+INT4_MAX = 2**31 - 1
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """Opaque keyset cursor for the sort key values of the last returned row."""
+    raw = json.dumps(values, default=str, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise InvalidCursorError("Invalid pagination cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError("Invalid pagination cursor")
+    return values
+
+
+def cursor_id(value: Any) -> int:
+    """A decoded cursor field that must be a row id (a positive int4)."""
+    if (
+        isinstance(value, bool)
+        or not isinstance(value, int)
+        or not 0 < value <= INT4_MAX
+    ):
+        raise InvalidCursorError("Invalid pagination cursor")
+    return value
+
+
+def cursor_text(value: Any) -> str:
+    """A decoded cursor field that must be text Postgres can compare."""
+    if not isinstance(value, str) or "\x00" in value:
+        raise InvalidCursorError("Invalid pagination cursor")
+    return value
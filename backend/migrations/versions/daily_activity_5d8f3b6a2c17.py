@@ -0,0 +1,57 @@
+"""daily_activity
+
+Revision ID: 5d8f3b6a2c17
+Revises: e2a9c4d81f36
+Create Date: 2026-10-18 15:42:19.206733
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "5d8f3b6a2c17"
+down_revision: Union[str, None] = "e2a9c4d81f36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_activity",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "local_date",
+            sa.Date(),
+            nullable=False,
+            comment="Calendar day in the user's time zone",
+        ),
+        sa.Column(
+            "words_practiced", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column(
+            "practice_time",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+            comment="Practice time in minutes",
+        ),
+        sa.Column(
+            "created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.func.now(),
+            onupdate=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint("user_id", "local_date"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("daily_activity")
@@ -0,0 +1,56 @@
+"""leaderboard_buckets
+
+Revision ID: c6e2d7a19f54
+Revises: a41f6c93d2e8
+Create Date: 2026-10-18 18:10:47.351926
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "c6e2d7a19f54"
+down_revision: Union[str, None] = "a41f6c93d2e8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "leaderboard_buckets",
+        sa.Column(
+            "bucket_date", sa.Date(), nullable=False, comment="UTC day of the activity"
+        ),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "words_practiced", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column(
+            "practice_time",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+            comment="Practice time in minutes",
+        ),
+        # Leading on bucket_date so a window reads a contiguous index range and
+        # expired days can be deleted without touching newer ones
+        sa.PrimaryKeyConstraint("bucket_date", "user_id"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+    )
+
+    # Seed the current windows from the per-user daily rollup
+    op.execute(
+        """
+        INSERT INTO leaderboard_buckets (bucket_date, user_id, words_practiced, practice_time)
+        SELECT local_date, user_id, words_practiced, practice_time
+        FROM daily_activity
+        WHERE local_date > CURRENT_DATE - 14
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("leaderboard_buckets")
@@ -0,0 +1,101 @@
+"""leaderboard_score_notify
+
+Revision ID: b9e4d2a7c610
+Revises: f3a7c2e96b18
+Create Date: 2026-10-18 23:02:47.119305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "b9e4d2a7c610"
+down_revision: Union[str, None] = "f3a7c2e96b18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Announces score changes on user_stats so every worker can keep its
+    # in-memory rank index current. One statement's changes are sent in
+    # chunks of 100 to stay well under the 8000 byte NOTIFY payload limit;
+    # the chunk offset and clock time keep payloads distinct, since identical
+    # payloads in one transaction are delivered once.
+    op.execute(
+        """
+        CREATE FUNCTION notify_leaderboard_scores() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            removed double precision[];
+            added double precision[];
+            total int;
+            i int := 1;
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                SELECT array_agg(score) INTO added FROM new_rows;
+            ELSIF TG_OP = 'DELETE' THEN
+                SELECT array_agg(score) INTO removed FROM old_rows;
+            ELSE
+                SELECT array_agg(o.score), array_agg(n.score)
+                INTO removed, added
+                FROM old_rows o
+                JOIN new_rows n ON n.id = o.id
+                WHERE o.score IS DISTINCT FROM n.score;
+            END IF;
+
+            total := GREATEST(
+                COALESCE(cardinality(removed), 0), COALESCE(cardinality(added), 0)
+            );
+            WHILE i <= total LOOP
+                PERFORM pg_notify(
+                    'leaderboard_scores',
+                    json_build_object(
+                        'xid', txid_current(),
+                        'at', clock_timestamp(),
+                        'offset', i,
+                        'removed', COALESCE(removed[i:i + 99], '{}'),
+                        'added', COALESCE(added[i:i + 99], '{}')
+                    )::text
+                );
+                i := i + 100;
+            END LOOP;
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    # Transition tables are not allowed with UPDATE OF column lists, so the
+    # update trigger filters unchanged scores itself
+    op.execute(
+        """
+        CREATE TRIGGER user_stats_scores_inserted
+        AFTER INSERT ON user_stats
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_leaderboard_scores()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER user_stats_scores_updated
+        AFTER UPDATE ON user_stats
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_leaderboard_scores()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER user_stats_scores_deleted
+        AFTER DELETE ON user_stats
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_leaderboard_scores()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER user_stats_scores_deleted ON user_stats")
+    op.execute("DROP TRIGGER user_stats_scores_updated ON user_stats")
+    op.execute("DROP TRIGGER user_stats_scores_inserted ON user_stats")
+    op.execute("DROP FUNCTION notify_leaderboard_scores()")
@@ -0,0 +1,70 @@
+"""learning_events
+
+Revision ID: d8b41e7a3c25
+Revises: c6e2d7a19f54
+Create Date: 2026-10-18 20:21:06.583190
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "d8b41e7a3c25"
+down_revision: Union[str, None] = "c6e2d7a19f54"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE SEQUENCE learning_events_id_seq AS bigint")
+
+    # Monthly partitions are created by the app as events arrive
+    op.create_table(
+        "learning_events",
+        sa.Column(
+            "id",
+            sa.BigInteger(),
+            nullable=False,
+            server_default=sa.text("nextval('learning_events_id_seq')"),
+        ),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "event_type",
+            sa.String(length=32),
+            nullable=False,
+            comment="answer, practice_session or diamonds",
+        ),
+        sa.Column("word_id", sa.Integer(), nullable=True),
+        sa.Column("payload", postgresql.JSONB(), nullable=False),
+        sa.Column("occurred_at", sa.DateTime(), nullable=False),
+        sa.Column(
+            "recorded_at", sa.DateTime(), nullable=False, server_default=sa.func.now()
+        ),
+        sa.PrimaryKeyConstraint("id", "occurred_at"),
+        postgresql_partition_by="RANGE (occurred_at)",
+    )
+    op.execute("ALTER SEQUENCE learning_events_id_seq OWNED BY learning_events.id")
+
+    op.create_index("idx_learning_events_id", "learning_events", ["id"], unique=False)
+
+    op.create_table(
+        "learning_event_offsets",
+        sa.Column("consumer", sa.String(length=64), nullable=False),
+        sa.Column(
+            "last_event_id", sa.BigInteger(), nullable=False, server_default="0"
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now()
+        ),
+        sa.PrimaryKeyConstraint("consumer"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("learning_event_offsets")
+    op.drop_index("idx_learning_events_id")
+    op.drop_table("learning_events")
@@ -0,0 +1,33 @@
+"""lists_name_id
+
+Revision ID: e5c3a9d7f214
+Revises: b9e4d2a7c610
+Create Date: 2026-10-19 10:14:36.520814
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "e5c3a9d7f214"
+down_revision: Union[str, None] = "b9e4d2a7c610"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lets a category's list pages walk lists in (name, id) order from the
+    # cursor and probe list_categories per row, stopping at the page size,
+    # instead of sorting every list in the category
+    op.create_index(
+        "idx_lists_name_id",
+        "lists",
+        ["name", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_lists_name_id")
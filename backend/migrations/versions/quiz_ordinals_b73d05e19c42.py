@@ -0,0 +1,65 @@
+"""quiz_ordinals
+
+Revision ID: b73d05e19c42
+Revises: 4c1e8a2f7b90
+Create Date: 2026-10-18 10:03:55.402817
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "b73d05e19c42"
+down_revision: Union[str, None] = "4c1e8a2f7b90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "words",
+        sa.Column("quiz_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("quizzes", sa.Column("ordinal", sa.Integer(), nullable=True))
+
+    op.execute(
+        """
+        UPDATE quizzes
+        SET ordinal = numbered.ordinal
+        FROM (
+            SELECT id, ROW_NUMBER() OVER (PARTITION BY word_id ORDER BY id) - 1 AS ordinal
+            FROM quizzes
+        ) numbered
+        WHERE quizzes.id = numbered.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE words
+        SET quiz_count = counts.quiz_count
+        FROM (
+            SELECT word_id, COUNT(*) AS quiz_count
+            FROM quizzes
+            GROUP BY word_id
+        ) counts
+        WHERE words.id = counts.word_id
+        """
+    )
+
+    op.alter_column("quizzes", "ordinal", nullable=False)
+
+    op.create_index(
+        "idx_quizzes_word_id_ordinal",
+        "quizzes",
+        ["word_id", "ordinal"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_quizzes_word_id_ordinal")
+    op.drop_column("quizzes", "ordinal")
+    op.drop_column("words", "quiz_count")
@@ -0,0 +1,49 @@
+"""sentence_check_cache
+
+Revision ID: e2a9c4d81f36
+Revises: b73d05e19c42
+Create Date: 2026-10-18 13:27:08.640551
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "e2a9c4d81f36"
+down_revision: Union[str, None] = "b73d05e19c42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sentence_check_cache",
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("word", sa.Text(), nullable=False),
+        sa.Column("sentence", sa.Text(), nullable=False),
+        sa.Column("response", postgresql.JSONB(), nullable=False),
+        sa.Column("prompt_tokens", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "completion_tokens", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column(
+            "created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()
+        ),
+        sa.PrimaryKeyConstraint("cache_key"),
+    )
+
+    op.create_index(
+        "idx_sentence_check_cache_created_at",
+        "sentence_check_cache",
+        ["created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_sentence_check_cache_created_at")
+    op.drop_table("sentence_check_cache")
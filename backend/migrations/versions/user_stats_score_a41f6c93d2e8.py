@@ -0,0 +1,49 @@
+"""user_stats_score
+
+Revision ID: a41f6c93d2e8
+Revises: 5d8f3b6a2c17
+Create Date: 2026-10-18 16:55:31.804417
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "a41f6c93d2e8"
+down_revision: Union[str, None] = "5d8f3b6a2c17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Kept in step with every stats write by Postgres itself; adding a stored
+    # generated column rewrites user_stats once.
+    op.add_column(
+        "user_stats",
+        sa.Column(
+            "score",
+            sa.Float(),
+            sa.Computed(
+                "(total_words_learned * 0.4"
+                " + total_practice_time * 0.3"
+                " + current_streak * 0.3)::double precision",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+
+    op.create_index(
+        "idx_user_stats_score_user_id",
+        "user_stats",
+        ["score", "user_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_user_stats_score_user_id")
+    op.drop_column("user_stats", "score")
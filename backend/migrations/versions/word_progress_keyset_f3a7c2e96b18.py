@@ -0,0 +1,31 @@
+"""word_progress_keyset
+
+Revision ID: f3a7c2e96b18
+Revises: d8b41e7a3c25
+Create Date: 2026-10-18 21:48:52.740163
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "f3a7c2e96b18"
+down_revision: Union[str, None] = "d8b41e7a3c25"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_word_progress_user_id_updated_at_word_id",
+        "word_progress",
+        ["user_id", sa.text("updated_at DESC"), sa.text("word_id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_word_progress_user_id_updated_at_word_id")
@@ -0,0 +1,60 @@
+"""word_progress_review_schedule
+
+Revision ID: 4c1e8a2f7b90
+Revises: 91725e7254c0
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "4c1e8a2f7b90"
+down_revision: Union[str, None] = "91725e7254c0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "word_progress",
+        sa.Column("repetitions", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "word_progress",
+        sa.Column("interval_days", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "word_progress",
+        sa.Column("ease_factor", sa.Float(), nullable=False, server_default="2.5"),
+    )
+    op.add_column(
+        "word_progress",
+        sa.Column(
+            "next_due_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+    # Existing words become due in the order they were last practiced
+    op.execute("UPDATE word_progress SET next_due_at = updated_at")
+
+    op.create_index(
+        "idx_word_progress_user_id_next_due_at",
+        "word_progress",
+        ["user_id", "next_due_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_word_progress_user_id_next_due_at")
+    op.drop_column("word_progress", "next_due_at")
+    op.drop_column("word_progress", "ease_factor")
+    op.drop_column("word_progress", "interval_days")
+    op.drop_column("word_progress", "repetitions")
@@ -0,0 +1,112 @@
+"""Measure the per-request cost of authentication.
+
+Generates an RSA signing key, serves it from a local JWKS endpoint and times
+get_current_user three ways: verifying every request against a cold JWKS
+client, verifying with the signing keys cached, and answering from the token
+cache. The user lookup is stubbed out, so only the auth overhead is measured
+and no database is needed.
+
+    python -m scripts.bench_auth [--runs N]
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+import argparse
+import asyncio
+import json
+import threading
+import time
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwk, jwt
+
+from app.middleware import auth
+from app.middleware.jwks import JWKSClient
+from app.utils.cache import TTLCache
+from scripts.bench import measure, report
+
+
+ISSUER = "https://clerk.bench.local"
+KID = "bench"
+
+
+def serve_jwks(public_jwk: dict) -> ThreadingHTTPServer:
+    body = json.dumps({"keys": [public_jwk]}).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def run(runs: int) -> None:
+    pem = (
+        rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        .private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        .decode()
+    )
+    public_jwk = {**jwk.construct(pem, "RS256").public_key().to_dict(), "kid": KID}
+    server = serve_jwks(public_jwk)
+    url = f"http://127.0.0.1:{server.server_port}/.well-known/jwks.json"
+
+    auth.env.clerk_issuer = ISSUER
+    token = jwt.encode(
+        {"sub": "user_bench", "iss": ISSUER, "exp": time.time() + 3600},
+        pem,
+        algorithm="RS256",
+        headers={"kid": KID},
+    )
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    async def get_user_by_clerk_id(clerk_id):
+        return SimpleNamespace(id=1, clerk_id=clerk_id)
+
+    user_service = SimpleNamespace(get_user_by_clerk_id=get_user_by_clerk_id)
+
+    async def cold_keys():
+        auth.jwks_client = JWKSClient(url)
+        auth.token_cache = TTLCache(maxsize=0, ttl=0)
+        await auth.get_current_user(credentials, user_service)
+
+    async def cached_keys():
+        await auth.get_current_user(credentials, user_service)
+
+    try:
+        report("verify, JWKS fetched per request", await measure(cold_keys, runs // 10))
+
+        auth.jwks_client = JWKSClient(url)
+        auth.token_cache = TTLCache(maxsize=0, ttl=0)
+        report("verify, signing keys cached", await measure(cached_keys, runs))
+
+        auth.token_cache = TTLCache(maxsize=10000, ttl=60)
+        report("token cache hit", await measure(cached_keys, runs))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark authentication overhead")
+    parser.add_argument("--runs", type=int, default=2000, help="Timed calls per path")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.runs))
+
+
+if __name__ == "__main__":
+    main()
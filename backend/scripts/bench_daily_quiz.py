@@ -0,0 +1,138 @@
+"""Compare the daily quiz read before and after it became one statement.
+
+Seeds a vocabulary with several quizzes per word, a user subscribed to all of
+it with progress on every word, then times the original five round trip read
+(goal, ranked word ids, words, ROW_NUMBER() quiz pick, progress) against
+QuizService.get_daily_words_with_quizzes.
+
+    python -m scripts.bench_daily_quiz [--words N] [--quizzes N] [--goal N] [--runs N]
+"""
+
+import argparse
+import asyncio
+from typing import Any, Dict, List
+
+import asyncpg
+
+from app.config.db import create_pool, close_pool
+from app.models.quiz import Quiz
+from app.models.user import WordProgress
+from app.models.word import Word
+from app.services.quizzes import QuizService
+from scripts.bench import measure, report, run_prefix, seed_lists, seed_user, seed_words
+
+
+LEGACY_GOAL_QUERY = "SELECT daily_word_goal FROM user_preferences WHERE user_id = $1"
+
+LEGACY_WORD_IDS_QUERY = """
+    WITH RankedWords AS (
+        SELECT
+            w.id,
+            wp.recognition_mastery_score,
+            wp.updated_at,
+            CASE
+                WHEN wp.recognition_mastery_score BETWEEN 1 AND 3 THEN 1
+                WHEN wp.recognition_mastery_score < 3 THEN 2
+                ELSE 3
+            END as priority
+        FROM words w
+        JOIN word_progress wp ON w.id = wp.word_id
+        JOIN list_words lw ON w.id = lw.word_id
+        JOIN user_lists ul ON ul.list_id = lw.list_id
+        WHERE wp.user_id = $1
+        AND ul.user_id = $1
+        AND wp.recognition_mastery_score <= 4
+    )
+    SELECT DISTINCT id, priority, updated_at
+    FROM RankedWords
+    ORDER BY priority, updated_at ASC
+    LIMIT $2
+"""
+
+LEGACY_WORDS_QUERY = "SELECT * FROM words WHERE id = ANY($1)"
+
+LEGACY_QUIZZES_QUERY = """
+    WITH RankedQuizzes AS (
+        SELECT *, ROW_NUMBER() OVER (PARTITION BY word_id ORDER BY RANDOM()) as rn
+        FROM quizzes
+        WHERE word_id = ANY($1)
+    )
+    SELECT * FROM RankedQuizzes WHERE rn = 1
+"""
+
+LEGACY_PROGRESS_QUERY = """
+    SELECT * FROM word_progress
+    WHERE user_id = $1 AND word_id = ANY($2)
+"""
+
+
+async def legacy_daily_words(pool: asyncpg.Pool, user_id: int) -> List[Dict[str, Any]]:
+    goal_record = await pool.fetchrow(LEGACY_GOAL_QUERY, user_id)
+    goal = goal_record["daily_word_goal"] if goal_record else 5
+    word_ids = [r["id"] for r in await pool.fetch(LEGACY_WORD_IDS_QUERY, user_id, goal)]
+    if not word_ids:
+        return []
+
+    words = await pool.fetch(LEGACY_WORDS_QUERY, word_ids)
+    quizzes = {
+        r["word_id"]: Quiz(**dict(r)) for r in await pool.fetch(LEGACY_QUIZZES_QUERY, word_ids)
+    }
+    progress = {
+        r["word_id"]: WordProgress(**dict(r))
+        for r in await pool.fetch(LEGACY_PROGRESS_QUERY, user_id, word_ids)
+    }
+
+    result = []
+    for record in words:
+        word = dict(record)
+        quiz = quizzes.get(word["id"])
+        word["quiz"] = quiz.model_dump(by_alias=True) if quiz else None
+        word_progress = progress.get(word["id"])
+        word["word_progress"] = (
+            word_progress.model_dump(by_alias=True) if word_progress else None
+        )
+        result.append(Word(**word).model_dump(by_alias=True, exclude_none=False))
+    return result
+
+
+async def run(words: int, quizzes: int, goal: int, runs: int) -> None:
+    pool = await create_pool()
+    try:
+        prefix = run_prefix()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                word_ids = await seed_words(conn, prefix, words, quizzes)
+                list_ids = await seed_lists(conn, prefix, word_ids, 100)
+                user_id = await seed_user(conn, prefix, list_ids, word_ids, goal)
+            await conn.execute("ANALYZE")
+
+        print(
+            f"{words} words, {quizzes} quizzes per word, daily goal {goal}, "
+            f"user {user_id}"
+        )
+        service = QuizService(pool)
+        report(
+            "before: five round trips",
+            await measure(lambda: legacy_daily_words(pool, user_id), runs),
+        )
+        report(
+            "after: single statement",
+            await measure(lambda: service.get_daily_words_with_quizzes(user_id), runs),
+        )
+    finally:
+        await close_pool()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the daily quiz read")
+    parser.add_argument("--words", type=int, default=5000, help="Words to seed")
+    parser.add_argument("--quizzes", type=int, default=10, help="Quizzes per word")
+    parser.add_argument("--goal", type=int, default=10, help="Daily word goal")
+    parser.add_argument("--runs", type=int, default=200, help="Timed calls per path")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.words, args.quizzes, args.goal, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Time rank lookups over a million users.
+
+By default only the in-memory index is measured, so no database is needed:
+building it from a million scores, applying a score change, and ranking a
+score. With --db the same number of users is seeded and the COUNT(*) rank query
+used when the index is not loaded is timed next to it.
+
+    python -m scripts.bench_leaderboard_ranks [--users N] [--runs N] [--db]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from app.config.db import create_pool, close_pool
+from app.services.leaderboard_ranks import SortedScores
+from scripts.bench import measure, report, run_prefix
+
+
+async def bench_index(scores: list, runs: int) -> None:
+    started = time.perf_counter()
+    index = SortedScores(sorted(scores))
+    build_ms = (time.perf_counter() - started) * 1000
+    print(f"index built from {len(scores)} scores in {build_ms:.1f} ms")
+
+    # A score change is a removal and an insertion; each call makes two
+    async def update():
+        old = random.choice(scores)
+        index.remove(old)
+        index.add(old + 0.4)
+        index.remove(old + 0.4)
+        index.add(old)
+
+    async def rank():
+        index.count_at_most(random.choice(scores))
+
+    report("in-memory score change x2", await measure(update, runs))
+    report("in-memory rank", await measure(rank, runs))
+
+
+async def bench_count(users: int, scores: list, runs: int) -> None:
+    pool = await create_pool()
+    try:
+        prefix = run_prefix()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    """
+                    WITH seeded AS (
+                        INSERT INTO users (clerk_id, username, email)
+                        SELECT $1 || '-' || n, $1 || '-' || n, $1 || '-' || n || '@example.com'
+                        FROM generate_series(1, $2) n
+                        RETURNING id
+                    )
+                    INSERT INTO user_stats (user_id, total_words_learned, total_practice_time,
+                                            current_streak)
+                    SELECT id, (random() * 2000)::int, (random() * 5000)::int,
+                           (random() * 60)::int
+                    FROM seeded
+                    """,
+                    prefix,
+                    users,
+                )
+            await conn.execute("ANALYZE user_stats")
+            db_scores = [
+                r["score"]
+                for r in await conn.fetch(
+                    "SELECT score FROM user_stats TABLESAMPLE SYSTEM (1)"
+                )
+            ] or scores
+
+        report(
+            "COUNT(*) rank query",
+            await measure(
+                lambda: pool.fetchval(
+                    "SELECT COUNT(*) FROM user_stats WHERE score > $1",
+                    random.choice(db_scores),
+                ),
+                runs,
+            ),
+        )
+    finally:
+        await close_pool()
+
+
+async def run(users: int, runs: int, db: bool) -> None:
+    rng = random.Random(7)
+    scores = [
+        rng.randrange(2000) * 0.4 + rng.randrange(5000) * 0.3 + rng.randrange(60) * 0.3
+        for _ in range(users)
+    ]
+    await bench_index(scores, runs)
+    if db:
+        await bench_count(users, scores, min(runs, 200))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark leaderboard rank lookups")
+    parser.add_argument("--users", type=int, default=1_000_000, help="Users to rank")
+    parser.add_argument("--runs", type=int, default=10000, help="Timed calls per path")
+    parser.add_argument(
+        "--db", action="store_true", help="Also seed users and time the SQL rank"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run(args.users, args.runs, args.db))
+
+
+if __name__ == "__main__":
+    main()
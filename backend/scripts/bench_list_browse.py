@@ -0,0 +1,134 @@
+"""Time the list browse page at page sizes of 10, 50 and 100.
+
+Seeds lists with words and categories, and a user with some of them in their
+bank, then times ListService.get_all_lists for that user against the original
+implementation, which looked up each list's categories and in-bank flag with
+two more statements per row.
+
+    python -m scripts.bench_list_browse [--lists N] [--sizes 10,50,100] [--runs N]
+"""
+
+import argparse
+import asyncio
+from typing import List
+
+import asyncpg
+
+from app.config.db import create_pool, close_pool
+from app.services.lists import ListService
+from scripts.bench import measure, report, run_prefix, seed_lists, seed_user, seed_words
+
+
+LEGACY_ITEMS_QUERY = """
+    SELECT
+        lists.*,
+        COUNT(list_words.word_id) as word_count
+    FROM lists
+    LEFT JOIN list_words ON lists.id = list_words.list_id
+    GROUP BY lists.id
+    ORDER BY lists.name ASC
+    LIMIT $1 OFFSET $2
+"""
+
+LEGACY_CATEGORIES_QUERY = """
+    SELECT DISTINCT categories.name
+    FROM list_categories
+    JOIN categories ON list_categories.category_id = categories.id
+    WHERE list_categories.list_id = $1
+"""
+
+LEGACY_IN_BANK_QUERY = (
+    "SELECT COUNT(*) FROM user_lists WHERE user_id = $1 AND list_id = $2"
+)
+
+
+async def legacy_get_all_lists(pool: asyncpg.Pool, per_page: int, user_id: int) -> List:
+    async with pool.acquire() as conn:
+        await conn.fetchrow("SELECT COUNT(DISTINCT lists.id) FROM lists")
+        items = []
+        for record in await conn.fetch(LEGACY_ITEMS_QUERY, per_page, 0):
+            categories = await conn.fetch(LEGACY_CATEGORIES_QUERY, record["id"])
+            in_bank = await conn.fetchrow(LEGACY_IN_BANK_QUERY, user_id, record["id"])
+            items.append((record, categories, in_bank["count"] > 0))
+        return items
+
+
+async def seed_categories(conn: asyncpg.Connection, prefix: str, list_ids: List[int]) -> None:
+    category_ids = await conn.fetchval(
+        """
+        WITH inserted AS (
+            INSERT INTO categories (name, description, difficulty_level)
+            SELECT $1 || ' category ' || n, 'Benchmark category', 'beginner'
+            FROM generate_series(1, 20) n
+            RETURNING id
+        )
+        SELECT array_agg(id) FROM inserted
+        """,
+        prefix,
+    )
+    # Three categories per list
+    await conn.execute(
+        """
+        INSERT INTO list_categories (list_id, category_id)
+        SELECT l, ($2::int[])[1 + (l + k * 7) % cardinality($2::int[])]
+        FROM unnest($1::int[]) l, generate_series(0, 2) k
+        ON CONFLICT DO NOTHING
+        """,
+        list_ids,
+        category_ids,
+    )
+
+
+async def run(lists: int, sizes: List[int], runs: int) -> None:
+    pool = await create_pool()
+    try:
+        prefix = run_prefix()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                word_ids = await seed_words(conn, prefix, lists * 20, 1)
+                list_ids = await seed_lists(conn, prefix, word_ids, 20)
+                await seed_categories(conn, prefix, list_ids)
+                user_id = await seed_user(conn, prefix, list_ids[::3], [])
+            await conn.execute("ANALYZE")
+
+        service = ListService(pool=pool, word_service=None, quiz_service=None)
+        for size in sizes:
+            print(f"page size {size}, {lists} seeded lists")
+            report(
+                "  before: per-row lookups",
+                await measure(lambda: legacy_get_all_lists(pool, size, user_id), runs),
+            )
+            report(
+                "  after: get_all_lists",
+                await measure(
+                    lambda: service.get_all_lists(1, size, user_id=user_id), runs
+                ),
+            )
+            report(
+                "  after: get_all_lists with search",
+                await measure(
+                    lambda: service.get_all_lists(
+                        1, size, user_id=user_id, search_query="list"
+                    ),
+                    runs,
+                ),
+            )
+    finally:
+        await close_pool()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the list browse page")
+    parser.add_argument("--lists", type=int, default=2000, help="Lists to seed")
+    parser.add_argument(
+        "--sizes", default="10,50,100", help="Comma separated page sizes"
+    )
+    parser.add_argument("--runs", type=int, default=200, help="Timed calls per path")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    asyncio.run(run(args.lists, sizes, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Time random quiz sampling as the number of quizzes per word grows.
+
+For each quizzes-per-word size a fresh set of words is seeded, then picking one
+random quiz for a batch of them is timed two ways: the original
+ROW_NUMBER() OVER (PARTITION BY word_id ORDER BY RANDOM()) pick, which sorts
+every quiz of every requested word, and the ordinal lookup used by
+QuizService.get_random_quizzes_by_word_ids.
+
+    python -m scripts.bench_quiz_sampling [--sizes 3,10,25,50] [--words N] [--batch N] [--runs N]
+"""
+
+import argparse
+import asyncio
+import random
+from typing import List
+
+from app.config.db import create_pool, close_pool
+from app.services.quizzes import QuizService
+from scripts.bench import measure, report, run_prefix, seed_words
+
+
+ROW_NUMBER_QUERY = """
+    WITH RankedQuizzes AS (
+        SELECT *, ROW_NUMBER() OVER (PARTITION BY word_id ORDER BY RANDOM()) as rn
+        FROM quizzes
+        WHERE word_id = ANY($1)
+    )
+    SELECT * FROM RankedQuizzes WHERE rn = 1
+"""
+
+
+async def run(sizes: List[int], words: int, batch: int, runs: int) -> None:
+    pool = await create_pool()
+    try:
+        service = QuizService(pool)
+        prefix = run_prefix()
+        for size in sizes:
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    word_ids = await seed_words(conn, f"{prefix}-{size}", words, size)
+                await conn.execute("ANALYZE quizzes")
+                await conn.execute("ANALYZE words")
+
+            def pick() -> List[int]:
+                return random.sample(word_ids, batch)
+
+            print(f"{size} quizzes per word, {batch} words per call")
+            report(
+                "  ROW_NUMBER() ORDER BY RANDOM()",
+                await measure(lambda: pool.fetch(ROW_NUMBER_QUERY, pick()), runs),
+            )
+            report(
+                "  ordinal lookup",
+                await measure(
+                    lambda: service.get_random_quizzes_by_word_ids(pick()), runs
+                ),
+            )
+    finally:
+        await close_pool()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark random quiz sampling")
+    parser.add_argument(
+        "--sizes", default="3,10,25,50", help="Comma separated quizzes per word"
+    )
+    parser.add_argument("--words", type=int, default=2000, help="Words per size")
+    parser.add_argument("--batch", type=int, default=10, help="Words per call")
+    parser.add_argument("--runs", type=int, default=300, help="Timed calls per path")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    asyncio.run(run(sizes, args.words, args.batch, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Compare /users/me latency before and after its stats reads were consolidated.
+
+Seeds a user with progress on a list of words and a history of practice
+sessions, then times the reads behind /users/me: the original path (user,
+preferences, then six sequential stats queries) against
+UserService.get_user_by_id. Authentication is left out, as it is the same for
+both.
+
+    python -m scripts.bench_users_me [--words N] [--sessions N] [--runs N]
+"""
+
+import argparse
+import asyncio
+
+import asyncpg
+
+from app.config.db import create_pool, close_pool
+from app.services.users import UserService
+from scripts.bench import measure, report, run_prefix, seed_lists, seed_user, seed_words
+
+
+LEGACY_QUERIES = [
+    "SELECT * FROM users WHERE id = $1",
+    "SELECT * FROM user_preferences WHERE user_id = $1",
+    "SELECT * FROM user_stats WHERE user_id = $1",
+    "SELECT MAX(updated_at) as last_active FROM word_progress WHERE user_id = $1",
+    """
+    SELECT COUNT(*)
+    FROM word_progress
+    WHERE user_id = $1 AND recognition_mastery_score >= 5
+    """,
+    """
+    SELECT COUNT(*)
+    FROM word_progress
+    WHERE user_id = $1
+      AND DATE(updated_at) = CURRENT_DATE
+      AND practice_count > 0
+    """,
+    """
+    SELECT COALESCE(SUM(practice_time), 0) as practice_time
+    FROM user_practice_sessions
+    WHERE user_id = $1 AND DATE(created_at) = CURRENT_DATE
+    """,
+    """
+    SELECT daily_word_goal, daily_practice_time_goal
+    FROM user_preferences
+    WHERE user_id = $1
+    """,
+]
+
+
+async def legacy_get_user(pool: asyncpg.Pool, user_id: int) -> list:
+    return [await pool.fetchrow(query, user_id) for query in LEGACY_QUERIES]
+
+
+async def run(words: int, sessions: int, runs: int) -> None:
+    pool = await create_pool()
+    try:
+        prefix = run_prefix()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                word_ids = await seed_words(conn, prefix, words, 1)
+                list_ids = await seed_lists(conn, prefix, word_ids, 100)
+                user_id = await seed_user(conn, prefix, list_ids, word_ids)
+                await conn.execute(
+                    """
+                    INSERT INTO user_practice_sessions
+                        (user_id, practice_time, session_type, created_at)
+                    SELECT $1, 1 + n % 30, 'quiz',
+                           CURRENT_TIMESTAMP - make_interval(hours => n % 2000)
+                    FROM generate_series(1, $2) n
+                    """,
+                    user_id,
+                    sessions,
+                )
+            await conn.execute("ANALYZE")
+
+        print(f"user {user_id} with {words} practiced words and {sessions} sessions")
+        service = UserService(pool, list_service=None)
+        report(
+            "before: eight sequential reads",
+            await measure(lambda: legacy_get_user(pool, user_id), runs),
+        )
+        report(
+            "after: get_user_by_id",
+            await measure(lambda: service.get_user_by_id(user_id), runs),
+        )
+    finally:
+        await close_pool()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the /users/me reads")
+    parser.add_argument("--words", type=int, default=2000, help="Practiced words")
+    parser.add_argument("--sessions", type=int, default=5000, help="Practice sessions")
+    parser.add_argument("--runs", type=int, default=500, help="Timed calls per path")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.words, args.sessions, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+from contextlib import asynccontextmanager
+from typing import Any, Callable, List
+
+import pytest
+
+
+class CountingPool:
+    """Stands in for an asyncpg pool and connection, counting statements.
+
+    ``rows`` is called with the query and its arguments and returns the rows
+    the statement should yield, so tests control results without Postgres.
+    """
+
+    def __init__(self, rows: Callable[..., List[dict]]):
+        self.rows = rows
+        self.queries: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    async def fetch(self, query: str, *args: Any) -> List[dict]:
+        self.queries.append(query)
+        return self.rows(query, *args)
+
+    async def fetchrow(self, query: str, *args: Any):
+        self.queries.append(query)
+        rows = self.rows(query, *args)
+        return rows[0] if rows else None
+
+    async def fetchval(self, query: str, *args: Any):
+        self.queries.append(query)
+        rows = self.rows(query, *args)
+        return next(iter(rows[0].values())) if rows else None
+
+    async def execute(self, query: str, *args: Any) -> str:
+        self.queries.append(query)
+        return "OK"
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+
+@pytest.fixture
+def counting_pool():
+    return CountingPool
@@ -0,0 +1,169 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import JWTError, jwk, jwt
+
+from app.middleware import auth
+from app.middleware.jwks import JWKSClient
+from app.utils.cache import TTLCache
+
+
+ISSUER = "https://clerk.example.test"
+
+
+class SigningKey:
+    def __init__(self, kid: str):
+        self.kid = kid
+        self.pem = (
+            rsa.generate_private_key(public_exponent=65537, key_size=2048)
+            .private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+            .decode()
+        )
+
+    @property
+    def public_jwk(self) -> dict:
+        key = jwk.construct(self.pem, "RS256").public_key().to_dict()
+        return {**key, "kid": self.kid, "use": "sig"}
+
+    def sign(self, kid: str = None, **claims) -> str:
+        claims = {"sub": "user_1", "iss": ISSUER, "exp": time.time() + 300, **claims}
+        return jwt.encode(
+            claims, self.pem, algorithm="RS256", headers={"kid": kid or self.kid}
+        )
+
+
+@pytest.fixture
+def jwks_server():
+    """Serves ``server.keys`` as a JWKS document and counts the fetches."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            server.hits += 1
+            body = json.dumps({"keys": server.keys}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.keys = []
+    server.hits = 0
+    server.url = f"http://127.0.0.1:{server.server_port}/.well-known/jwks.json"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def signing_key():
+    return SigningKey("key-1")
+
+
+@pytest.fixture
+def verifier(jwks_server, signing_key, monkeypatch):
+    jwks_server.keys = [signing_key.public_jwk]
+    client = JWKSClient(jwks_server.url, min_refresh_interval=30)
+    monkeypatch.setattr(auth, "jwks_client", client)
+    monkeypatch.setattr(auth.env, "clerk_issuer", ISSUER)
+    return client
+
+
+def test_valid_signature_is_accepted(verifier, signing_key):
+    payload = asyncio.run(auth.verify_token(signing_key.sign()))
+
+    assert payload["sub"] == "user_1"
+
+
+def test_bad_signature_is_rejected(verifier, signing_key):
+    forged = SigningKey(signing_key.kid).sign()
+
+    with pytest.raises(JWTError):
+        asyncio.run(auth.verify_token(forged))
+
+
+def test_wrong_issuer_is_rejected(verifier, signing_key):
+    token = signing_key.sign(iss="https://evil.example.test")
+
+    with pytest.raises(JWTError):
+        asyncio.run(auth.verify_token(token))
+
+
+def test_unknown_kid_refreshes_keys_at_most_once_per_interval(
+    verifier, jwks_server, signing_key
+):
+    rotated = SigningKey("key-2")
+
+    async def scenario():
+        await auth.verify_token(signing_key.sign())
+        assert jwks_server.hits == 1
+
+        # Rotated on the server just after the keys were fetched: the refresh
+        # is rate limited, so the new kid is unknown until the interval passes
+        jwks_server.keys = [signing_key.public_jwk, rotated.public_jwk]
+        for _ in range(3):
+            with pytest.raises(JWTError):
+                await auth.verify_token(rotated.sign())
+        assert jwks_server.hits == 1
+
+        verifier._fetched_at -= verifier.min_refresh_interval
+        payload = await auth.verify_token(rotated.sign())
+        assert payload["sub"] == "user_1"
+        assert jwks_server.hits == 2
+
+    asyncio.run(scenario())
+
+
+def test_token_cache_entry_expires_with_the_token(
+    verifier, signing_key, monkeypatch
+):
+    cache = TTLCache(maxsize=10, ttl=60)
+    monkeypatch.setattr(auth, "token_cache", cache)
+    clock = SimpleNamespace(monotonic=lambda: 1000.0)
+    monkeypatch.setattr("app.utils.cache.time", clock)
+
+    calls = []
+
+    async def get_user_by_clerk_id(clerk_id):
+        calls.append(clerk_id)
+        return SimpleNamespace(id=1, clerk_id=clerk_id)
+
+    user_service = SimpleNamespace(get_user_by_clerk_id=get_user_by_clerk_id)
+    token = signing_key.sign(exp=time.time() + 5)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    user = asyncio.run(auth.get_current_user(credentials, user_service))
+    assert user.clerk_id == "user_1"
+
+    # Cached for the token's remaining 5 seconds, not the cache's 60
+    clock.monotonic = lambda: 1004.0
+    assert cache.get(token) == "user_1"
+    clock.monotonic = lambda: 1006.0
+    assert cache.get(token) is None
+
+    # Once evicted the token is verified again, and rejected when expired
+    expired = signing_key.sign(exp=time.time() - 5)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=expired)
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(auth.get_current_user(credentials, user_service))
+    assert error.value.status_code == 401
+    assert "expired" in error.value.detail
+    assert cache.get(expired) is None
+    assert calls == ["user_1"]
@@ -0,0 +1,109 @@
+import asyncio
+import json
+from datetime import date, datetime, timezone
+
+from app.services.events import ANSWER, DIAMONDS, PRACTICE_SESSION, EventAggregator
+
+
+def event(event_id, event_type, payload, word_id=None, **overrides):
+    return {
+        "id": event_id,
+        "user_id": 1,
+        "event_type": event_type,
+        "word_id": word_id,
+        "payload": payload if isinstance(payload, str) else json.dumps(payload),
+        "occurred_at": datetime(2026, 10, 17, 23, 50),
+        "user_exists": True,
+        "word_exists": True,
+        "local_date": date(2026, 10, 17),
+        **overrides,
+    }
+
+
+def test_bad_events_are_skipped_and_the_offset_advances(counting_pool):
+    events = [
+        event(1, ANSWER, {"practice_count": 1, "success_count": 1}, word_id=10),
+        event(2, ANSWER, {"practice_count": 1}, word_id=11, word_exists=False),
+        event(3, ANSWER, {"practice_count": "many"}, word_id=12),
+        event(4, PRACTICE_SESSION, "not json"),
+        event(5, DIAMONDS, {"amount": 5}, user_exists=False),
+        event(6, DIAMONDS, {"amount": 3}),
+    ]
+    progress_args = []
+    executed = []
+
+    def rows(query, *args):
+        if "FOR UPDATE" in query:
+            return [{"last_event_id": 0}]
+        if "FROM learning_events" in query:
+            return events
+        if "WITH input AS" in query:
+            progress_args.append(args)
+            return [{"word_id": 10, "has_stats": True}]
+        return []
+
+    pool = counting_pool(rows)
+
+    async def execute(query, *args):
+        pool.queries.append(query)
+        executed.append((query, args))
+        return "OK"
+
+    pool.execute = execute
+    aggregator = EventAggregator(batch_size=100, interval=1, settle_seconds=0)
+
+    assert asyncio.run(aggregator.run_once(pool)) == 6
+
+    # The offset moves past the skipped events, including the last one
+    advance = [args for query, args in executed if "SET last_event_id" in query]
+    assert advance == [(aggregator.consumer, 6)]
+    assert aggregator.stats()["skipped_by_reason"] == {
+        "deleted_word": 1,
+        "malformed": 2,
+        "deleted_user": 1,
+    }
+    assert aggregator.folded == 2
+
+    # Only the valid answer is applied, as of when it was given
+    assert len(progress_args) == 1
+    assert progress_args[0][1] == [10]
+    assert progress_args[0][8] == [
+        datetime(2026, 10, 17, 23, 50, tzinfo=timezone.utc)
+    ]
+    flush = [args for query, args in executed if "unnest($5::int[]" in query]
+    assert flush[0][4:6] == ([1], [3])
+
+
+def test_answers_on_different_days_are_applied_separately(counting_pool):
+    late = datetime(2026, 10, 17, 23, 59)
+    early = datetime(2026, 10, 18, 0, 1)
+    events = [
+        event(1, ANSWER, {"practice_count": 1}, word_id=10, occurred_at=late),
+        event(
+            2,
+            ANSWER,
+            {"practice_count": 1},
+            word_id=11,
+            occurred_at=early,
+            local_date=date(2026, 10, 18),
+        ),
+    ]
+    progress_args = []
+
+    def rows(query, *args):
+        if "FOR UPDATE" in query:
+            return [{"last_event_id": 0}]
+        if "FROM learning_events" in query:
+            return events
+        if "WITH input AS" in query:
+            progress_args.append(args)
+            return [{"word_id": args[1][0], "has_stats": True}]
+        return []
+
+    aggregator = EventAggregator(batch_size=100, interval=1, settle_seconds=0)
+    asyncio.run(aggregator.run_once(counting_pool(rows)))
+
+    assert [(args[1], args[8]) for args in progress_args] == [
+        ([10], [late.replace(tzinfo=timezone.utc)]),
+        ([11], [early.replace(tzinfo=timezone.utc)]),
+    ]
@@ -0,0 +1,48 @@
+import asyncio
+
+from app.services.leaderboard import LeaderboardService
+
+SCORES = {5: 10.0, 4: 10.0, 3: 9.0, 2: 7.0}
+
+
+def entry_row(user_id: int) -> dict:
+    return {
+        "id": user_id,
+        "username": f"user{user_id}",
+        "profile_picture_url": None,
+        "score": SCORES[user_id],
+        "total_words_learned": 0,
+        "total_practice_time": 0,
+        "total_diamonds": 0,
+        "total_streak": 0,
+        "last_active": None,
+    }
+
+
+def rows(query, *args):
+    if "unnest" in query:
+        return [
+            {"score": score, "rank": sum(s > score for s in SCORES.values()) + 1}
+            for score in args[0]
+        ]
+    if "UNION ALL" in query:
+        # The window around user 3 with radius 1 starts at user 4, below user
+        # 5 who shares its score
+        return [entry_row(4), entry_row(3), entry_row(2)]
+    if "WHERE user_id" in query:
+        return [{"score": SCORES[args[0]]}]
+    return [{"count": len(SCORES)}]
+
+
+def test_standing_ranks_a_window_that_starts_mid_tie(counting_pool):
+    service = LeaderboardService(counting_pool(rows))
+
+    standing = asyncio.run(service.get_standing(3, radius=1))
+
+    assert [(entry.id, entry.rank) for entry in standing.entries] == [
+        (4, 1),
+        (3, 3),
+        (2, 4),
+    ]
+    assert standing.rank == 3
+    assert standing.total_users == 4
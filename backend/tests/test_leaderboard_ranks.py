@@ -0,0 +1,69 @@
+import json
+import random
+
+from app.services.leaderboard_ranks import (
+    LeaderboardRanks,
+    SortedScores,
+    parse_snapshot,
+    visible_in,
+)
+
+
+def test_sorted_scores_matches_a_sorted_list():
+    rng = random.Random(7)
+    expected = sorted(rng.choice(range(200)) * 0.3 for _ in range(5000))
+    scores = SortedScores(expected, load=16)
+
+    for _ in range(5000):
+        if expected and rng.random() < 0.5:
+            score = rng.choice(expected)
+            expected.remove(score)
+            assert scores.remove(score)
+        else:
+            score = rng.choice(range(250)) * 0.3
+            expected.append(score)
+            expected.sort()
+            scores.add(score)
+
+        probe = rng.choice(range(-5, 260)) * 0.3
+        assert scores.count_at_most(probe) == sum(1 for s in expected if s <= probe)
+        assert len(scores) == len(expected)
+
+    assert not scores.remove(10_000.0)
+
+
+def test_sorted_scores_drains_to_empty_and_refills():
+    scores = SortedScores([1.0, 2.0, 2.0], load=1)
+    for score in (2.0, 1.0, 2.0):
+        assert scores.remove(score)
+    assert len(scores) == 0 and scores.count_at_most(5.0) == 0
+    scores.add(3.0)
+    assert scores.count_at_most(3.0) == 1
+
+
+def test_snapshot_visibility():
+    snapshot = parse_snapshot("100:105:101,103")
+    assert visible_in(99, snapshot)
+    assert visible_in(102, snapshot)
+    assert not visible_in(101, snapshot)
+    assert not visible_in(105, snapshot)
+
+
+def notification(xid, removed=(), added=()):
+    return json.dumps({"xid": xid, "removed": list(removed), "added": list(added)})
+
+
+def test_changes_in_the_snapshot_are_not_applied_twice():
+    ranks = LeaderboardRanks(dsn=None, bucket_retention_days=14)
+    ranks._scores = SortedScores([1.0, 2.0, 3.0])
+    ranks._snapshot = parse_snapshot("100:102:")
+
+    # Committed before the snapshot: already part of the loaded scores
+    ranks._on_notification(None, 0, "", notification(99, [0.5], [2.0]))
+    # Committed after it: moves a user from 1.0 to 4.0
+    ranks._on_notification(None, 0, "", notification(102, [1.0], [4.0]))
+
+    assert ranks.rank(4.0) == 1
+    assert ranks.rank(3.0) == 2
+    assert len(ranks._scores) == 3
+    assert ranks.mismatches == 0
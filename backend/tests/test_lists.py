@@ -0,0 +1,104 @@
+from datetime import datetime
+import asyncio
+
+import asyncpg
+import pytest
+
+from app.models.list import ListAlreadyExistsError, WordListBrief, WordListCreate
+from app.services.lists import ListService
+from app.utils.pagination import InvalidCursorError, encode_cursor
+
+
+def list_row(list_id: int) -> dict:
+    return {
+        "id": list_id,
+        "name": f"List {list_id}",
+        "description": None,
+        "difficulty_level": "beginner",
+        "icon_name": None,
+        "created_at": datetime(2025, 1, 1),
+        "updated_at": datetime(2025, 1, 1),
+        "word_count": 20,
+        "categories": ["travel", "food"],
+        "in_users_bank": list_id % 2 == 0,
+    }
+
+
+def count_browse_queries(counting_pool, list_count: int) -> int:
+    def rows(query, *args):
+        if "COUNT(*) FROM lists" in query:
+            return [{"count": list_count}]
+        return [list_row(i) for i in range(list_count)]
+
+    pool = counting_pool(rows)
+    service = ListService(pool, word_service=None, quiz_service=None)
+    page = asyncio.run(service.get_all_lists(per_page=list_count, user_id=1))
+    assert len(page.items) == list_count
+    return pool.count
+
+
+def test_get_all_lists_query_count_is_constant(counting_pool):
+    assert count_browse_queries(counting_pool, 1) == count_browse_queries(
+        counting_pool, 100
+    ) == 2
+
+
+def brief_row(list_id: int) -> dict:
+    row = list_row(list_id)
+    return {key: row[key] for key in WordListBrief.model_fields if key in row}
+
+
+def test_category_pages_use_separate_first_and_next_statements(counting_pool):
+    pool = counting_pool(lambda query, *args: [brief_row(i) for i in range(3)])
+    service = ListService(pool, word_service=None, quiz_service=None)
+
+    first = asyncio.run(service.get_lists_by_category_after(7, per_page=2))
+    asyncio.run(
+        service.get_lists_by_category_after(
+            7, cursor=first.page_info.next_cursor, per_page=2
+        )
+    )
+
+    first_query, next_query = pool.queries
+    assert "IS NULL" not in first_query and ">" not in first_query
+    assert "(l.name, l.id) > ($2::text, $3::int)" in next_query
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1, 2],
+        ["List 1", "2"],
+        ["List 1", True],
+        ["List 1", 2**40],
+        ["List 1", -1],
+        ["List\x00", 2],
+        [None, None],
+    ],
+)
+def test_category_pages_reject_malformed_cursor_values(counting_pool, values):
+    pool = counting_pool(lambda query, *args: [])
+    service = ListService(pool, word_service=None, quiz_service=None)
+
+    with pytest.raises(InvalidCursorError):
+        asyncio.run(
+            service.get_lists_by_category_after(7, cursor=encode_cursor(values))
+        )
+    assert pool.count == 0
+
+
+def test_import_list_with_a_taken_name_raises_already_exists(counting_pool):
+    def rows(query, *args):
+        if "INSERT INTO lists" in query:
+            raise asyncpg.UniqueViolationError.new(
+                {"M": "duplicate key value", "C": "23505", "t": "lists"}
+            )
+        return []
+
+    service = ListService(counting_pool(rows), word_service=None, quiz_service=None)
+    word_list = WordListCreate(
+        name="Taken", description=None, difficulty_level="beginner", words=[]
+    )
+
+    with pytest.raises(ListAlreadyExistsError):
+        asyncio.run(service.import_list(word_list))
@@ -0,0 +1,60 @@
+from types import SimpleNamespace
+import asyncio
+import json
+
+from app.models.llm import SentenceCheckBatchRequest, SentenceCheckRequest
+from app.services import llm
+
+
+def test_batch_reads_cache_and_examples_once_before_one_completion(
+    counting_pool, monkeypatch
+):
+    completions = []
+
+    async def create(**kwargs):
+        completions.append(kwargs)
+        count = kwargs["messages"][1]["content"].count("Index:")
+        content = json.dumps(
+            {
+                "results": [
+                    {"index": i, "isCorrect": True, "correctUsage": "", "message": "Ok."}
+                    for i in range(count)
+                ]
+            }
+        )
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=None,
+        )
+
+    monkeypatch.setattr(
+        llm,
+        "client",
+        SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create))),
+    )
+    monkeypatch.setattr(llm.env, "llm_batch_max_tokens", 100000)
+
+    def rows(query, *args):
+        if "FROM words" in query:
+            return [{"word": "gather", "examples": ["We gather at noon."]}]
+        return []
+
+    pool = counting_pool(rows)
+    items = [
+        SentenceCheckRequest(word="gather", sentence=f"Batch {i} gather here today.")
+        for i in range(48)
+    ]
+    items.append(SentenceCheckRequest(word="gather", sentence="We gather at noon."))
+    items.append(SentenceCheckRequest(word="gather", sentence="gather"))
+    service = llm.LLMService(pool)
+
+    response = asyncio.run(
+        service.check_sentences(SentenceCheckBatchRequest(items=items))
+    )
+
+    reads = [query for query in pool.queries if query.lstrip().startswith("SELECT")]
+    assert len(reads) == 2
+    assert all("ANY($1::text[])" in query for query in reads)
+    assert len(completions) == 1
+    assert len(response.results) == 50
+    assert response.results[-1].isCorrect is False
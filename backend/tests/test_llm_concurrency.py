@@ -0,0 +1,100 @@
+from datetime import datetime
+from types import SimpleNamespace
+import asyncio
+import json
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from app.api.llm import router as llm_router
+from app.api.quizzes import router as quizzes_router
+from app.config.env import env
+from app.services import llm
+from app.services.llm import LLMService, get_llm_service
+from app.services.quizzes import QuizService, get_quiz_service
+
+
+def stalled_client(release: asyncio.Event, started: list):
+    """An upstream that holds every completion until ``release`` is set."""
+
+    async def create(**kwargs):
+        started.append(kwargs)
+        await release.wait()
+        content = json.dumps(
+            {"isCorrect": True, "correctUsage": "", "message": "Well done."}
+        )
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=None,
+        )
+
+    return SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+
+
+def quiz_row(query, *args):
+    return [
+        {
+            "id": 1,
+            "word_id": 7,
+            "quiz_type": "multiple_choice",
+            "question": "Pick one",
+            "options": ["a", "b"],
+            "correct_options": ["a"],
+            "created_at": datetime(2025, 1, 1),
+            "updated_at": datetime(2025, 1, 1),
+        }
+    ]
+
+
+def test_saturated_llm_slots_do_not_block_other_endpoints(counting_pool, monkeypatch):
+    monkeypatch.setattr(env, "llm_queue_timeout", 0.2)
+    llm_pool = counting_pool(lambda query, *args: [])
+    quiz_pool = counting_pool(quiz_row)
+
+    app = FastAPI()
+    app.include_router(llm_router, prefix="/llm")
+    app.include_router(quizzes_router, prefix="/quizzes")
+    app.dependency_overrides[get_llm_service] = lambda: LLMService(llm_pool)
+    app.dependency_overrides[get_quiz_service] = lambda: QuizService(quiz_pool)
+
+    async def scenario():
+        release = asyncio.Event()
+        started = []
+        monkeypatch.setattr(llm, "client", stalled_client(release, started))
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+
+            def check(n: int):
+                return http.post(
+                    "/llm/check-sentence",
+                    json={"word": "linger", "sentence": f"We linger here {n} times."},
+                )
+
+            holders = [
+                asyncio.create_task(check(n)) for n in range(env.llm_max_concurrency)
+            ]
+            while len(started) < env.llm_max_concurrency:
+                await asyncio.sleep(0.01)
+            assert llm.llm_semaphore.locked()
+
+            # Every slot is taken: other endpoints still answer right away
+            began = time.perf_counter()
+            quiz = await http.get("/quizzes/7")
+            quiz_seconds = time.perf_counter() - began
+
+            # and one more sentence check is turned away after the queue timeout
+            overflow = await check(env.llm_max_concurrency)
+
+            release.set()
+            finished = await asyncio.gather(*holders)
+            return quiz, quiz_seconds, overflow, finished
+
+    quiz, quiz_seconds, overflow, finished = asyncio.run(scenario())
+
+    assert quiz.json()["success"] is True
+    assert quiz_seconds < env.llm_queue_timeout
+    assert overflow.status_code == 503
+    assert [response.status_code for response in finished] == [200] * len(finished)
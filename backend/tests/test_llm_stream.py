@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+import asyncio
+
+from app.config.env import env
+from app.models.llm import SentenceCheckRequest
+from app.services import llm
+
+
+def stub_stream_client(content: str, chunk_size: int = 8):
+    async def chunks():
+        for start in range(0, len(content), chunk_size):
+            await asyncio.sleep(0)
+            delta = SimpleNamespace(content=content[start : start + chunk_size])
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)], usage=None)
+
+    async def create(**kwargs):
+        return chunks()
+
+    return SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+
+
+def test_llm_slot_is_released_while_the_client_is_still_reading(
+    counting_pool, monkeypatch
+):
+    content = '{"isCorrect": true, "correctUsage": "", "message": "Well done."}'
+    monkeypatch.setattr(llm, "client", stub_stream_client(content))
+    service = llm.LLMService(counting_pool(lambda query, *args: []))
+    request = SentenceCheckRequest(
+        word="linger", sentence="The slow reader let the stream linger."
+    )
+
+    async def run():
+        events = service.stream_sentence_check(request)
+        first = await events.__anext__()
+        # The client stalls after the verdict; upstream still finishes
+        for _ in range(50):
+            await asyncio.sleep(0)
+        slots_free = llm.llm_semaphore._value
+        rest = [event async for event in events]
+        return first, slots_free, rest
+
+    first, slots_free, rest = asyncio.run(run())
+    assert first == ("verdict", {"isCorrect": True})
+    assert slots_free == env.llm_max_concurrency
+    assert [event for event, _ in rest] == ["explanation"]
+
+
+def test_non_boolean_verdict_is_not_streamed_early(counting_pool, monkeypatch):
+    content = '{"isCorrect": "false", "correctUsage": "", "message": "Not quite."}'
+    monkeypatch.setattr(llm, "client", stub_stream_client(content))
+    service = llm.LLMService(counting_pool(lambda query, *args: []))
+    request = SentenceCheckRequest(
+        word="quibble", sentence="They quibble over a string verdict."
+    )
+
+    async def run():
+        return [event async for event in service.stream_sentence_check(request)]
+
+    events = asyncio.run(run())
+    assert events[0] == ("verdict", {"isCorrect": False})
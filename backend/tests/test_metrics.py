@@ -0,0 +1,34 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import metrics
+
+
+def client() -> TestClient:
+    app = FastAPI()
+    app.include_router(metrics.router, prefix="/metrics")
+    return TestClient(app)
+
+
+def test_metrics_are_disabled_without_a_configured_token(monkeypatch):
+    monkeypatch.setattr(metrics.env, "metrics_token", None)
+
+    response = client().get("/metrics/", headers={"Authorization": "Bearer x"})
+
+    assert response.status_code == 404
+
+
+def test_metrics_require_the_configured_token(monkeypatch):
+    monkeypatch.setattr(metrics.env, "metrics_token", "s3cret")
+
+    assert client().get("/metrics/").status_code == 401
+    assert (
+        client()
+        .get("/metrics/", headers={"Authorization": "Bearer wrong"})
+        .status_code
+        == 401
+    )
+
+    response = client().get("/metrics/", headers={"Authorization": "Bearer s3cret"})
+    assert response.status_code == 200
+    assert "token_cache" in response.json()["payload"]
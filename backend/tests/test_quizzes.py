@@ -0,0 +1,38 @@
+import asyncio
+import json
+
+import pytest
+
+from app.models.quiz import QuizCreate, QuizType
+from app.models.word import WordNotFoundError
+from app.services.quizzes import QuizService
+
+
+def test_daily_words_prefer_due_reviews_and_backfill_unmastered_words(counting_pool):
+    pool = counting_pool(lambda query, *args: [{"words": json.dumps([{"id": 7}])}])
+    service = QuizService(pool)
+
+    assert asyncio.run(service.get_daily_words_with_quizzes(1)) == [{"id": 7}]
+
+    (query,) = pool.queries
+    due, backfill = query.split("UNION ALL")
+    due = due[due.index("due_words AS") :]
+    assert "next_due_at <= CURRENT_TIMESTAMP" in due
+    assert "recognition_mastery_score" not in due
+    assert "next_due_at > CURRENT_TIMESTAMP" in backfill
+    assert "recognition_mastery_score <= 4" in backfill
+
+
+def test_insert_quiz_for_missing_word_raises_not_found(counting_pool):
+    pool = counting_pool(lambda query, *args: [])
+    service = QuizService(pool)
+    quiz = QuizCreate(
+        word_id=404,
+        quiz_type=QuizType.MULTIPLE_CHOICE,
+        question="Pick one",
+        options=["a", "b"],
+        correct_options=["a"],
+    )
+
+    with pytest.raises(WordNotFoundError):
+        asyncio.run(service.insert_quiz(quiz))
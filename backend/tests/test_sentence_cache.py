@@ -0,0 +1,37 @@
+import asyncio
+
+from app.models.llm import SentenceCheckResponse
+from app.services.sentence_cache import SentenceCheckCache
+
+
+def test_prune_runs_in_the_background_one_at_a_time(counting_pool):
+    pool = counting_pool(lambda query, *args: [])
+    release = asyncio.Event()
+    prunes_started = []
+
+    async def execute(query, *args):
+        pool.queries.append(query)
+        if query.lstrip().startswith("DELETE"):
+            prunes_started.append(query)
+            await release.wait()
+        return "OK"
+
+    pool.execute = execute
+    cache = SentenceCheckCache(ttl=60, max_rows=10, memory_size=10, prune_every=1)
+    response = SentenceCheckResponse(isCorrect=True, correctUsage="", message="Ok.")
+
+    async def run():
+        # Every write is due a prune, but none of them waits for it
+        for n in range(3):
+            await asyncio.wait_for(
+                cache.set(pool, f"key{n}", "word", f"sentence {n}", response),
+                timeout=1,
+            )
+        await asyncio.sleep(0)
+        running = len(prunes_started)
+        release.set()
+        await cache._prune_task
+        return running
+
+    assert asyncio.run(run()) == 1
+    assert cache.prunes == 1
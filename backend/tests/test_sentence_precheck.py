@@ -0,0 +1,95 @@
+import pytest
+
+from app.services.sentence_precheck import SentencePrecheck
+
+
+@pytest.mark.parametrize(
+    "word, sentence",
+    [
+        ("sit", "She sat by the window all afternoon."),
+        ("shoot", "He shot the ball from half court."),
+        ("pay", "We paid the bill before leaving."),
+        ("say", "The teacher said we could go early."),
+        ("meet", "They met at a cafe downtown."),
+        ("sleep", "The baby slept through the night."),
+        ("swim", "I swam across the lake."),
+        ("swim", "She has swum in three oceans."),
+        ("drink", "He drank a glass of water."),
+        ("drink", "The milk was drunk before noon."),
+        ("ring", "The phone rang twice."),
+        ("ring", "The bell has rung for lunch."),
+        ("choose", "She chose the red coat."),
+        ("choose", "He was chosen as captain."),
+        ("freeze", "The lake froze overnight."),
+        ("freeze", "The peas were frozen solid."),
+        ("hide", "The cat hid under the bed."),
+        ("hide", "The key was hidden in a drawer."),
+        ("bite", "The dog bit the mail carrier."),
+        ("bite", "He was bitten by a mosquito."),
+        ("dig", "They dug a hole in the garden."),
+        ("light", "She lit a candle at dinner."),
+        ("be", "It was a cold morning."),
+        ("be", "We were late for the train."),
+        ("mouse", "Two mice lived in the barn."),
+        ("person", "Many people came to the concert."),
+        ("woman", "The women won the relay race."),
+        ("foot", "My feet hurt after the hike."),
+        ("leaf", "The leaves turned orange in October."),
+        ("knife", "Put the knives in the drawer."),
+        ("ox", "The oxen pulled the cart."),
+        ("good", "This plan is better than the last one."),
+        ("bad", "The storm was worse than expected."),
+    ],
+)
+def test_irregular_forms_are_left_to_the_model(word, sentence):
+    assert SentencePrecheck().check(word, sentence) is None
+
+
+@pytest.mark.parametrize("sentence", ["", "   ", "ephemeral", "Ephemeral!"])
+def test_empty_or_bare_word_is_rejected(sentence):
+    precheck = SentencePrecheck()
+
+    verdict = precheck.check("ephemeral", sentence)
+
+    assert verdict is not None and verdict.isCorrect is False
+    assert precheck.stats()["by_reason"] == {"single_token": 1}
+
+
+def test_copied_example_is_accepted():
+    examples = ["Fame is often ephemeral."]
+
+    verdict = SentencePrecheck().check("ephemeral", "fame is often EPHEMERAL", examples)
+
+    assert verdict is not None and verdict.isCorrect is True
+    assert verdict.correctUsage == examples[0]
+
+
+@pytest.mark.parametrize(
+    "word, sentence",
+    [
+        ("happy", "She smiled happily at the news."),
+        ("gentle", "He spoke gently to the horse."),
+        ("criterion", "The criteria were clear."),
+        ("cactus", "The cacti bloomed in spring."),
+        ("wolf", "Wolves howled all night."),
+        ("weep", "She wept at the ending."),
+        ("tree", "The trees swayed in the wind."),
+        ("kind", "Her unkindness surprised us."),
+    ],
+)
+def test_derived_and_close_forms_are_left_to_the_model(word, sentence):
+    assert SentencePrecheck().check(word, sentence) is None
+
+
+def test_sentence_without_any_form_of_the_word_is_rejected():
+    precheck = SentencePrecheck()
+
+    verdict = precheck.check("ephemeral", "The weather is nice today.")
+
+    assert verdict is not None and verdict.isCorrect is False
+    assert precheck.stats()["by_reason"] == {"word_missing": 1}
+
+
+@pytest.mark.parametrize("word", ["ox", "give up"])
+def test_short_words_and_phrases_are_never_reported_missing(word):
+    assert SentencePrecheck().check(word, "The weather is nice today.") is None
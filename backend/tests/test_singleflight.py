@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+import asyncio
+
+from app.models.llm import SentenceCheckRequest
+from app.services import llm
+from app.utils.singleflight import SingleFlight
+
+
+def test_concurrent_calls_with_one_key_run_once():
+    flight = SingleFlight()
+    upstream_calls = 0
+
+    async def upstream():
+        nonlocal upstream_calls
+        upstream_calls += 1
+        await asyncio.sleep(0.01)
+        return "verdict"
+
+    async def run():
+        return await asyncio.gather(
+            *(flight.do("same", upstream) for _ in range(50))
+        )
+
+    assert asyncio.run(run()) == ["verdict"] * 50
+    assert upstream_calls == 1
+    assert flight.stats() == {"calls": 1, "coalesced": 49, "in_flight": 0}
+
+
+def test_waiters_share_the_upstream_exception():
+    flight = SingleFlight()
+
+    async def upstream():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream failed")
+
+    async def run():
+        return await asyncio.gather(
+            *(flight.do("same", upstream) for _ in range(5)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert flight.calls == 1
+
+
+def test_concurrent_identical_sentence_checks_make_one_completion(
+    counting_pool, monkeypatch
+):
+    completions = 0
+
+    async def create(**kwargs):
+        nonlocal completions
+        completions += 1
+        await asyncio.sleep(0.01)
+        content = '{"isCorrect": true, "correctUsage": "", "message": "Nice."}'
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=None,
+        )
+
+    stub_client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+    monkeypatch.setattr(llm, "client", stub_client)
+    service = llm.LLMService(counting_pool(lambda query, *args: []))
+    request = SentenceCheckRequest(
+        word="ephemeral", sentence="The singleflight test was ephemeral."
+    )
+
+    async def run():
+        return await asyncio.gather(
+            *(service.check_sentence(request) for _ in range(20))
+        )
+
+    results = asyncio.run(run())
+    assert completions == 1
+    assert all(result.isCorrect for result in results)
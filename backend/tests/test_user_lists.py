@@ -0,0 +1,31 @@
+from datetime import datetime
+import asyncio
+
+from app.services.users import UserService
+
+
+def list_row(list_id: int) -> dict:
+    return {
+        "id": list_id,
+        "name": f"List {list_id}",
+        "description": None,
+        "difficulty_level": "beginner",
+        "icon_name": None,
+        "created_at": datetime(2025, 1, 1),
+        "updated_at": datetime(2025, 1, 1),
+        "is_favorite": False,
+        "word_count": 20,
+        "mastered_count": 5,
+    }
+
+
+def count_queries(counting_pool, list_count: int) -> int:
+    pool = counting_pool(lambda query, *args: [list_row(i) for i in range(list_count)])
+    service = UserService(pool, list_service=None)
+    lists = asyncio.run(service.get_user_lists(user_id=1))
+    assert len(lists) == list_count
+    return pool.count
+
+
+def test_get_user_lists_query_count_is_constant(counting_pool):
+    assert count_queries(counting_pool, 1) == count_queries(counting_pool, 200) == 1
@@ -0,0 +1,96 @@
+from datetime import datetime
+import asyncio
+
+import pytest
+
+from app.services.users import UserNotFoundError, UserService
+from app.utils.pagination import InvalidCursorError, encode_cursor
+
+
+def test_get_user_by_id_raises_not_found_without_creating_stats(counting_pool):
+    def rows(query, *args):
+        if "FROM users u" in query:
+            return []
+        return [
+            {
+                "has_stats": False,
+                "diamonds": None,
+                "current_streak": None,
+                "average_accuracy": None,
+                "last_active": None,
+                "words_mastered": 0,
+                "words_practiced_today": 0,
+                "practice_time_today": 0,
+                "daily_word_goal": None,
+                "daily_practice_time_goal": None,
+            }
+        ]
+
+    pool = counting_pool(rows)
+    service = UserService(pool, list_service=None)
+
+    with pytest.raises(UserNotFoundError):
+        asyncio.run(service.get_user_by_id(404))
+    assert not any("INSERT" in query for query in pool.queries)
+
+
+def progress_row(word_id: int) -> dict:
+    return {
+        "recognition_mastery_score": 3,
+        "usage_mastery_score": 1,
+        "practice_count": 4,
+        "success_count": 3,
+        "number_of_times_to_practice": 5,
+        "wp_created_at": datetime(2025, 1, 1),
+        "wp_updated_at": datetime(2025, 1, 2, 12, 0, word_id),
+        "id": word_id,
+        "word": f"word{word_id}",
+        "definition": "A word.",
+        "part_of_speech": "noun",
+        "difficulty_level": "beginner",
+        "etymology": None,
+        "usage_notes": None,
+        "audio_url": None,
+        "image_url": None,
+        "examples": [],
+        "synonyms": [],
+        "antonyms": [],
+        "tags": [],
+        "w_created_at": datetime(2025, 1, 1),
+        "w_updated_at": datetime(2025, 1, 1),
+    }
+
+
+def test_word_progress_pages_use_separate_first_and_next_statements(counting_pool):
+    pool = counting_pool(lambda query, *args: [progress_row(i) for i in (3, 2, 1)])
+    service = UserService(pool, list_service=None)
+
+    first = asyncio.run(service.get_word_progress_after(1, per_page=2))
+    asyncio.run(
+        service.get_word_progress_after(
+            1, cursor=first.page_info.next_cursor, per_page=2
+        )
+    )
+
+    first_query, next_query = pool.queries
+    assert "IS NULL" not in first_query and "<" not in first_query
+    assert "(wp.updated_at, wp.word_id) < ($2::timestamp, $3::int)" in next_query
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["2025-01-02 12:00:02", "2"],
+        ["2025-01-02 12:00:02", 2**40],
+        ["2025-01-02T12:00:02+02:00", 2],
+        ["yesterday", 2],
+        [None, 2],
+    ],
+)
+def test_word_progress_rejects_malformed_cursor_values(counting_pool, values):
+    pool = counting_pool(lambda query, *args: [])
+    service = UserService(pool, list_service=None)
+
+    with pytest.raises(InvalidCursorError):
+        asyncio.run(service.get_word_progress_after(1, cursor=encode_cursor(values)))
+    assert pool.count == 0
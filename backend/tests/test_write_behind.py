@@ -0,0 +1,68 @@
+import asyncio
+
+from app.services.write_behind import WriteBehindBuffer
+
+
+def failing_pool(counting_pool, failures):
+    """A pool whose first ``failures`` flushes raise."""
+    pool = counting_pool(lambda query, *args: [])
+    flushed = []
+
+    async def execute(query, *args):
+        pool.queries.append(query)
+        if len(pool.queries) <= failures:
+            raise ConnectionError("connection lost")
+        flushed.append(args)
+        return "OK"
+
+    pool.execute = execute
+    return pool, flushed
+
+
+def test_failing_batch_is_dropped_after_max_attempts(counting_pool):
+    pool, flushed = failing_pool(counting_pool, failures=3)
+    buffer = WriteBehindBuffer("buffered", flush_interval=60, max_pending=100, max_attempts=3)
+    buffer._pool = pool
+
+    async def run():
+        await buffer.add_diamonds(1, 10)
+        await buffer.add_practice_session(1, 5, "quiz")
+        for _ in range(3):
+            await buffer.flush()
+        dropped_pending = buffer.pending
+
+        # The next write is not held back by the dropped batch
+        await buffer.add_diamonds(2, 4)
+        await buffer.flush()
+        return dropped_pending
+
+    assert asyncio.run(run()) == 0
+    assert buffer.flush_failures == 3
+    assert buffer.stats()["dropped_batches"] == 1
+    assert buffer.stats()["dropped_sessions"] == 1
+    assert buffer.stats()["dropped_diamonds"] == 10
+    assert buffer.pending == 0
+    assert len(flushed) == 1
+    assert flushed[0][4:] == ([2], [4], [0])
+
+
+def test_failed_batch_is_retried_apart_from_newer_writes(counting_pool):
+    pool, flushed = failing_pool(counting_pool, failures=1)
+    buffer = WriteBehindBuffer("buffered", flush_interval=60, max_pending=100, max_attempts=3)
+    buffer._pool = pool
+
+    async def run():
+        await buffer.add_diamonds(1, 10)
+        await buffer.flush()
+        retrying = buffer.stats()["retrying_batches"]
+        pending_diamonds = buffer.pending_diamonds(1)
+
+        await buffer.add_diamonds(1, 5)
+        await buffer.flush()
+        return retrying, pending_diamonds
+
+    # Diamonds still waiting for a retry are counted as the user's
+    assert asyncio.run(run()) == (1, 10)
+    assert buffer.stats()["retrying_batches"] == 0
+    assert buffer.dropped_batches == 0
+    assert [args[5] for args in flushed] == [[10], [5]]